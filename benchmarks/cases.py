@@ -0,0 +1,154 @@
+"""Benchmark cases.
+
+Every case prepares its data and returns a function to measure, so
+preparation is not measured. Random data is generated with fixed seed.
+
+"""
+from __future__ import annotations
+
+import random
+from typing import Callable
+
+from chess.batch import evaluate_batch, to_codes
+from chess.board import ChessBoard
+from chess.chessman import Chessman
+from chess.side import White
+from chess.type import Pawn, Rook
+
+SEED = 42
+GAME_FEN = 'r6r/pppppppp/8/8/8/8/PPPPPPPP/R6R w - - 0 1'
+GAME_PLIES = 60
+
+Case = Callable[[], Callable[[], object]]
+CASES: dict[str, Case] = {}
+
+
+def case(function: Case) -> Case:
+    """Register benchmark case."""
+    CASES[function.__name__] = function
+    return function
+
+
+def _place(
+    board: ChessBoard,
+    row: int,
+    col: int,
+    type: type,
+    side: type = White,
+) -> Chessman:
+    chessman = Chessman(chessman_type=type, side=side, chess_board=board)
+    board.state[row][col].chessman = chessman
+    return chessman
+
+
+@case
+def board_construction() -> Callable[[], object]:
+    return ChessBoard
+
+
+@case
+def move_figure_pawn() -> Callable[[], object]:
+    """Move pawn forward and put it back."""
+    board = ChessBoard()
+    pawn = _place(board, 6, 4, Pawn)
+    old_field, new_field = board.state[6][4], board.state[5][4]
+
+    def run():
+        board.move_figure(pawn, new_field)
+        pawn.go_to_position(old_field)
+    return run
+
+
+@case
+def move_figure_rook() -> Callable[[], object]:
+    """Move rook from one side of the row to another and back."""
+    board = ChessBoard()
+    rook = _place(board, 7, 0, Rook)
+    left_field, right_field = board.state[7][0], board.state[7][7]
+
+    def run():
+        board.move_figure(rook, right_field)
+        board.move_figure(rook, left_field)
+    return run
+
+
+@case
+def get_figure_position() -> Callable[[], object]:
+    board = ChessBoard.from_fen(GAME_FEN)
+    chessmans = list(board.get_figures())
+
+    def run():
+        for chessman in chessmans:
+            board.get_figure_position(chessman)
+    return run
+
+
+def _rook_path(is_blocked: bool) -> Callable[[], object]:
+    board = ChessBoard()
+    rook = _place(board, 7, 0, Rook)
+    if is_blocked:
+        _place(board, 7, 6, Pawn)
+    field = board.state[7][7]
+
+    def run():
+        return board.is_valid_move(rook, field)
+    return run
+
+
+@case
+def rook_open_path() -> Callable[[], object]:
+    return _rook_path(is_blocked=False)
+
+
+@case
+def rook_blocked_path() -> Callable[[], object]:
+    return _rook_path(is_blocked=True)
+
+
+def generate_game(seed: int = SEED) -> list[tuple[int, int]]:
+    """Get moves (from square, to square) of random game from GAME_FEN."""
+    board = ChessBoard.from_fen(GAME_FEN)
+    moves_random = random.Random(seed)
+    game = []
+    for _ in range(GAME_PLIES):
+        moves = [move for move in board.legal_moves() if not move.promotion]
+        if not moves:
+            break
+        move = moves_random.choice(moves)
+        game.append((move.chessman.get_position().square, move.field.square))
+        board.push(move)
+    return game
+
+
+@case
+def game_replay() -> Callable[[], object]:
+    """Replay random game by `move_figure` on a new board."""
+    game = generate_game()
+
+    def run():
+        board = ChessBoard.from_fen(GAME_FEN)
+        for old_square, new_square in game:
+            board.move_figure(
+                board.get_field(old_square).chessman,
+                board.get_field(new_square),
+            )
+    return run
+
+
+@case
+def batch_evaluation() -> Callable[[], object]:
+    """Evaluate positions of random game at once."""
+    board = ChessBoard.from_fen(GAME_FEN)
+    boards = [board]
+    for old_square, new_square in generate_game():
+        board = ChessBoard.from_fen(board.to_fen())
+        board.move_figure(
+            board.get_field(old_square).chessman,
+            board.get_field(new_square),
+        )
+        boards.append(board)
+    codes = to_codes(boards)
+
+    def run():
+        evaluate_batch(codes)
+    return run
@@ -0,0 +1,114 @@
+"""Run benchmarks and compare results with baseline.
+
+Usage:
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --baseline baseline.json --threshold 0.1
+
+Exit code is 1 if any benchmark is slower than baseline by more than
+threshold.
+
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from typing import NamedTuple, Optional
+
+from .cases import CASES
+
+
+class Regression(NamedTuple):
+    """Benchmark slower than baseline."""
+    name: str
+    baseline_ns: float
+    result_ns: float
+
+    @property
+    def ratio(self) -> float:
+        return self.result_ns / self.baseline_ns
+
+
+def run_case(name: str, repeat: int = 5, min_time: float = 0.2) -> float:
+    """Get the best time of one run of benchmark in nanoseconds."""
+    timer = timeit.Timer(CASES[name]())
+    number, _ = timer.autorange()
+    number = max(number, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def run(
+    names: Optional[list[str]] = None,
+    repeat: int = 5,
+    min_time: float = 0.2,
+) -> dict:
+    """Run benchmarks and get results ready for JSON."""
+    return {
+        'python': platform.python_version(),
+        'benchmarks': {
+            name: {'ns': run_case(name, repeat, min_time)}
+            for name in names or CASES
+        },
+    }
+
+
+def compare(
+    results: dict,
+    baseline: dict,
+    threshold: float = 0.1,
+) -> list[Regression]:
+    """Get benchmarks slower than baseline by more than threshold.
+
+    Benchmarks which are missing in baseline are skipped.
+
+    """
+    regressions = []
+    for name, result in results['benchmarks'].items():
+        if name not in baseline['benchmarks']:
+            continue
+        baseline_ns = baseline['benchmarks'][name]['ns']
+        if result['ns'] > baseline_ns * (1 + threshold):
+            regressions.append(Regression(name, baseline_ns, result['ns']))
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run benchmarks and compare them with baseline."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('names', nargs='*', help='benchmarks to run')
+    parser.add_argument('--output', help='file to save results')
+    parser.add_argument('--baseline', help='file of results to compare')
+    parser.add_argument('--threshold', type=float, default=0.1)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2)
+    args = parser.parse_args(argv)
+    unknown_names = set(args.names) - set(CASES)
+    if unknown_names:
+        parser.error(f'unknown benchmarks: {", ".join(unknown_names)}')
+
+    results = run(args.names, args.repeat, args.min_time)
+    for name, result in results['benchmarks'].items():
+        print(f'{name:<24} {result["ns"]:>14,.0f} ns')
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(
+            f'{regression.name} is slower than baseline: '
+            f'{regression.baseline_ns:,.0f} ns -> '
+            f'{regression.result_ns:,.0f} ns ({regression.ratio:.2f}x)',
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
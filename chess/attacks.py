@@ -0,0 +1,115 @@
+"""Attack maps of the board.
+
+`AttackMap` keeps a mask of squares attacked by every figure and a number
+of attackers of every square by side. When occupancy of a square changes,
+only figures which attack the square are recalculated, because other
+figures can't see the change.
+
+"""
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Iterator, Optional, Type
+
+from .side import Black, Side, White
+
+if TYPE_CHECKING:
+    from .chessman import Chessman
+    from .field import ChessField
+
+SIDE_OFFSETS = {White: 0, Black: 64}
+
+
+def iter_squares(mask: int) -> Iterator[int]:
+    """Iterate over squares of mask from the lowest one."""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+
+class AttackMap:
+    """Squares attacked by figures, updated on every change of the board.
+
+    Attributes:
+        occupied: a mask of busy squares.
+        squares: squares of figures.
+        attacks: masks of squares attacked by figures.
+        counts: a number of attackers of every square, squares of White
+            are followed by squares of Black (see `SIDE_OFFSETS`).
+
+    """
+    __slots__ = ('occupied', 'squares', 'attacks', 'counts')
+
+    def __init__(self, positions: dict[Chessman, ChessField]):
+        """Build attack maps of figures on their positions."""
+        self.occupied = 0
+        self.squares: dict[Chessman, int] = {}
+        self.attacks: dict[Chessman, int] = {}
+        self.counts = array('B', bytes(128))
+        for chessman, field in positions.items():
+            self.occupied |= 1 << field.square
+            self.squares[chessman] = field.square
+        for chessman in self.squares:
+            self._set_attacks(chessman, self._get_attacks(chessman))
+
+    def add(self, chessman: Chessman, square: int):
+        """Add figure placed on the square."""
+        self.occupied |= 1 << square
+        self.squares[chessman] = square
+        self._refresh(square)
+        self._set_attacks(chessman, self._get_attacks(chessman))
+
+    def remove(self, chessman: Chessman):
+        """Remove figure from its square."""
+        square = self.squares.pop(chessman)
+        self.occupied &= ~(1 << square)
+        self._set_attacks(chessman, 0)
+        del self.attacks[chessman]
+        self._refresh(square)
+
+    def update_type(self, chessman: Chessman):
+        """Recalculate attacks of figure which changed its type."""
+        if chessman in self.squares:
+            self._set_attacks(chessman, self._get_attacks(chessman))
+
+    def is_attacked(self, square: int, side: Type[Side]) -> bool:
+        """Get if figures of side attack the square."""
+        return self.counts[SIDE_OFFSETS[side] + square] > 0
+
+    def attackers_of(
+        self,
+        square: int,
+        side: Optional[Type[Side]] = None,
+    ) -> list[Chessman]:
+        """Get figures attacking the square, can be filtered by side."""
+        return [
+            chessman
+            for chessman, attacks in self.attacks.items()
+            if attacks >> square & 1
+            and (side is None or chessman.side is side)
+        ]
+
+    def _get_attacks(self, chessman: Chessman) -> int:
+        return chessman.type.get_attacks(
+            chessman.side,
+            self.squares[chessman],
+            self.occupied,
+        )
+
+    def _refresh(self, square: int):
+        """Recalculate figures attacking square which occupancy changed."""
+        bit = 1 << square
+        for chessman, attacks in list(self.attacks.items()):
+            if attacks & bit:
+                self._set_attacks(chessman, self._get_attacks(chessman))
+
+    def _set_attacks(self, chessman: Chessman, attacks: int):
+        """Replace attacks of figure and update counts of attackers."""
+        old_attacks = self.attacks.get(chessman, 0)
+        self.attacks[chessman] = attacks
+        offset = SIDE_OFFSETS[chessman.side]
+        for square in iter_squares(old_attacks & ~attacks):
+            self.counts[offset + square] -= 1
+        for square in iter_squares(attacks & ~old_attacks):
+            self.counts[offset + square] += 1
@@ -0,0 +1,191 @@
+"""Batch evaluation of many positions.
+
+Positions are given as N×64 array of figure codes (see
+`chess.packed.FIGURE_CODES`, 0 is an empty square) made by `to_codes`.
+For every position and side (White first) it gets:
+    material - material value of figures
+    mobility - a number of moves of figures (`ChessBoard.legal_moves`)
+    attacks - a number of squares attacked by figures
+
+Features are computed by vectorized NumPy operations if NumPy is
+installed, otherwise by pure Python. Pawn is considered to make its first
+move if it stays on its start row.
+
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional, Sequence
+
+from .board import ChessBoard
+from .packed import FIGURE_CODES, FIGURES
+from .side import Black, White
+from .tables import RAYS, STRAIGHT_DIRECTIONS
+from .type import Pawn, Rook
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# rows of positions processed at once, small enough to stay in cache
+DEFAULT_BATCH_SIZE = 1024
+FEATURES = ('material', 'mobility', 'attacks')
+SIDES = (White, Black)
+# row step of pawn move and start row by side
+PAWN_DIRECTIONS = {White: (-1, 6), Black: (1, 1)}
+
+
+def to_codes(boards: Iterable[ChessBoard]) -> Any:
+    """Get N×64 int8 array of figure codes of boards.
+
+    Returns list of bytearrays if NumPy is not installed.
+
+    """
+    rows = []
+    for board in boards:
+        row = bytearray(64)
+        for chessman in board.get_figures():
+            row[board.get_figure_position(chessman).square] = FIGURE_CODES[
+                (chessman.type.__class__, chessman.side)
+            ]
+        rows.append(row)
+    if np is None:
+        return rows
+    if not rows:
+        return np.zeros((0, 64), dtype=np.int8)
+    return np.frombuffer(b''.join(rows), dtype=np.int8).reshape(-1, 64)
+
+
+def evaluate_batch(
+    codes: Any,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    use_numpy: Optional[bool] = None,
+) -> dict[str, Any]:
+    """Get features of positions.
+
+    Returns:
+        Feature name -> N×2 array (list of pairs without NumPy) of values
+        for White and Black.
+
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    if not use_numpy:
+        return _evaluate_python(codes)
+
+    codes = np.asarray(codes, dtype=np.int8).reshape(-1, 64)
+    chunks = [
+        _evaluate_numpy(codes[start:start + batch_size])
+        for start in range(0, len(codes), batch_size)
+    ]
+    if not chunks:
+        return {name: np.zeros((0, 2), dtype=np.int32) for name in FEATURES}
+    return {
+        name: np.concatenate([chunk[name] for chunk in chunks])
+        for name in FEATURES
+    }
+
+
+def _shift(array: Any, row_step: int, col_step: int) -> Any:
+    """Move values of N×8×8 array by rows and cols, filling with zeros."""
+    result = np.zeros_like(array)
+    rows_from = slice(max(-row_step, 0), 8 - max(row_step, 0))
+    rows_to = slice(max(row_step, 0), 8 - max(-row_step, 0))
+    cols_from = slice(max(-col_step, 0), 8 - max(col_step, 0))
+    cols_to = slice(max(col_step, 0), 8 - max(-col_step, 0))
+    result[:, rows_to, cols_to] = array[:, rows_from, cols_from]
+    return result
+
+
+def _evaluate_numpy(codes: Any) -> dict[str, Any]:
+    """Get features of batch of positions by NumPy."""
+    board = codes.reshape(-1, 8, 8)
+    empty = (board == 0).view(np.int8)
+    values = np.zeros(16, dtype=np.int32)
+    for (type, _), code in FIGURE_CODES.items():
+        values[code] = type.VALUE
+
+    features = {
+        name: np.zeros((len(codes), 2), dtype=np.int32) for name in FEATURES
+    }
+    for side_index, side in enumerate(SIDES):
+        own = ((board != 0) & (board >> 3 == side_index)).view(np.int8)
+        enemy = 1 - own - empty
+        pawns = (board == FIGURE_CODES[(Pawn, side)]).view(np.int8)
+        rooks = (board == FIGURE_CODES[(Rook, side)]).view(np.int8)
+        # a number of attacks and moves to every square
+        attacked = np.zeros_like(own)
+        moves = np.zeros_like(own)
+
+        row_step, start_row = PAWN_DIRECTIONS[side]
+        for col_step in (-1, 1):
+            attacked += _shift(pawns, row_step, col_step)
+        moves += attacked * enemy
+        pushes = _shift(pawns, row_step, 0) * empty
+        moves += pushes
+        pushes[:, :start_row + row_step] = 0
+        pushes[:, start_row + row_step + 1:] = 0
+        moves += _shift(pushes, row_step, 0) * empty
+
+        for row_step, col_step in STRAIGHT_DIRECTIONS:
+            ray = rooks
+            for _ in range(7):
+                ray = _shift(ray, row_step, col_step)
+                attacked += ray
+                moves += ray * (1 - own)
+                ray = ray * empty
+                if not ray.any():
+                    break
+
+        features['material'][:, side_index] = (
+            values[board] * own
+        ).sum(axis=(1, 2))
+        features['mobility'][:, side_index] = moves.sum(
+            axis=(1, 2), dtype=np.int32,
+        )
+        features['attacks'][:, side_index] = (attacked > 0).sum(axis=(1, 2))
+    return features
+
+
+def _evaluate_python(codes: Sequence[Sequence[int]]) -> dict[str, Any]:
+    """Get features of positions by pure Python."""
+    features: dict[str, Any] = {name: [] for name in FEATURES}
+    for row in codes:
+        material, mobility, attacks = [0, 0], [0, 0], [set(), set()]
+        for square, code in enumerate(row):
+            if not code:
+                continue
+            type, side = FIGURES[code]
+            side_index = SIDES.index(side)
+            material[side_index] += type.VALUE
+            if type is Rook:
+                for direction in STRAIGHT_DIRECTIONS:
+                    for target in RAYS[direction][square]:
+                        attacks[side_index].add(target)
+                        if not row[target] or row[target] >> 3 != side_index:
+                            mobility[side_index] += 1
+                        if row[target]:
+                            break
+                continue
+
+            row_step, start_row = PAWN_DIRECTIONS[side]
+            pawn_row, pawn_col = divmod(square, 8)
+            target_row = pawn_row + row_step
+            if not 0 <= target_row < 8:
+                continue
+            for target_col in (pawn_col - 1, pawn_col + 1):
+                if 0 <= target_col < 8:
+                    target = target_row * 8 + target_col
+                    attacks[side_index].add(target)
+                    if row[target] and row[target] >> 3 != side_index:
+                        mobility[side_index] += 1
+            target = target_row * 8 + pawn_col
+            if not row[target]:
+                mobility[side_index] += 1
+                target += row_step * 8
+                if pawn_row == start_row and not row[target]:
+                    mobility[side_index] += 1
+        features['material'].append(tuple(material))
+        features['mobility'].append(tuple(mobility))
+        features['attacks'].append(tuple(map(len, attacks)))
+    return features
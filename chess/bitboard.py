@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import Type
+
+from .board import ChessBoard
+from .chessman import Chessman
+from .field import ChessField
+from .interfaces import AbstractChessmanType
+from .side import Side
+from .tables import BETWEEN_MASKS
+
+FULL_BOARD = (1 << 64) - 1
+
+
+class Bitboards:
+    """Occupancy of the board stored as 64-bit integers.
+
+    Bit `n` is set if square `n` (see `ChessField.square`) is busy.
+
+    """
+    def __init__(self):
+        self.occupied = 0
+        self.sides: dict[Type[Side], int] = {}
+        self.types: dict[Type[AbstractChessmanType], int] = {}
+
+    def add(
+        self,
+        square: int,
+        side: Type[Side],
+        type: Type[AbstractChessmanType],
+    ):
+        """Set square as busy by figure."""
+        mask = 1 << square
+        self.occupied |= mask
+        self.sides[side] = self.sides.get(side, 0) | mask
+        self.types[type] = self.types.get(type, 0) | mask
+
+    def remove(
+        self,
+        square: int,
+        side: Type[Side],
+        type: Type[AbstractChessmanType],
+    ):
+        """Set square as free."""
+        mask = FULL_BOARD ^ (1 << square)
+        self.occupied &= mask
+        self.sides[side] &= mask
+        self.types[type] &= mask
+
+    def get_figures(
+        self,
+        side: Type[Side],
+        type: Type[AbstractChessmanType],
+    ) -> int:
+        """Get occupancy of figures with given side and type."""
+        return self.sides.get(side, 0) & self.types.get(type, 0)
+
+
+class BitboardChessBoard(ChessBoard):
+    """Chess board which answers occupancy queries by bitboards.
+
+    Behaves like `ChessBoard`, but fields occupancy, path checks and
+    capture detection are integer operations.
+
+    """
+    __slots__ = ('bitboards',)
+
+    def __init__(self):
+        """Init state and bitboards."""
+        self.bitboards = Bitboards()
+        super().__init__()
+
+    def is_busy(self, field: ChessField) -> bool:
+        """Get if the field is busy or not."""
+        return bool(self.bitboards.occupied >> field.square & 1)
+
+    def is_same_side(self, chessman: Chessman, field: ChessField) -> bool:
+        """Get if the field is busy by a figure of chessman side."""
+        side_occupancy = self.bitboards.sides.get(chessman.side, 0)
+        return bool(side_occupancy >> field.square & 1)
+
+    def get_blockers(
+        self,
+        old_field: ChessField,
+        new_field: ChessField,
+    ) -> int:
+        """Get mask of busy fields between two fields."""
+        mask = BETWEEN_MASKS[old_field.square * 64 + new_field.square]
+        return self.bitboards.occupied & mask
+
+    def _index_add(self, chessman: Chessman, field: ChessField):
+        """Add chessman to the indexes and bitboards."""
+        super()._index_add(chessman, field)
+        self.bitboards.add(
+            field.square,
+            chessman.side,
+            chessman.type.__class__,
+        )
+
+    def _index_remove(self, chessman: Chessman):
+        """Remove chessman from the indexes and bitboards."""
+        self.bitboards.remove(
+            self.get_figure_position(chessman).square,
+            chessman.side,
+            chessman.type.__class__,
+        )
+        super()._index_remove(chessman)
+
+    def _update_type(
+        self,
+        chessman: Chessman,
+        old_type: AbstractChessmanType,
+    ):
+        """Move chessman to the bitboard of its new type."""
+        super()._update_type(chessman, old_type)
+        if chessman not in self._positions:
+            return
+        square = self._positions[chessman].square
+        self.bitboards.remove(square, chessman.side, old_type.__class__)
+        self.bitboards.add(square, chessman.side, chessman.type.__class__)
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
-from typing import Type
+from typing import Iterable, Iterator, Optional, Type, Union
 
+from . import validation
+from .attacks import AttackMap
 from .chessman import Chessman
 from .exceptions import (
+    BadCoordinatesException,
     BadMoveException,
     CaptureException,
     FigureIsCapturedException
 )
 from .field import ChessField
 from .interfaces import AbstractChessmanType
+from .move import Move, MoveRecord, MoveResult
+from .side import Black, Side, White, get_opposite_side
+from .tables import BETWEEN_SQUARES, SQUARES_BY_NAME
+from .zobrist import TURN_KEY, get_chessman_key
 
 
 class ChessBoard:
@@ -17,16 +24,62 @@ class ChessBoard:
 
     Board can operates by chessmans.
 
+    Board keeps a reverse index of chessmans (chessman -> field and
+    side/type -> chessmans), so position lookups don't scan the `state`.
+    Fields of the board report every change of their chessman to the board.
+
     """
+    __slots__ = (
+        'turn',
+        'zobrist_key',
+        '_white_material',
+        '_black_material',
+        '_white_positional',
+        '_black_positional',
+        '_stack',
+        '_attack_map',
+        '_positions',
+        '_keys',
+        '_figures',
+        'squares',
+    )
+
     def __init__(self):
-        """Init state."""
-        self.state = [
-            [
-                ChessField(row=row, col=col)
-                for col in ChessField.cols
-            ]
+        """Init state.
+
+        `turn` is a side to move for `legal_moves`, `push` and `pop`.
+        `zobrist_key` is a key of the position updated on every change.
+        `material` and `positional` are scores of sides in centipawns
+        updated on every change, see `evaluate`.
+        Attack maps are built on the first attack query and updated on
+        every change after it, see `is_attacked`.
+
+        """
+        self.turn: Type[Side] = White
+        self.zobrist_key = 0
+        self._white_material = self._black_material = 0
+        self._white_positional = self._black_positional = 0
+        self._stack: list[MoveRecord] = []
+        self._attack_map: Optional[AttackMap] = None
+        self._positions: dict[Chessman, ChessField] = {}
+        self._keys: dict[Chessman, int] = {}
+        self._figures: dict[
+            tuple[Type[Side], Type[AbstractChessmanType]],
+            dict[Chessman, None],
+        ] = {}
+        # fields by square index, see `state` for fields by rows
+        self.squares = tuple(
+            ChessField(row=row, col=col, board=self)
             for row in ChessField.rows
-        ]
+            for col in ChessField.cols
+        )
+
+    @property
+    def state(self) -> tuple[tuple[ChessField, ...], ...]:
+        """Get fields by rows from the 8th one, made of `squares`."""
+        return tuple(
+            self.squares[square:square + 8] for square in range(0, 64, 8)
+        )
 
     @classmethod
     def initialize_game(cls) -> ChessBoard:
@@ -37,73 +90,482 @@ class ChessBoard:
         """
         return NotImplemented
 
-    def _validate_chessman(self, chessman: Chessman):
-        """Check chessman status.
+    @classmethod
+    def from_fen(cls, fen: str) -> ChessBoard:
+        """Create board from FEN.
 
         Raises:
-            FigureIsCapturedException if chessman was captured.
+            FENException if FEN is wrong.
 
         """
-        if not chessman.status:
-            raise FigureIsCapturedException(f'{chessman}')
+        from .fen import from_fen
+        return from_fen(fen, board_class=cls)
 
-    def _validate_move(self, chessman: Chessman, field: ChessField):
-        """Validate chessman move.
+    def to_fen(self) -> str:
+        """Get FEN of the board."""
+        from .fen import to_fen
+        return to_fen(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> ChessBoard:
+        """Create board from packed position, see `chess.packed`.
 
         Raises:
-            BadMoveException if chessmen try to move on the wrong field or
-            performs wrong capture.
+            PackedPositionException if position is wrong.
 
         """
+        from .packed import decode
+        return decode(data, board_class=cls)
+
+    def to_bytes(self) -> bytes:
+        """Get packed position of the board, see `chess.packed`."""
+        from .packed import encode
+        return encode(self)
+
+    def try_move(
+        self,
+        chessman: Chessman,
+        field: ChessField,
+        promotion: Optional[Type[AbstractChessmanType]] = None,
+    ) -> MoveResult:
+        """Move figure to field if the move is valid.
+
+        Doesn't raise on wrong moves, returns result code instead. Figure
+        is exchanged into promotion type, which is required for a pawn
+        reaching the last row and not allowed otherwise.
+
+        """
+        if not chessman.status or chessman not in self._positions:
+            return MoveResult.CAPTURED_PIECE
+        if not validation.is_valid_promotion(
+            chessman.type,
+            field.square,
+            promotion,
+        ):
+            return MoveResult.BAD_MOVE
         is_valid = chessman.type.is_valid_move(
-            old_field=chessman.get_position(),
+            old_field=self._positions[chessman],
             new_field=field,
-            is_capture=bool(field.chessman),
+            is_capture=self.is_busy(field),
             board=self,
+            first_move=chessman.first_move,
         )
         if not is_valid:
-            raise BadMoveException(
-                f'{chessman} move to {field} is not possible.',
-            )
+            return MoveResult.BAD_MOVE
+        if self.is_same_side(chessman, field):
+            return MoveResult.SAME_SIDE_CAPTURE
+
+        self._commit_move(chessman, field)
+        if promotion is not None:
+            chessman.change_type(promotion)
+        return MoveResult.OK
+
+    def apply_moves(
+        self,
+        moves: Iterable[Move],
+        stop_on_error: bool = False,
+    ) -> list[MoveResult]:
+        """Apply moves one by one.
+
+        Moves can be given as (chessman, field) pairs without promotion,
+        malformed moves get `BAD_MOVE`.
+
+        Returns:
+            Result codes of moves. If `stop_on_error` is set, moves after
+            the first wrong move are not applied and have no result.
+
+        """
+        results = []
+        for move in moves:
+            try:
+                chessman, field, promotion = Move(*move)
+            except TypeError:
+                result = MoveResult.BAD_MOVE
+            else:
+                result = self.try_move(chessman, field, promotion)
+            results.append(result)
+            if stop_on_error and result is not MoveResult.OK:
+                break
+        return results
 
-    def move_figure(self, chessman: Chessman, field: ChessField):
+    def move_figure(
+        self,
+        chessman: Chessman,
+        field: ChessField,
+        promotion: Optional[Type[AbstractChessmanType]] = None,
+    ):
         """Move figure to field.
 
-        Run chessman validation and set up new position.
+        Run chessman validation and set up new position. Figure is
+        exchanged into promotion type if it's provided.
 
         Raises:
+            FigureIsCapturedException if chessman was captured.
+            BadMoveException if chessmen try to move on the wrong field,
+            performs wrong capture or promotion is wrong.
             CaptureException if chessman tries to capture a figure with the
             same side.
 
         """
-        self._validate_chessman(chessman)
-        self._validate_move(chessman, field)
+        result = self.try_move(chessman, field, promotion)
+        if result is MoveResult.CAPTURED_PIECE:
+            raise FigureIsCapturedException(f'{chessman}')
+        if result is MoveResult.BAD_MOVE:
+            raise BadMoveException(
+                f'{chessman} move to {field} is not possible.',
+            )
+        if result is MoveResult.SAME_SIDE_CAPTURE:
+            raise CaptureException(
+                f'Figure {chessman} tries to capture a figure with'
+                f' the same side ({chessman.side})'
+            )
 
-        chessman.get_position().chessman = None
+    def _commit_move(self, chessman: Chessman, field: ChessField):
+        """Set up new position of validated move.
 
-        if field.chessman:
-            if chessman.side is field.chessman.side:
-                raise CaptureException(
-                    f'Figure {chessman} tries to capture a figure with'
-                    f' the same side ({chessman.side})'
-                )
+        Captures a figure on the field and marks that chessman did its
+        first move.
+
+        """
+        if field.chessman is not None:
             field.chessman.capture()
+        chessman.first_move = False
         field.chessman = chessman
 
+    def is_valid_move(
+        self,
+        chessman: Chessman,
+        field: ChessField,
+        promotion: Optional[Type[AbstractChessmanType]] = None,
+    ) -> bool:
+        """Get if chessman can move to field with promotion.
+
+        Unlike `move_figure`, doesn't raise and doesn't change the board.
+
+        """
+        return all([
+            chessman.status,
+            chessman in self._positions,
+            not self.is_same_side(chessman, field),
+            validation.is_valid_promotion(
+                chessman.type,
+                field.square,
+                promotion,
+            ),
+        ]) and chessman.type.is_valid_move(
+            old_field=self._positions[chessman],
+            new_field=field,
+            is_capture=self.is_busy(field),
+            board=self,
+            first_move=chessman.first_move,
+        )
+
+    def validate_moves(self, moves: Iterable[Move]) -> list[bool]:
+        """Validate candidate moves on the current position."""
+        return [
+            self.is_valid_move(*move) for move in moves
+        ]
+
     def exchange_pawn(
         self,
         pawn: Chessman,
         field: ChessField,
         type: Type[AbstractChessmanType],
     ) -> Chessman:
-        """Move pawn and change type."""
-        self.move_figure(pawn, field)
-        return pawn.change_type(type)
+        """Move pawn and change type.
+
+        Raises:
+            The same exceptions as `move_figure`.
+
+        """
+        self.move_figure(pawn, field, type)
+        return pawn
 
     def get_figure_position(self, chessman: Chessman) -> ChessField:
         """Get current position for figure."""
-        for rows in self.state:
-            for field in rows:
-                if field.chessman is chessman:
-                    return field
-        raise FigureIsCapturedException(f'{chessman} was captured')
+        try:
+            return self._positions[chessman]
+        except KeyError:
+            raise FigureIsCapturedException(f'{chessman} was captured')
+
+    def get_field(self, square: int) -> ChessField:
+        """Get field by its square index."""
+        return self.squares[square]
+
+    def __getitem__(self, key: Union[int, str]) -> ChessField:
+        """Get field by its square index or name, like `E4`.
+
+        Raises:
+            BadCoordinatesException if there is no such field.
+
+        """
+        if isinstance(key, str):
+            square = SQUARES_BY_NAME.get(key, -1)
+        else:
+            square = key
+        if not 0 <= square < 64:
+            raise BadCoordinatesException(f'There is no field {key!r}.')
+        return self.squares[square]
+
+    def get_row(self, row: int) -> tuple[ChessField, ...]:
+        """Get fields of row from the 8th one (row 0)."""
+        return self.squares[row * 8:row * 8 + 8]
+
+    def get_col(self, col: int) -> tuple[ChessField, ...]:
+        """Get fields of col from the 8th row."""
+        return self.squares[col::8]
+
+    def legal_moves(
+        self,
+        side: Optional[Type[Side]] = None,
+    ) -> Iterator[Move]:
+        """Iterate lazily over moves of all figures of the side.
+
+        Side to move is used by default.
+
+        """
+        for chessman in list(self.get_figures(side=side or self.turn)):
+            yield from chessman.legal_moves()
+
+    def perft(self, depth: int) -> int:
+        """Count leaf nodes of the moves tree with given depth."""
+        if depth == 0:
+            return 1
+        moves = list(self.legal_moves())
+        if depth == 1:
+            return len(moves)
+        nodes = 0
+        for move in moves:
+            self.push(move)
+            nodes += self.perft(depth - 1)
+            self.pop()
+        return nodes
+
+    def push(self, move: Move):
+        """Make move and pass turn to the opposite side.
+
+        Move is not validated, it's expected to be one of `legal_moves`.
+        Changes made by the move are saved to the stack, so the move can
+        be taken back with `pop`.
+
+        """
+        chessman, field, promotion = move
+        old_type = chessman.type
+        self._stack.append(MoveRecord(
+            move=move,
+            old_field=self._positions[chessman],
+            captured=field.chessman,
+            old_type=old_type,
+            first_move=chessman.first_move,
+        ))
+
+        self._commit_move(chessman, field)
+        if promotion is not None:
+            chessman.change_type(promotion)
+        self.pass_turn()
+
+    def pop(self) -> Move:
+        """Take back the last move made by `push`.
+
+        Raises:
+            IndexError if there are no moves to take back.
+
+        """
+        move, old_field, captured, old_type, first_move = self._stack.pop()
+        chessman, field, _ = move
+        if chessman.type is not old_type:
+            new_type, chessman.type = chessman.type, old_type
+            self._update_type(chessman, new_type)
+        chessman.first_move = first_move
+
+        old_field.chessman = chessman
+        if captured is not None:
+            field.chessman = captured
+            captured.status = True
+        self.pass_turn()
+        return move
+
+    def pass_turn(self):
+        """Pass turn to the opposite side."""
+        self.turn = get_opposite_side(self.turn)
+        self.zobrist_key ^= TURN_KEY
+
+    def set_turn(self, side: Type[Side]):
+        """Set side to move, the position key is updated."""
+        if side is not self.turn:
+            self.pass_turn()
+
+    def is_busy(self, field: ChessField) -> bool:
+        """Get if the field is busy or not."""
+        return field.is_busy
+
+    def is_same_side(self, chessman: Chessman, field: ChessField) -> bool:
+        """Get if the field is busy by a figure of chessman side."""
+        return field.is_busy and field.chessman.side is chessman.side
+
+    def get_blockers(
+        self,
+        old_field: ChessField,
+        new_field: ChessField,
+    ) -> int:
+        """Get mask of busy fields between two fields.
+
+        Fields must be on the same row, col or diagonal. The fields
+        themselves are not checked.
+
+        """
+        blockers = 0
+        between = BETWEEN_SQUARES[old_field.square * 64 + new_field.square]
+        for square in between:
+            if self.squares[square].is_busy:
+                blockers |= 1 << square
+        return blockers
+
+    def is_path_clear(
+        self,
+        old_field: ChessField,
+        new_field: ChessField,
+    ) -> bool:
+        """Get if all fields between two fields are free."""
+        return not self.get_blockers(old_field, new_field)
+
+    def is_attacked(self, square: int, side: Type[Side]) -> bool:
+        """Get if figures of side attack the square."""
+        return self._get_attack_map().is_attacked(square, side)
+
+    def attackers_of(
+        self,
+        square: int,
+        side: Optional[Type[Side]] = None,
+    ) -> list[Chessman]:
+        """Get chessmen attacking the square, can be filtered by side."""
+        return self._get_attack_map().attackers_of(square, side)
+
+    def _get_attack_map(self) -> AttackMap:
+        """Get attack maps, they are built on the first call."""
+        if self._attack_map is None:
+            self._attack_map = AttackMap(self._positions)
+        return self._attack_map
+
+    def get_figures(
+        self,
+        side: Optional[Type[Side]] = None,
+        type: Optional[Type[AbstractChessmanType]] = None,
+    ) -> Iterator[Chessman]:
+        """Iterate over chessmans on the board.
+
+        Chessmans can be filtered by side and type.
+
+        """
+        for (figures_side, figures_type), figures in self._figures.items():
+            if side is not None and figures_side is not side:
+                continue
+            if type is not None and figures_type is not type:
+                continue
+            yield from figures
+
+    def _index_add(self, chessman: Chessman, field: ChessField):
+        """Add chessman to the indexes."""
+        self._positions[chessman] = field
+        key = (chessman.side, chessman.type.__class__)
+        self._figures.setdefault(key, {})[chessman] = None
+        self._update_key(chessman, field)
+        self._update_scores(chessman.side, chessman.type, field.square, 1)
+        if self._attack_map is not None:
+            self._attack_map.add(chessman, field.square)
+
+    def _index_remove(self, chessman: Chessman):
+        """Remove chessman from the indexes."""
+        square = self._positions.pop(chessman).square
+        self._update_scores(chessman.side, chessman.type, square, -1)
+        key = (chessman.side, chessman.type.__class__)
+        del self._figures[key][chessman]
+        self.zobrist_key ^= self._keys.pop(chessman)
+        if self._attack_map is not None:
+            self._attack_map.remove(chessman)
+
+    def _update_key(self, chessman: Chessman, field: ChessField):
+        """Replace key of chessman in the position key.
+
+        Key which was added to the position key is saved, so it's removed
+        correctly even if the chessman state was changed in between.
+
+        """
+        key = get_chessman_key(chessman, field.square)
+        self.zobrist_key ^= self._keys.get(chessman, 0) ^ key
+        self._keys[chessman] = key
+
+    def _update_field(
+        self,
+        field: ChessField,
+        old_chessman: Optional[Chessman],
+        new_chessman: Optional[Chessman],
+    ):
+        """Keep indexes consistent with the field change.
+
+        A chessman can occupy only one field, so its previous field is
+        released when the chessman is placed somewhere else.
+
+        """
+        if (
+            old_chessman is not None
+            and self._positions.get(old_chessman) is field
+        ):
+            self._index_remove(old_chessman)
+        if new_chessman is not None:
+            previous_field = self._positions.get(new_chessman)
+            if previous_field is not None:
+                previous_field.chessman = None
+            self._index_add(new_chessman, field)
+
+    def _update_type(
+        self,
+        chessman: Chessman,
+        old_type: AbstractChessmanType,
+    ):
+        """Move chessman to the index of its new type."""
+        if chessman not in self._positions:
+            return
+        del self._figures[(chessman.side, old_type.__class__)][chessman]
+        key = (chessman.side, chessman.type.__class__)
+        self._figures.setdefault(key, {})[chessman] = None
+        field = self._positions[chessman]
+        self._update_key(chessman, field)
+        self._update_scores(chessman.side, old_type, field.square, -1)
+        self._update_scores(chessman.side, chessman.type, field.square, 1)
+        if self._attack_map is not None:
+            self._attack_map.update_type(chessman)
+
+    def _update_scores(
+        self,
+        side: Type[Side],
+        type: AbstractChessmanType,
+        square: int,
+        sign: int,
+    ):
+        """Add or subtract scores of figure on the square."""
+        if side is White:
+            self._white_material += sign * type.VALUE
+            self._white_positional += sign * type.SQUARE_VALUES[square]
+        else:
+            self._black_material += sign * type.VALUE
+            # mirror square by rows
+            self._black_positional += sign * type.SQUARE_VALUES[square ^ 56]
+
+    @property
+    def material(self) -> dict[Type[Side], int]:
+        """Get material scores of sides in centipawns."""
+        return {White: self._white_material, Black: self._black_material}
+
+    @property
+    def positional(self) -> dict[Type[Side], int]:
+        """Get piece-square scores of sides in centipawns."""
+        return {White: self._white_positional, Black: self._black_positional}
+
+    def evaluate(self) -> int:
+        """Get score of position for the side to move in centipawns."""
+        score = (
+            self._white_material + self._white_positional
+            - self._black_material - self._black_positional
+        )
+        return score if self.turn is White else -score
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Self, Type
+from typing import TYPE_CHECKING, Iterator, Self, Type
 
 from .exceptions import ChangeTypeException
 from .interfaces import AbstractChessman, AbstractChessmanType
@@ -9,10 +9,17 @@ from .side import Side
 if TYPE_CHECKING:
     from .board import ChessBoard
     from .field import ChessField
+    from .move import Move
 
 
 class Chessman(AbstractChessman):
-    """Implementation of AbstractChessman."""
+    """Implementation of AbstractChessman.
+
+    `first_move` is True until chessman makes its first move.
+
+    """
+    __slots__ = ('side', 'type', 'board', 'first_move')
+
     def __init__(
         self,
         chessman_type: Type[AbstractChessmanType],
@@ -22,17 +29,28 @@ class Chessman(AbstractChessman):
         super().__init__()
 
         self.side = side
-        self.type = chessman_type(side=side)
+        self.type = chessman_type.get_instance(side)
         self.board = chess_board
+        self.first_move = True
 
     def get_position(self) -> ChessField:
         """Get current position on the board."""
         return self.board.get_figure_position(chessman=self)
 
-    def go_to_position(self, chess_field):
-        """Accupate position on the board."""
+    def go_to_position(self, chess_field: ChessField):
+        """Accupate position on the board.
+
+        Previous position of the chessman is released by the board.
+
+        """
         chess_field.chessman = self
 
+    def legal_moves(self) -> Iterator[Move]:
+        """Iterate lazily over moves of the chessman."""
+        if not self.status:
+            return
+        yield from self.type.iter_moves(self, self.get_position(), self.board)
+
     def change_type(self, type: Type[AbstractChessmanType]) -> Self:
         """Change type for Pawn.
 
@@ -46,7 +64,8 @@ class Chessman(AbstractChessman):
             raise ChangeTypeException('Type changing is only allowed for Pawn')
         if type not in Pawn.EXCHANGE_TYPES:
             raise ChangeTypeException(f'{type} is not allowed for Pawn')
-        self.type = type(side=self.side)
+        old_type, self.type = self.type, type.get_instance(self.side)
+        self.board._update_type(self, old_type)
         return self
 
     def __str__(self) -> str:
@@ -0,0 +1,216 @@
+"""On-disk database of positions with attached payloads.
+
+File consists of:
+    header - magic, number of index slots and number of positions
+    index - open addressing table of (zobrist key, record offset) slots,
+            offset 0 marks an empty slot
+    records - packed position (see `chess.packed`), payload length and
+              payload, appended one by one
+
+Database is read through `mmap`, so lookup touches one or two pages of
+the index and one page of records.
+
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from typing import Iterator, Optional, Union
+
+from .board import ChessBoard
+from .exceptions import PositionDatabaseException
+from .packed import POSITION
+
+MAGIC = b'CHESSDB1'
+HEADER = struct.Struct('<8sQQ')
+SLOT = struct.Struct('<QQ')
+PAYLOAD_LENGTH = struct.Struct('<I')
+# part of busy slots when the index is full
+MAX_LOAD = 0.75
+
+Path = Union[str, os.PathLike]
+
+
+def _get_index_size(capacity: int) -> int:
+    return HEADER.size + capacity * SLOT.size
+
+
+def _is_power_of_two(number: int) -> bool:
+    return number > 0 and not number & (number - 1)
+
+
+def _read_header(file, path: Path) -> tuple[int, int]:
+    """Read capacity and number of positions from the start of file.
+
+    Raises:
+        PositionDatabaseException if file is not a database or its index
+        is truncated.
+
+    """
+    size = os.fstat(file.fileno()).st_size
+    if size < HEADER.size:
+        raise PositionDatabaseException(f'{path} is not a database.')
+    magic, capacity, count = HEADER.unpack(file.read(HEADER.size))
+    if magic != MAGIC or not _is_power_of_two(capacity):
+        raise PositionDatabaseException(f'{path} is not a database.')
+    if size < _get_index_size(capacity):
+        raise PositionDatabaseException(f'Index of {path} is truncated.')
+    return capacity, count
+
+
+class _IndexMixin:
+    """Lookup in the index mapped to memory."""
+    _map: mmap.mmap
+    capacity: int
+
+    def _find_slot(self, key: int, position: bytes) -> tuple[int, int]:
+        """Get slot of the position or the empty slot for it.
+
+        Returns:
+            Slot number and record offset, 0 if position is not found.
+
+        """
+        mask = self.capacity - 1
+        slot = key & mask
+        while True:
+            slot_key, offset = SLOT.unpack_from(
+                self._map,
+                HEADER.size + slot * SLOT.size,
+            )
+            if not offset:
+                return slot, 0
+            if slot_key == key and self._read_position(offset) == position:
+                return slot, offset
+            slot = (slot + 1) & mask
+
+    def _read_position(self, offset: int) -> bytes:
+        return self._map[offset:offset + POSITION.size]
+
+
+class PositionDatabaseWriter(_IndexMixin):
+    """Append-only writer of positions.
+
+    Payload of a position which is already in the database is replaced by
+    appending a new record.
+
+    """
+    def __init__(self, path: Path, capacity: int = 2 ** 20):
+        """Open database or create it with number of index slots.
+
+        Raises:
+            PositionDatabaseException if capacity is not a power of two or
+            file is not a database.
+
+        """
+        if not _is_power_of_two(capacity):
+            raise PositionDatabaseException(
+                f'Capacity {capacity} is not a power of two.',
+            )
+        if not os.path.exists(path):
+            with open(path, 'wb') as file:
+                file.write(HEADER.pack(MAGIC, capacity, 0))
+                file.truncate(_get_index_size(capacity))
+        self._file = open(path, 'r+b')
+        try:
+            self.capacity, self.count = _read_header(self._file, path)
+        except PositionDatabaseException:
+            self._file.close()
+            raise
+        # only the index is mapped, records are appended to the file
+        self._map = mmap.mmap(
+            self._file.fileno(),
+            _get_index_size(self.capacity),
+        )
+
+    def add(self, board: ChessBoard, payload: bytes = b''):
+        """Append position with payload.
+
+        Raises:
+            PositionDatabaseException if the index is full.
+
+        """
+        position = board.to_bytes()
+        slot, offset = self._find_slot(board.zobrist_key, position)
+        if not offset:
+            if self.count + 1 > self.capacity * MAX_LOAD:
+                raise PositionDatabaseException('Index is full.')
+            self.count += 1
+
+        record_offset = self._file.seek(0, os.SEEK_END)
+        self._file.write(position)
+        self._file.write(PAYLOAD_LENGTH.pack(len(payload)))
+        self._file.write(payload)
+        SLOT.pack_into(
+            self._map,
+            HEADER.size + slot * SLOT.size,
+            board.zobrist_key,
+            record_offset,
+        )
+
+    def _read_position(self, offset: int) -> bytes:
+        self._file.seek(offset)
+        return self._file.read(POSITION.size)
+
+    def close(self):
+        """Save header and close the file."""
+        HEADER.pack_into(self._map, 0, MAGIC, self.capacity, self.count)
+        self._map.flush()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> PositionDatabaseWriter:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class PositionDatabase(_IndexMixin):
+    """Read-only database of positions mapped to memory."""
+    def __init__(self, path: Path):
+        """Map database file.
+
+        Raises:
+            PositionDatabaseException if file is not a database.
+
+        """
+        with open(path, 'rb') as file:
+            self.capacity, self.count = _read_header(file, path)
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def get(self, board: ChessBoard) -> Optional[bytes]:
+        """Get payload of the position, None if there is no position."""
+        _, offset = self._find_slot(board.zobrist_key, board.to_bytes())
+        if not offset:
+            return None
+        offset += POSITION.size
+        (length,) = PAYLOAD_LENGTH.unpack_from(self._map, offset)
+        offset += PAYLOAD_LENGTH.size
+        return self._map[offset:offset + length]
+
+    def __contains__(self, board: ChessBoard) -> bool:
+        return self.get(board) is not None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[tuple[ChessBoard, bytes]]:
+        """Iterate over positions and payloads in the order of slots."""
+        for slot in range(self.capacity):
+            _, offset = SLOT.unpack_from(
+                self._map,
+                HEADER.size + slot * SLOT.size,
+            )
+            if offset:
+                board = ChessBoard.from_bytes(self._read_position(offset))
+                yield board, self.get(board)
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self) -> PositionDatabase:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
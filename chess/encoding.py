@@ -0,0 +1,149 @@
+"""Compact 16-bit encoding of moves.
+
+Code of move keeps:
+    bits 0-5 - a square to move from
+    bits 6-11 - a square to move in
+    bits 12-15 - a promotion, index in `PROMOTIONS`
+
+Codes don't refer to chessman objects, so sequences of moves are kept in
+`array('H')`, two bytes per move. Moves are converted to UCI notation
+(`a7a8r`) right from codes, SAN notation needs a board (see `chess.san`).
+
+"""
+from __future__ import annotations
+
+import re
+from array import array
+from typing import Iterable, Optional, Type
+
+from .board import ChessBoard
+from .exceptions import BadMoveException
+from .interfaces import AbstractChessmanType
+from .move import Move
+from .tables import SQUARE_NAMES, SQUARES_BY_NAME
+from .type import Rook
+
+PROMOTIONS = (None, Rook)
+PROMOTION_CODES = {
+    promotion: code for code, promotion in enumerate(PROMOTIONS)
+}
+UCI_PROMOTIONS = {Rook: 'r'}
+UCI_PROMOTION_TYPES = {
+    symbol: promotion for promotion, symbol in UCI_PROMOTIONS.items()
+}
+UCI_RE = re.compile(r'^([a-h][1-8])([a-h][1-8])([a-z]?)$')
+
+
+def encode_move(
+    old_square: int,
+    new_square: int,
+    promotion: Optional[Type[AbstractChessmanType]] = None,
+) -> int:
+    """Get code of move from old square to new square."""
+    return old_square | new_square << 6 | PROMOTION_CODES[promotion] << 12
+
+
+def decode_move(
+    code: int,
+) -> tuple[int, int, Optional[Type[AbstractChessmanType]]]:
+    """Get old square, new square and promotion of move code.
+
+    Raises:
+        BadMoveException if there is no such promotion.
+
+    """
+    if code >> 12 >= len(PROMOTIONS):
+        raise BadMoveException(f'Move code {code} has unknown promotion.')
+    return code & 63, code >> 6 & 63, PROMOTIONS[code >> 12]
+
+
+def encode(board: ChessBoard, move: Move) -> int:
+    """Get code of move on the board."""
+    return encode_move(
+        board.get_figure_position(move.chessman).square,
+        move.field.square,
+        move.promotion,
+    )
+
+
+def decode(board: ChessBoard, code: int) -> Move:
+    """Get move of the board by its code.
+
+    Move is not validated.
+
+    Raises:
+        BadMoveException if there is no figure on the square to move from
+        or promotion is unknown.
+
+    """
+    old_square, new_square, promotion = decode_move(code)
+    chessman = board.get_field(old_square).chessman
+    if chessman is None:
+        raise BadMoveException(f'There is no figure to move in {to_uci(code)}')
+    return Move(chessman, board.get_field(new_square), promotion)
+
+
+def encode_line(board: ChessBoard, moves: Iterable[Move]) -> array:
+    """Get codes of moves made one after another from the position.
+
+    Moves are pushed to get positions of figures and taken back then.
+
+    """
+    codes = array('H')
+    try:
+        for move in moves:
+            codes.append(encode(board, move))
+            board.push(move)
+    finally:
+        for _ in codes:
+            board.pop()
+    return codes
+
+
+def get_square_name(square: int) -> str:
+    """Get name of square in lower case, like `e4`."""
+    return SQUARE_NAMES[square].lower()
+
+
+def get_square(name: str) -> int:
+    """Get square by its name.
+
+    Raises:
+        BadMoveException if there is no such square.
+
+    """
+    try:
+        return SQUARES_BY_NAME[name]
+    except KeyError:
+        raise BadMoveException(f'There is no square {name!r}.')
+
+
+def to_uci(code: int) -> str:
+    """Get UCI notation of move code.
+
+    Raises:
+        BadMoveException if promotion is unknown.
+
+    """
+    old_square, new_square, promotion = decode_move(code)
+    return (
+        f'{get_square_name(old_square)}{get_square_name(new_square)}'
+        f'{UCI_PROMOTIONS.get(promotion, "")}'
+    )
+
+
+def parse_uci(uci: str) -> int:
+    """Get move code by UCI notation.
+
+    Raises:
+        BadMoveException if notation is wrong.
+
+    """
+    match = UCI_RE.match(uci)
+    if not match or match[3] and match[3] not in UCI_PROMOTION_TYPES:
+        raise BadMoveException(f'Move {uci!r} is not supported.')
+    return encode_move(
+        get_square(match[1]),
+        get_square(match[2]),
+        UCI_PROMOTION_TYPES.get(match[3]),
+    )
@@ -0,0 +1,31 @@
+"""Static evaluation of positions.
+
+Board keeps material and piece-square scores up to date on every move,
+so evaluation is a read of these scores (see `ChessBoard.evaluate`).
+
+"""
+from __future__ import annotations
+
+from .board import ChessBoard
+from .side import Black, White
+
+
+def evaluate(board: ChessBoard) -> int:
+    """Get score of position for the side to move in centipawns."""
+    return board.evaluate()
+
+
+def evaluate_from_scratch(board: ChessBoard) -> int:
+    """Get score of position by walking all figures.
+
+    Equals to `evaluate`, used to check incremental scores.
+
+    """
+    score = 0
+    for chessman in board.get_figures():
+        square = board.get_figure_position(chessman).square
+        if chessman.side is Black:
+            square ^= 56
+        value = chessman.type.VALUE + chessman.type.SQUARE_VALUES[square]
+        score += value if chessman.side is White else -value
+    return score if board.turn is White else -score
@@ -16,3 +16,15 @@ class ChangeTypeException(ValueError):
 
 class CaptureException(ValueError):
     pass
+
+
+class FENException(ValueError):
+    pass
+
+
+class PositionDatabaseException(ValueError):
+    pass
+
+
+class PackedPositionException(ValueError):
+    pass
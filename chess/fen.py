@@ -0,0 +1,190 @@
+"""Import and export of positions in FEN and EPD notations.
+
+Only figures implemented in `chess.type` are supported. Board doesn't
+keep castling rights, en passant field and move counters, so these fields
+are validated on import and exported as `- - 0 1`.
+
+Pawn is considered to make its first move if it stays on its start row.
+
+"""
+from __future__ import annotations
+
+import os
+import re
+from typing import IO, Iterator, Type, Union
+
+from .board import ChessBoard
+from .chessman import Chessman
+from .exceptions import FENException
+from .side import Black, White
+from .type import Pawn, Rook
+
+FIGURES = {
+    'P': (Pawn, White),
+    'R': (Rook, White),
+    'p': (Pawn, Black),
+    'r': (Rook, Black),
+}
+SYMBOLS = {figure: symbol for symbol, figure in FIGURES.items()}
+TURNS = {'w': White, 'b': Black}
+TURN_SYMBOLS = {side: symbol for symbol, side in TURNS.items()}
+PAWN_START_ROWS = {White: 6, Black: 1}
+DIGITS = '12345678'
+
+EPD_OPERATION_RE = re.compile(r'\s*(\w+)\s*("[^"]*"|[^;]*);')
+
+
+def set_up_position(board: ChessBoard, placement: str, turn: str):
+    """Place figures from FEN placement field on the empty board.
+
+    Raises:
+        FENException if placement or turn is wrong.
+
+    """
+    rows = placement.split('/')
+    if len(rows) != 8:
+        raise FENException(f'Wrong number of rows in {placement!r}')
+    for row_index, row in enumerate(rows):
+        col_index = 0
+        for symbol in row:
+            if symbol in DIGITS:
+                col_index += int(symbol)
+                continue
+            if symbol not in FIGURES or col_index > 7:
+                raise FENException(f'Wrong row {row!r} in {placement!r}')
+            type, side = FIGURES[symbol]
+            chessman = Chessman(
+                chessman_type=type,
+                side=side,
+                chess_board=board,
+            )
+            if type is Pawn:
+                chessman.first_move = PAWN_START_ROWS[side] == row_index
+            board.squares[row_index * 8 + col_index].chessman = chessman
+            col_index += 1
+        if col_index != 8:
+            raise FENException(f'Wrong row {row!r} in {placement!r}')
+
+    if turn not in TURNS:
+        raise FENException(f'Wrong side to move {turn!r}')
+    board.set_turn(TURNS[turn])
+
+
+def get_placement(board: ChessBoard) -> str:
+    """Get FEN placement field of the board."""
+    rows = []
+    for row in board.state:
+        symbols = []
+        empty = 0
+        for field in row:
+            chessman = field.chessman
+            if chessman is None:
+                empty += 1
+                continue
+            if empty:
+                symbols.append(str(empty))
+                empty = 0
+            symbols.append(SYMBOLS[(chessman.type.__class__, chessman.side)])
+        if empty:
+            symbols.append(str(empty))
+        rows.append(''.join(symbols))
+    return '/'.join(rows)
+
+
+def _is_counters(counters: list[str]) -> bool:
+    """Get if fields are halfmove clock and fullmove number."""
+    return len(counters) == 2 and all(
+        counter.isascii() and counter.isdigit() for counter in counters
+    )
+
+
+def _split_fields(line: str) -> tuple[str, str, str]:
+    """Get placement, turn and the rest of FEN or EPD line.
+
+    Raises:
+        FENException if castling or en passant fields are wrong.
+
+    """
+    fields = line.split(maxsplit=4)
+    if len(fields) < 2:
+        raise FENException(f'Wrong position {line!r}')
+    placement, turn, *rest = fields
+    castling, en_passant = (rest + ['-', '-'])[:2]
+    if castling != '-' or en_passant != '-':
+        raise FENException(
+            f'Castling and en passant are not supported in {line!r}',
+        )
+    return placement, turn, fields[4] if len(fields) > 4 else ''
+
+
+def from_fen(
+    fen: str,
+    board_class: Type[ChessBoard] = ChessBoard,
+) -> ChessBoard:
+    """Create board from FEN.
+
+    Raises:
+        FENException if FEN is wrong.
+
+    """
+    placement, turn, counters = _split_fields(fen)
+    if counters and not _is_counters(counters.split()):
+        raise FENException(f'Wrong move counters in {fen!r}')
+    board = board_class()
+    set_up_position(board, placement, turn)
+    return board
+
+
+def to_fen(board: ChessBoard) -> str:
+    """Get FEN of the board."""
+    return f'{get_placement(board)} {TURN_SYMBOLS[board.turn]} - - 0 1'
+
+
+def parse_epd(
+    line: str,
+    board_class: Type[ChessBoard] = ChessBoard,
+) -> tuple[ChessBoard, dict[str, str]]:
+    """Create board from EPD or FEN line.
+
+    Returns:
+        Board and EPD operations (opcode -> operand). FEN move counters
+        are returned as `hmvc` and `fmvn` operations.
+
+    Raises:
+        FENException if line is wrong.
+
+    """
+    placement, turn, rest = _split_fields(line)
+    operations = {}
+    counters = rest.split()
+    if _is_counters(counters):
+        operations = {'hmvc': counters[0], 'fmvn': counters[1]}
+    elif rest:
+        for match in EPD_OPERATION_RE.finditer(rest):
+            opcode, operand = match.groups()
+            operations[opcode] = operand.strip().strip('"')
+    board = board_class()
+    set_up_position(board, placement, turn)
+    return board, operations
+
+
+def iter_epd(
+    file: Union[str, os.PathLike, IO[str]],
+    board_class: Type[ChessBoard] = ChessBoard,
+) -> Iterator[tuple[ChessBoard, dict[str, str]]]:
+    """Iterate over positions of EPD or FEN file line by line.
+
+    File is never loaded into memory, empty lines are skipped.
+
+    Raises:
+        FENException if line is wrong.
+
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file) as opened_file:
+            yield from iter_epd(opened_file, board_class)
+        return
+    for line in file:
+        line = line.strip()
+        if line:
+            yield parse_epd(line, board_class)
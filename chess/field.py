@@ -1,10 +1,22 @@
-from typing import Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
 
 from .chessman import Chessman
+from .exceptions import BadCoordinatesException
+from .tables import SQUARE_NAMES
+
+if TYPE_CHECKING:
+    from .board import ChessBoard
 
 
 class ChessField:
-    """Class represents field for chess board."""
+    """Class represents field for chess board.
+
+    `coordinates` and `square` are calculated once on init.
+
+    """
+    __slots__ = ('row', 'col', 'board', '_chessman', 'coordinates', 'square')
     cols = ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'H')
     rows = tuple(sorted(
         map(str, range(1, 9)),
@@ -15,19 +27,41 @@ class ChessField:
         self,
         row: str,
         col: str,
-        chessman: Optional[Chessman] = None
+        chessman: Optional[Chessman] = None,
+        board: Optional[ChessBoard] = None,
     ):
-        """Init position of field and set up chessman."""
+        """Init position of field and set up chessman.
+
+        If the field belongs to a board, every change of the chessman is
+        reported to the board so it can keep its indexes up to date.
+
+        """
         if col not in self.cols or row not in self.rows:
-            ValueError('There is no such field.')
+            raise BadCoordinatesException('There is no such field.')
         self.row = row
         self.col = col
+        self.board = board
+        # tuples of coordinates are shared by fields of all boards
+        self.coordinates = _COORDINATES[(row, col)]
+        # index of the field from 0 (A8) to 63 (H1)
+        self.square = self.coordinates[0] * len(self.cols) + (
+            self.coordinates[1]
+        )
+        self._chessman: Optional[Chessman] = None
         self.chessman = chessman
 
     @property
-    def coordinates(self) -> tuple[int, int]:
-        """Get relative coordinates."""
-        return len(self.rows) - int(self.row), self.cols.index(self.col)
+    def chessman(self) -> Optional[Chessman]:
+        """Get chessman on the field."""
+        return self._chessman
+
+    @chessman.setter
+    def chessman(self, chessman: Optional[Chessman]):
+        """Set up chessman and notify the board."""
+        old_chessman = self._chessman
+        self._chessman = chessman
+        if self.board is not None and old_chessman is not chessman:
+            self.board._update_field(self, old_chessman, chessman)
 
     @property
     def is_busy(self) -> bool:
@@ -35,4 +69,11 @@ class ChessField:
         return self.chessman is not None
 
     def __repr__(self) -> str:
-        return f'{self.col}{self.row}'
+        return SQUARE_NAMES[self.square]
+
+
+_COORDINATES = {
+    (row, col): (len(ChessField.rows) - int(row), ChessField.cols.index(col))
+    for row in ChessField.rows
+    for col in ChessField.cols
+}
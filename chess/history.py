@@ -0,0 +1,161 @@
+"""History of game moves with repetition detection.
+
+Moves are kept as 16-bit codes (see `chess.encoding`) with Zobrist keys
+of positions after every ply alongside them, so repetitions are found by
+comparing keys without replaying the game. Only moves are serialized, two
+bytes per move, keys are restored by replaying the game.
+
+"""
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Iterator, Optional
+
+from .board import ChessBoard
+from .encoding import decode, encode, to_uci
+from .exceptions import BadMoveException
+from .move import Move
+from .san import get_san
+
+
+class GameHistory:
+    """Moves of game and keys of its positions.
+
+    Attributes:
+        start_key: a key of the position before the first move.
+        moves: codes of moves.
+        keys: keys of positions after every move.
+
+    """
+    __slots__ = ('start_key', 'moves', 'keys')
+
+    def __init__(self, start_key: int = 0):
+        self.start_key = start_key
+        self.moves = array('H')
+        self.keys = array('Q')
+
+    @classmethod
+    def from_board(cls, board: ChessBoard) -> GameHistory:
+        """Create empty history starting from position of board."""
+        return cls(board.zobrist_key)
+
+    @classmethod
+    def from_bytes(cls, board: ChessBoard, data: bytes) -> GameHistory:
+        """Create history by replaying serialized moves on board.
+
+        Every move is checked to be a valid move of side to move. The
+        board is left in the position after the last move, or unchanged
+        if a move is wrong.
+
+        Raises:
+            BadMoveException if data is not a sequence of move codes or a
+            move can't be made.
+
+        """
+        if len(data) % 2:
+            raise BadMoveException('Moves must take two bytes each.')
+        moves = array('H', data)
+        if sys.byteorder == 'big':
+            moves.byteswap()
+        history = cls.from_board(board)
+        try:
+            for code in moves:
+                move = decode(board, code)
+                if move.chessman.side is not board.turn or (
+                    not board.is_valid_move(*move)
+                ):
+                    raise BadMoveException(
+                        f'Move {to_uci(code)} is not possible.',
+                    )
+                history.push(board, move)
+        except BadMoveException:
+            for _ in history.moves:
+                board.pop()
+            raise
+        return history
+
+    def to_bytes(self) -> bytes:
+        """Get moves as little-endian 16-bit codes."""
+        if sys.byteorder == 'big':
+            moves = array('H', self.moves)
+            moves.byteswap()
+            return moves.tobytes()
+        return self.moves.tobytes()
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.moves)
+
+    def append(self, code: int, key: int):
+        """Add move code and key of position after it."""
+        self.moves.append(code)
+        self.keys.append(key)
+
+    def push(self, board: ChessBoard, move: Move) -> int:
+        """Make move on board and add it.
+
+        Returns:
+            Code of the move.
+
+        """
+        code = encode(board, move)
+        board.push(move)
+        self.append(code, board.zobrist_key)
+        return code
+
+    def pop(self, board: ChessBoard) -> int:
+        """Take back the last move on board and remove it.
+
+        Raises:
+            IndexError if there are no moves.
+
+        """
+        board.pop()
+        self.keys.pop()
+        return self.moves.pop()
+
+    def get_key(self, ply: int) -> int:
+        """Get key of position after ply, 0 is the start position."""
+        return self.keys[ply - 1] if ply else self.start_key
+
+    def count_repetitions(self, ply: Optional[int] = None) -> int:
+        """Count occurrences of position after ply until it.
+
+        The last position is counted by default. Only positions with the
+        same side to move are compared.
+
+        """
+        if ply is None:
+            ply = len(self.moves)
+        key = self.get_key(ply)
+        return sum(
+            self.get_key(other) == key for other in range(ply % 2, ply + 1, 2)
+        )
+
+    def is_repetition(self, count: int = 3) -> bool:
+        """Get if the last position occurred count times."""
+        return self.count_repetitions() >= count
+
+    def to_uci(self) -> str:
+        """Get moves in UCI notation separated by spaces."""
+        return ' '.join(map(to_uci, self.moves))
+
+    def to_san(self, board: ChessBoard) -> list[str]:
+        """Get SAN of moves made from the start position of board.
+
+        Moves are pushed to the board and taken back then.
+
+        """
+        sans = []
+        try:
+            for code in self.moves:
+                move = decode(board, code)
+                sans.append(get_san(board, move))
+                board.push(move)
+        finally:
+            for _ in sans:
+                board.pop()
+        return sans
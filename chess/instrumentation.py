@@ -0,0 +1,163 @@
+"""Opt-in instrumentation of hot-path methods.
+
+When enabled, hot-path methods of boards and piece types are replaced by
+wrappers which count calls and cumulative time in nanoseconds. When
+disabled, original methods are restored, so there is no overhead.
+
+Time of nested calls is included into time of outer calls (e.g. time of
+`Rook.is_valid_move` is a part of `ChessBoard.try_move`).
+
+Usage:
+    with instrumentation.capture() as stats:
+        board.move_figure(chessman, field)
+    print(stats['ChessBoard.try_move'].total_ns)
+
+"""
+from __future__ import annotations
+
+import functools
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, NamedTuple
+
+from .board import ChessBoard
+from .interfaces import AbstractChessmanType
+
+BOARD_METHODS = (
+    'try_move',
+    'is_valid_move',
+    'get_figure_position',
+    'get_blockers',
+    'push',
+    'pop',
+)
+TYPE_METHODS = (
+    'is_valid_move',
+)
+
+
+class MethodStats(NamedTuple):
+    """Number of calls and cumulative time of method."""
+    calls: int
+    total_ns: int
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+
+
+# name of method -> [calls, total time]
+_counters: dict[str, list[int]] = {}
+# (class, name of method, original method or None if it was inherited)
+_patched: list[tuple[type, str, Any]] = []
+
+
+def _get_subclasses(cls: type) -> Iterator[type]:
+    yield cls
+    for subclass in cls.__subclasses__():
+        yield from _get_subclasses(subclass)
+
+
+def _wrap(method: Callable, name: str) -> Callable:
+    """Wrap method to count its calls and time."""
+    counter = _counters.setdefault(name, [0, 0])
+    perf_counter_ns = time.perf_counter_ns
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        started = perf_counter_ns()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            counter[0] += 1
+            counter[1] += perf_counter_ns() - started
+    return wrapper
+
+
+def _patch(cls: type, name: str, own_only: bool):
+    """Replace method of class by wrapper.
+
+    If `own_only` is set, only methods defined by the class are patched,
+    otherwise inherited methods are patched too, to count them by class.
+
+    """
+    original = cls.__dict__.get(name)
+    if original is None and own_only:
+        return
+    method = getattr(cls, name)
+    setattr(cls, name, _wrap(method, f'{cls.__name__}.{name}'))
+    _patched.append((cls, name, original))
+
+
+def is_enabled() -> bool:
+    return bool(_patched)
+
+
+def enable():
+    """Start counting calls of hot-path methods.
+
+    Boards and types defined after this call are not instrumented.
+
+    """
+    if is_enabled():
+        return
+    for cls in _get_subclasses(ChessBoard):
+        for name in BOARD_METHODS:
+            _patch(cls, name, own_only=True)
+    for cls in _get_subclasses(AbstractChessmanType):
+        if cls.__abstractmethods__:
+            continue
+        for name in TYPE_METHODS:
+            _patch(cls, name, own_only=False)
+
+
+def disable():
+    """Restore original methods, collected stats are kept."""
+    while _patched:
+        cls, name, original = _patched.pop()
+        if original is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, original)
+
+
+def reset():
+    """Reset collected stats."""
+    for counter in _counters.values():
+        counter[:] = [0, 0]
+
+
+def get_stats() -> dict[str, MethodStats]:
+    """Get snapshot of stats of called methods."""
+    return {
+        name: MethodStats(*counter)
+        for name, counter in _counters.items()
+        if counter[0]
+    }
+
+
+@contextmanager
+def capture() -> Iterator[dict[str, MethodStats]]:
+    """Collect stats of methods called in the block.
+
+    Yields dict which is filled with stats when the block exits.
+    Instrumentation is enabled for the block if it wasn't enabled.
+
+    """
+    was_enabled = is_enabled()
+    enable()
+    before = get_stats()
+    stats: dict[str, MethodStats] = {}
+    try:
+        yield stats
+    finally:
+        if not was_enabled:
+            disable()
+        empty = MethodStats(0, 0)
+        for name, after in get_stats().items():
+            calls = after.calls - before.get(name, empty).calls
+            if calls:
+                stats[name] = MethodStats(
+                    calls,
+                    after.total_ns - before.get(name, empty).total_ns,
+                )
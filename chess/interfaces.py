@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Type
+from typing import TYPE_CHECKING, ClassVar, Iterator, Type
 
+from . import validation
 from .side import Side
 
 # питон кусок трижды переваренного кала
 if TYPE_CHECKING:
+    from .board import ChessBoard
+    from .chessman import Chessman
     from .field import ChessField
+    from .move import Move
 
 
 class AbstractChessman(ABC):
     """Abstract class for chessman."""
+    __slots__ = ('status',)
     status: bool
 
     def __init__(self):
@@ -40,15 +45,41 @@ class AbstractChessman(ABC):
 
 
 class AbstractChessmanType(ABC):
-    """Abstract class for chessman type."""
+    """Abstract class for chessman type.
+
+    Type has no mutable state, so one instance per side is shared by all
+    chessmans (see `get_instance`). State of the chessman like its first
+    move is stored on the chessman.
+
+    """
+    __slots__ = ('side',)
+    # if validation of moves depends on the first move of chessman
+    TRACKS_FIRST_MOVE: ClassVar[bool] = False
+    # material value in centipawns
+    VALUE: ClassVar[int] = 0
+    # bonus for every square from A8 to H1 for White, mirrored for Black
+    SQUARE_VALUES: ClassVar[tuple[int, ...]] = (0,) * 64
+    _instances: ClassVar[dict[
+        tuple[Type[AbstractChessmanType], Type[Side]],
+        AbstractChessmanType,
+    ]] = {}
+
     def __init__(self, side: Type[Side]):
         self.side = side
 
+    @classmethod
+    def get_instance(cls, side: Type[Side]) -> AbstractChessmanType:
+        """Get shared instance of the type for the side."""
+        try:
+            return cls._instances[(cls, side)]
+        except KeyError:
+            instance = cls._instances[(cls, side)] = cls(side=side)
+            return instance
+
     @property
     def name(self) -> str:
         return self.__class__.__name__
 
-    @abstractmethod
     def is_valid_move(
         self,
         old_field: ChessField,
@@ -59,15 +90,84 @@ class AbstractChessmanType(ABC):
     ) -> bool:
         """Returns whenever chessman can move to the new field.
 
+        Validation has no side effects and its result is memoised.
+
         Attributes:
             old_field a field to move from
             new_field a field to move in
+            is_capture if there is a figure on the new field
+            board a board to check fields between old and new fields
+            first_move if chessman didn't move yet
 
         Returns:
             True - If chessman can move
             False - otherwise
 
         """
+        board: ChessBoard = kwargs.get('board', None)
+        assert board, 'Provide board to validate move.'
+        return validation.is_valid_move(
+            self.__class__,
+            self.side,
+            old_field.square,
+            new_field.square,
+            is_capture,
+            self.TRACKS_FIRST_MOVE and kwargs.get('first_move', True),
+            board.get_blockers(old_field, new_field),
+        )
+
+    @classmethod
+    @abstractmethod
+    def check_move(
+        cls,
+        side: Type[Side],
+        old_square: int,
+        new_square: int,
+        is_capture: bool,
+        first_move: bool,
+        blockers: int,
+    ) -> bool:
+        """Returns whenever figure can move from old square to new square.
+
+        Must depend only on arguments, see `validation.is_valid_move`.
+
+        """
+
+    @classmethod
+    @abstractmethod
+    def get_attacks(
+        cls,
+        side: Type[Side],
+        square: int,
+        occupied: int,
+    ) -> int:
+        """Get mask of squares attacked by figure on the square.
+
+        Attributes:
+            side a side of the figure
+            square a square of the figure
+            occupied a mask of busy squares
+
+        """
+
+    @abstractmethod
+    def iter_moves(
+        self,
+        chessman: Chessman,
+        old_field: ChessField,
+        board: ChessBoard,
+    ) -> Iterator[Move]:
+        """Iterate over moves of chessman from the field.
+
+        Moves follow the same rules as `is_valid_move`, captures of
+        figures with the same side are skipped.
+
+        Attributes:
+            chessman a chessman of this type
+            old_field a field to move from
+            board a board of the chessman
+
+        """
 
     def __str__(self) -> str:
         return self.name
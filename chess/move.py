@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import TYPE_CHECKING, NamedTuple, Optional, Type
+
+if TYPE_CHECKING:
+    from .chessman import Chessman
+    from .field import ChessField
+    from .interfaces import AbstractChessmanType
+
+
+class MoveResult(IntEnum):
+    """Result code of submitted move."""
+    OK = 0
+    BAD_MOVE = 1
+    SAME_SIDE_CAPTURE = 2
+    CAPTURED_PIECE = 3
+
+
+class Move(NamedTuple):
+    """Move of chessman to field.
+
+    Promotion is a type for pawn exchange.
+
+    """
+    chessman: Chessman
+    field: ChessField
+    promotion: Optional[Type[AbstractChessmanType]] = None
+
+    def __str__(self) -> str:
+        promotion = f'={self.promotion.__name__}' if self.promotion else ''
+        return f'{self.chessman.get_position()}-{self.field}{promotion}'
+
+
+class MoveRecord(NamedTuple):
+    """Changes made by move on the board.
+
+    Attributes:
+        move a move made
+        old_field a field chessman moved from
+        captured a captured chessman if any
+        old_type a type of chessman before exchange
+        first_move a first move state of chessman before move
+
+    """
+    move: Move
+    old_field: ChessField
+    captured: Optional[Chessman]
+    old_type: AbstractChessmanType
+    first_move: bool
@@ -0,0 +1,127 @@
+"""Packed binary format of positions.
+
+Position takes `POSITION.size` (41) bytes:
+    32 bytes - a code of figure per square, 4 bits each, square 0 (A8) in
+               the low bits of the first byte (see `FIGURE_CODES`)
+    8 bytes - a mask of squares of pawns which didn't move yet
+    1 byte - flags, `BLACK_TO_MOVE` bit is set if black moves
+
+Positions are decoded right from a buffer (`bytes`, `bytearray`, `mmap`)
+through `memoryview`, without copying it.
+
+"""
+from __future__ import annotations
+
+import struct
+from typing import Iterator, Type, Union
+
+from .board import ChessBoard
+from .chessman import Chessman
+from .exceptions import PackedPositionException
+from .side import Black, White
+from .type import Pawn, Rook
+
+POSITION = struct.Struct('<32sQB')
+BLACK_TO_MOVE = 1
+
+# side is the highest bit of code, 0 is an empty square
+FIGURE_CODES = {
+    (Pawn, White): 1,
+    (Rook, White): 2,
+    (Pawn, Black): 9,
+    (Rook, Black): 10,
+}
+FIGURES = {code: figure for figure, code in FIGURE_CODES.items()}
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def encode_into(board: ChessBoard, buffer: Buffer, offset: int = 0):
+    """Write packed position into writable buffer at offset."""
+    squares = bytearray(32)
+    first_moves = 0
+    for chessman in board.get_figures():
+        square = board.get_figure_position(chessman).square
+        code = FIGURE_CODES[(chessman.type.__class__, chessman.side)]
+        squares[square >> 1] |= code << (square & 1) * 4
+        if chessman.first_move and chessman.type.TRACKS_FIRST_MOVE:
+            first_moves |= 1 << square
+    flags = BLACK_TO_MOVE if board.turn is Black else 0
+    POSITION.pack_into(buffer, offset, bytes(squares), first_moves, flags)
+
+
+def encode(board: ChessBoard) -> bytes:
+    """Get packed position of the board."""
+    buffer = bytearray(POSITION.size)
+    encode_into(board, buffer)
+    return bytes(buffer)
+
+
+def decode(
+    buffer: Buffer,
+    offset: int = 0,
+    board_class: Type[ChessBoard] = ChessBoard,
+) -> ChessBoard:
+    """Create board from packed position in buffer at offset.
+
+    Raises:
+        PackedPositionException if buffer is too short or there is an
+        unknown figure code.
+
+    """
+    try:
+        squares, first_moves, flags = POSITION.unpack_from(buffer, offset)
+    except struct.error:
+        raise PackedPositionException(
+            f'There are less than {POSITION.size} bytes at offset {offset}.',
+        )
+    board = board_class()
+    for square in range(64):
+        code = squares[square >> 1] >> (square & 1) * 4 & 15
+        if not code:
+            continue
+        try:
+            type, side = FIGURES[code]
+        except KeyError:
+            raise PackedPositionException(
+                f'Unknown figure code {code} of square {square}.',
+            )
+        chessman = Chessman(chessman_type=type, side=side, chess_board=board)
+        chessman.first_move = bool(first_moves >> square & 1) or (
+            not type.TRACKS_FIRST_MOVE
+        )
+        board.get_field(square).chessman = chessman
+    board.set_turn(Black if flags & BLACK_TO_MOVE else White)
+    return board
+
+
+class PositionReader:
+    """Sequence of packed positions stored one by one in a buffer.
+
+    Buffer is accessed through `memoryview`, so positions are decoded
+    without copying it.
+
+    """
+    def __init__(
+        self,
+        buffer: Buffer,
+        board_class: Type[ChessBoard] = ChessBoard,
+    ):
+        self.buffer = memoryview(buffer)
+        self.board_class = board_class
+
+    def __len__(self) -> int:
+        return self.buffer.nbytes // POSITION.size
+
+    def __getitem__(self, index: int) -> ChessBoard:
+        if not -len(self) <= index < len(self):
+            raise IndexError(f'There is no position {index}')
+        return decode(
+            self.buffer,
+            index % len(self) * POSITION.size,
+            self.board_class,
+        )
+
+    def __iter__(self) -> Iterator[ChessBoard]:
+        for index in range(len(self)):
+            yield decode(self.buffer, index * POSITION.size, self.board_class)
@@ -0,0 +1,275 @@
+"""Parallel search in several processes (Lazy SMP).
+
+Every worker process searches the same root position with its own
+`Searcher`, and all of them share one transposition table placed in
+`multiprocessing.shared_memory`, so results found by one worker cut the
+search of others. Workers with odd numbers start from the second depth to
+make searches diverse. The deepest result wins.
+
+Run `python -m chess.parallel --workers 1 2 4` to measure scaling on
+`BENCHMARK_POSITIONS`.
+
+"""
+from __future__ import annotations
+
+import argparse
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import NamedTuple, Optional
+
+from .board import ChessBoard
+from .move import Move
+from .search import MoveKey, Searcher, SearchResult, get_move_key
+from .type import Pawn
+
+BENCHMARK_POSITIONS = (
+    'r6r/pppppppp/8/8/8/8/PPPPPPPP/R6R w - - 0 1',
+    'r3r3/pp3ppp/2p5/3p4/3P4/2P5/PP3PPP/R3R3 w - - 0 1',
+    '4r3/1p4p1/p6p/8/8/P6P/1P4P1/4R3 b - - 0 1',
+    '8/pp3r2/2p5/8/8/5P2/PPR5/8 w - - 0 1',
+)
+
+SLOT = struct.Struct('<QQ')
+PROMOTIONS = (None, *Pawn.EXCHANGE_TYPES)
+SCORE_OFFSET = 1 << 31
+VALID_BIT = 1 << 63
+
+
+class SharedTranspositionTable:
+    """Transposition table of search placed in shared memory.
+
+    Slot keeps `key ^ data` and `data`, so a slot torn by concurrent
+    writes is detected on lookup instead of locking (see Hyatt's
+    lockless hashing). Entry of another position is replaced if its
+    depth is not greater.
+
+    """
+    def __init__(self, size: int = 2 ** 16, name: Optional[str] = None):
+        """Create table with number of slots or attach to it by name."""
+        if name is None:
+            self.memory = shared_memory.SharedMemory(
+                create=True,
+                size=size * SLOT.size,
+            )
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+        self.size = self.memory.size // SLOT.size
+        self._mask = (1 << (self.size.bit_length() - 1)) - 1
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    @staticmethod
+    def _pack(value: tuple[int, int, Optional[MoveKey], int]) -> int:
+        score, flag, move_key, depth = value
+        move = 0
+        if move_key is not None:
+            old_square, new_square, promotion = move_key
+            move = 1 << 14 | PROMOTIONS.index(promotion) << 12 | (
+                old_square << 6 | new_square
+            )
+        return VALID_BIT | (score + SCORE_OFFSET) << 25 | depth << 17 | (
+            flag << 15 | move
+        )
+
+    @staticmethod
+    def _unpack(data: int) -> tuple[int, int, Optional[MoveKey], int]:
+        move_key = None
+        if data >> 14 & 1:
+            move_key = (
+                data >> 6 & 63,
+                data & 63,
+                PROMOTIONS[data >> 12 & 3],
+            )
+        score = (data >> 25 & 0xFFFFFFFF) - SCORE_OFFSET
+        return score, data >> 15 & 3, move_key, data >> 17 & 255
+
+    def _read(self, index: int) -> tuple[int, int]:
+        stored, data = SLOT.unpack_from(self.memory.buf, index * SLOT.size)
+        return stored ^ data, data
+
+    def store(self, key: int, depth: int, value: tuple) -> bool:
+        """Save entry of search, see `TranspositionTable.store`."""
+        index = key & self._mask
+        stored_key, data = self._read(index)
+        if data and stored_key != key and depth < data >> 17 & 255:
+            return False
+        data = self._pack(value)
+        SLOT.pack_into(self.memory.buf, index * SLOT.size, key ^ data, data)
+        return True
+
+    def lookup(self, key: int, depth: int = 0) -> Optional[tuple]:
+        """Get entry of search, see `TranspositionTable.lookup`."""
+        stored_key, data = self._read(key & self._mask)
+        if not data & VALID_BIT or stored_key != key:
+            return None
+        value = self._unpack(data)
+        return value if value[3] >= depth else None
+
+    def close(self):
+        self.memory.close()
+
+    def unlink(self):
+        self.memory.unlink()
+
+
+class _WorkerResult(NamedTuple):
+    depth: int
+    score: int
+    nodes: int
+    pv: list[MoveKey]
+
+
+def _search_worker(
+    position: bytes,
+    table_name: str,
+    worker: int,
+    max_depth: int,
+    time_limit: Optional[float],
+    node_limit: Optional[int],
+) -> _WorkerResult:
+    """Search position in worker process with shared table."""
+    board = ChessBoard.from_bytes(position)
+    table = SharedTranspositionTable(name=table_name)
+    try:
+        result = Searcher(table=table).search(
+            board,
+            max_depth=max_depth,
+            time_limit=time_limit,
+            node_limit=node_limit,
+            first_depth=1 + worker % 2,
+        )
+        pv = []
+        for move in result.pv:
+            pv.append(get_move_key(board, move))
+            board.push(move)
+        return _WorkerResult(result.depth, result.score, result.nodes, pv)
+    finally:
+        table.close()
+
+
+def _find_move(board: ChessBoard, key: MoveKey) -> Move:
+    return next(
+        move for move in board.legal_moves()
+        if get_move_key(board, move) == key
+    )
+
+
+def parallel_search(
+    board: ChessBoard,
+    workers: int = 2,
+    max_depth: int = 64,
+    time_limit: Optional[float] = None,
+    node_limit: Optional[int] = None,
+    table_size: int = 2 ** 16,
+    executor: Optional[ProcessPoolExecutor] = None,
+) -> SearchResult:
+    """Search the best move in worker processes.
+
+    Budget of nodes is given to every worker. Nodes of result is the total
+    number of nodes of all workers.
+
+    """
+    started = time.perf_counter()
+    table = SharedTranspositionTable(size=table_size)
+    own_executor = executor is None
+    executor = executor or ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            executor.submit(
+                _search_worker,
+                board.to_bytes(),
+                table.name,
+                worker,
+                max_depth,
+                time_limit,
+                node_limit,
+            )
+            for worker in range(workers)
+        ]
+        results = [future.result() for future in futures]
+    finally:
+        if own_executor:
+            executor.shutdown()
+        table.close()
+        table.unlink()
+
+    # the deepest result wins, the first worker wins among equal ones
+    best = max(results, key=lambda result: result.depth)
+    pv = []
+    for key in best.pv:
+        pv.append(_find_move(board, key))
+        board.push(pv[-1])
+    for _ in pv:
+        board.pop()
+    return SearchResult(
+        best_move=pv[0] if pv else next(board.legal_moves(), None),
+        score=best.score,
+        pv=pv,
+        depth=best.depth,
+        nodes=sum(result.nodes for result in results),
+        elapsed=time.perf_counter() - started,
+        iterations=[],
+    )
+
+
+class ScalingResult(NamedTuple):
+    """Time to search benchmark positions with number of workers."""
+    workers: int
+    elapsed: float
+    nodes: int
+    speedup: float
+
+    @property
+    def efficiency(self) -> float:
+        return self.speedup / self.workers
+
+
+def benchmark_scaling(
+    workers: tuple[int, ...] = (1, 2, 4),
+    depth: int = 4,
+    positions: tuple[str, ...] = BENCHMARK_POSITIONS,
+) -> list[ScalingResult]:
+    """Measure time to depth of benchmark positions by number of workers.
+
+    Speedup is relative to the first number of workers.
+
+    """
+    results: list[ScalingResult] = []
+    for count in workers:
+        with ProcessPoolExecutor(max_workers=count) as executor:
+            started = time.perf_counter()
+            nodes = 0
+            for fen in positions:
+                nodes += parallel_search(
+                    ChessBoard.from_fen(fen),
+                    workers=count,
+                    max_depth=depth,
+                    executor=executor,
+                ).nodes
+            elapsed = time.perf_counter() - started
+        speedup = results[0].elapsed / elapsed if results else 1.0
+        results.append(ScalingResult(count, elapsed, nodes, speedup))
+    return results
+
+
+def main(argv: Optional[list[str]] = None):
+    """Measure scaling of parallel search on benchmark positions."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--depth', type=int, default=4)
+    args = parser.parse_args(argv)
+
+    for result in benchmark_scaling(tuple(args.workers), args.depth):
+        print(
+            f'{result.workers} workers: {result.elapsed:.2f}s, '
+            f'{result.nodes} nodes, speedup {result.speedup:.2f}, '
+            f'efficiency {result.efficiency:.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
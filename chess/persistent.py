@@ -0,0 +1,344 @@
+"""Persistent (immutable) chess board.
+
+`PersistentBoard` keeps a position in nested tuples of `Figure`, which
+are shared flyweights of types from `chess.type`. Making a move returns a
+new board which rebuilds only changed rows and shares all other rows with
+its parent, so many related positions take memory proportional to their
+differences. Boards are never changed after creation, so they can be
+shared between threads without locking.
+
+Moves are validated by the same memoised `chess.validation.is_valid_move`
+as moves of `ChessBoard`, and Zobrist keys of both boards are the same.
+
+"""
+from __future__ import annotations
+
+from typing import Any, Iterator, NamedTuple, Optional, Type
+
+from . import validation
+from .board import ChessBoard
+from .chessman import Chessman
+from .exceptions import BadMoveException, CaptureException
+from .interfaces import AbstractChessmanType
+from .side import Side, White, get_opposite_side
+from .tables import BETWEEN_MASKS, DIRECTIONS, RAYS
+from .zobrist import FIRST_MOVE_KEYS, TURN_KEY, get_piece_keys
+
+Rows = tuple[tuple[Optional['Figure'], ...], ...]
+
+
+class Figure(NamedTuple):
+    """Figure on a square.
+
+    Attributes:
+        type: a type instance, it keeps side of the figure.
+        first_move: if the figure didn't move yet, it's kept only for
+            types which track it.
+
+    """
+    type: AbstractChessmanType
+    first_move: bool
+
+    @property
+    def side(self) -> Type[Side]:
+        return self.type.side
+
+    def get_key(self, square: int) -> int:
+        """Get Zobrist key of the figure on the square."""
+        key = get_piece_keys(self.side, self.type.__class__)[square]
+        if self.first_move:
+            key ^= FIRST_MOVE_KEYS[square]
+        return key
+
+
+_FIGURES: dict[tuple[type, type, bool], Figure] = {}
+
+
+def get_figure(
+    type: Type[AbstractChessmanType],
+    side: Type[Side],
+    first_move: bool = True,
+) -> Figure:
+    """Get shared figure of type and side."""
+    first_move = first_move and type.TRACKS_FIRST_MOVE
+    key = (type, side, first_move)
+    figure = _FIGURES.get(key)
+    if figure is None:
+        figure = _FIGURES.setdefault(
+            key,
+            Figure(type.get_instance(side), first_move),
+        )
+    return figure
+
+
+class PersistentMove(NamedTuple):
+    """Move of persistent board by squares."""
+    old_square: int
+    new_square: int
+    promotion: Optional[Type[AbstractChessmanType]] = None
+
+
+class PersistentBoard:
+    """Immutable chess board.
+
+    Attributes:
+        rows: rows of figures from the 8th one, None is an empty square.
+        turn: side to move.
+        occupied: a mask of busy squares.
+        zobrist_key: Zobrist key of the position.
+
+    """
+    __slots__ = ('rows', 'turn', 'occupied', 'zobrist_key')
+
+    rows: Rows
+    turn: Type[Side]
+    occupied: int
+    zobrist_key: int
+
+    def __init__(
+        self,
+        rows: Optional[Rows] = None,
+        turn: Type[Side] = White,
+    ):
+        """Init board with rows of figures, the board is empty by default.
+
+        Busy squares and Zobrist key are calculated from figures.
+
+        """
+        rows = rows or ((None,) * 8,) * 8
+        occupied = 0
+        zobrist_key = 0 if turn is White else TURN_KEY
+        for square, figure in enumerate(sum(rows, ())):
+            if figure is not None:
+                occupied |= 1 << square
+                zobrist_key ^= figure.get_key(square)
+        self._set_up(rows, turn, occupied, zobrist_key)
+
+    def _set_up(
+        self,
+        rows: Rows,
+        turn: Type[Side],
+        occupied: int,
+        zobrist_key: int,
+    ):
+        object.__setattr__(self, 'rows', rows)
+        object.__setattr__(self, 'turn', turn)
+        object.__setattr__(self, 'occupied', occupied)
+        object.__setattr__(self, 'zobrist_key', zobrist_key)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    @classmethod
+    def from_board(cls, board: ChessBoard) -> PersistentBoard:
+        """Create persistent board from the position of board."""
+        return cls(
+            tuple(
+                tuple(
+                    _get_chessman_figure(field.chessman)
+                    for field in row
+                )
+                for row in board.state
+            ),
+            board.turn,
+        )
+
+    def to_board(
+        self,
+        board_class: Type[ChessBoard] = ChessBoard,
+    ) -> ChessBoard:
+        """Create board with the same position."""
+        board = board_class()
+        for square, figure in self.figures():
+            chessman = Chessman(
+                chessman_type=figure.type.__class__,
+                side=figure.side,
+                chess_board=board,
+            )
+            chessman.first_move = figure.first_move
+            board.get_field(square).chessman = chessman
+        board.set_turn(self.turn)
+        return board
+
+    @classmethod
+    def from_fen(cls, fen: str) -> PersistentBoard:
+        """Create board from FEN.
+
+        Raises:
+            FENException if FEN is wrong.
+
+        """
+        return cls.from_board(ChessBoard.from_fen(fen))
+
+    def to_fen(self) -> str:
+        """Get FEN of the board."""
+        return self.to_board().to_fen()
+
+    def __getitem__(self, square: int) -> Optional[Figure]:
+        """Get figure on the square."""
+        row, col = divmod(square, 8)
+        return self.rows[row][col]
+
+    def figures(
+        self,
+        side: Optional[Type[Side]] = None,
+    ) -> Iterator[tuple[int, Figure]]:
+        """Iterate over squares and figures, can be filtered by side."""
+        for row_index, row in enumerate(self.rows):
+            for col_index, figure in enumerate(row):
+                if figure is None:
+                    continue
+                if side is not None and figure.side is not side:
+                    continue
+                yield row_index * 8 + col_index, figure
+
+    def is_valid_move(self, old_square: int, new_square: int) -> bool:
+        """Get if figure on old square can move to new square.
+
+        Unlike `move`, doesn't check side to move.
+
+        """
+        figure = self[old_square]
+        if figure is None:
+            return False
+        target = self[new_square]
+        return validation.is_valid_move(
+            figure.type.__class__,
+            figure.side,
+            old_square,
+            new_square,
+            target is not None,
+            figure.first_move,
+            self.occupied & BETWEEN_MASKS[old_square * 64 + new_square],
+        ) and (target is None or target.side is not figure.side)
+
+    def legal_moves(self) -> Iterator[PersistentMove]:
+        """Iterate lazily over moves of side to move.
+
+        Figure which reaches the last row is exchanged into each of its
+        `EXCHANGE_TYPES`.
+
+        """
+        for square, figure in self.figures(self.turn):
+            exchange_types = getattr(figure.type, 'EXCHANGE_TYPES', ())
+            for direction in DIRECTIONS:
+                for target in RAYS[direction][square]:
+                    if self.is_valid_move(square, target):
+                        if exchange_types and target // 8 in (0, 7):
+                            for promotion in exchange_types:
+                                yield PersistentMove(
+                                    square,
+                                    target,
+                                    promotion,
+                                )
+                        else:
+                            yield PersistentMove(square, target)
+                    if self.occupied >> target & 1:
+                        break
+
+    def move(
+        self,
+        old_square: int,
+        new_square: int,
+        promotion: Optional[Type[AbstractChessmanType]] = None,
+    ) -> PersistentBoard:
+        """Get board after move of side to move.
+
+        Figure is exchanged into promotion type, which is required for a
+        pawn reaching the last row and not allowed otherwise.
+
+        Raises:
+            BadMoveException if there is no figure of side to move on old
+            square, it can't move to new square or promotion is wrong.
+            CaptureException if figure tries to capture a figure with the
+            same side.
+
+        """
+        figure = self[old_square]
+        if figure is None or figure.side is not self.turn:
+            raise BadMoveException(
+                f'There is no figure of {self.turn} on {old_square}.',
+            )
+        target = self[new_square]
+        if target is not None and target.side is figure.side:
+            raise CaptureException(
+                f'Figure {figure.type} tries to capture a figure with'
+                f' the same side ({figure.side})'
+            )
+        if not validation.is_valid_promotion(
+            figure.type,
+            new_square,
+            promotion,
+        ) or not self.is_valid_move(old_square, new_square):
+            raise BadMoveException(
+                f'{figure.type} move from {old_square} to {new_square} is'
+                ' not possible.',
+            )
+
+        moved = get_figure(
+            promotion or figure.type.__class__,
+            figure.side,
+            first_move=False,
+        )
+        zobrist_key = self.zobrist_key ^ TURN_KEY ^ figure.get_key(
+            old_square,
+        ) ^ moved.get_key(new_square)
+        if target is not None:
+            zobrist_key ^= target.get_key(new_square)
+
+        rows = list(self.rows)
+        old_row, old_col = divmod(old_square, 8)
+        new_row, new_col = divmod(new_square, 8)
+        row = list(rows[old_row])
+        row[old_col] = None
+        rows[old_row] = tuple(row)
+        row = list(rows[new_row])
+        row[new_col] = moved
+        rows[new_row] = tuple(row)
+
+        board = object.__new__(self.__class__)
+        board._set_up(
+            tuple(rows),
+            get_opposite_side(self.turn),
+            self.occupied & ~(1 << old_square) | 1 << new_square,
+            zobrist_key,
+        )
+        return board
+
+    def perft(self, depth: int) -> int:
+        """Count leaf nodes of the moves tree with given depth."""
+        if depth == 0:
+            return 1
+        if depth == 1:
+            return sum(1 for _ in self.legal_moves())
+        return sum(
+            self.move(*move).perft(depth - 1) for move in self.legal_moves()
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PersistentBoard):
+            return NotImplemented
+        return (
+            self.zobrist_key == other.zobrist_key
+            and self.turn is other.turn
+            and self.rows == other.rows
+        )
+
+    def __hash__(self) -> int:
+        return self.zobrist_key
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.to_fen()!r})'
+
+
+def _get_chessman_figure(chessman: Optional[Chessman]) -> Optional[Figure]:
+    if chessman is None:
+        return None
+    return get_figure(
+        chessman.type.__class__,
+        chessman.side,
+        chessman.first_move,
+    )
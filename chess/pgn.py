@@ -0,0 +1,268 @@
+"""Streaming replay of games in PGN.
+
+Games are read lazily and replayed by SAN moves. Board can't set up the
+standard game yet (see `ChessBoard.initialize_game`), so every game must
+have a start position in `FEN` tag.
+
+Run `python -m chess.pgn games.pgn --workers 4` to replay a file and get
+throughput of replay.
+
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from itertools import islice
+from typing import IO, Iterable, Iterator, NamedTuple, Optional, Type, Union
+
+from .board import ChessBoard
+from .exceptions import BadMoveException, FENException
+from .san import parse_san
+
+TAG_RE = re.compile(r'^\[(\w+)\s+"((?:[^"\\]|\\.)*)"\]\s*$')
+MOVETEXT_NOISE_RE = re.compile(
+    r'\{[^}]*\}'  # comments
+    r'|;[^\n]*'  # comments till the end of line
+    r'|\$\d+'  # numeric annotation glyphs
+    r'|\d+\.(?:\.\.)?'  # move numbers
+)
+RESULTS = ('1-0', '0-1', '1/2-1/2', '*')
+
+
+class Game(NamedTuple):
+    """Game read from PGN."""
+    headers: dict[str, str]
+    moves: list[str]
+    result: str
+
+
+class ReplayResult(NamedTuple):
+    """Result of game replay.
+
+    Attributes:
+        index a number of game in the input
+        plies a number of replayed moves
+        error a reason of the first illegal move, None if game is valid
+
+    """
+    index: int
+    plies: int
+    error: Optional[str] = None
+
+    @property
+    def is_valid(self) -> bool:
+        return self.error is None
+
+
+def _strip_variations(movetext: str) -> str:
+    """Remove variations in parentheses including nested ones."""
+    depth = 0
+    chars = []
+    for char in movetext:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth = max(depth - 1, 0)
+        elif not depth:
+            chars.append(char)
+    return ''.join(chars)
+
+
+def _parse_movetext(movetext: str) -> tuple[list[str], str]:
+    """Get SAN moves and result from movetext."""
+    movetext = MOVETEXT_NOISE_RE.sub(' ', movetext)
+    if '(' in movetext:
+        movetext = _strip_variations(movetext)
+    moves = movetext.split()
+    result = '*'
+    if moves and moves[-1] in RESULTS:
+        result = moves.pop()
+    return moves, result
+
+
+def iter_games(file: Union[str, os.PathLike, IO[str]]) -> Iterator[Game]:
+    """Iterate lazily over games of PGN file."""
+    if isinstance(file, (str, os.PathLike)):
+        with open(file) as opened_file:
+            yield from iter_games(opened_file)
+        return
+
+    headers: dict[str, str] = {}
+    movetext: list[str] = []
+    for line in file:
+        stripped_line = line.strip()
+        match = TAG_RE.match(stripped_line)
+        if match and not movetext:
+            headers[match[1]] = match[2].replace('\\"', '"')
+            continue
+        if match or (not stripped_line and movetext):
+            # tag or empty line after movetext starts the next game
+            moves, result = _parse_movetext(' '.join(movetext))
+            yield Game(headers, moves, result)
+            headers, movetext = {}, []
+            if match:
+                headers[match[1]] = match[2].replace('\\"', '"')
+            continue
+        if stripped_line and not stripped_line.startswith('%'):
+            movetext.append(stripped_line)
+    if headers or movetext:
+        moves, result = _parse_movetext(' '.join(movetext))
+        yield Game(headers, moves, result)
+
+
+def replay(
+    game: Game,
+    index: int = 0,
+    board_class: Type[ChessBoard] = ChessBoard,
+) -> ReplayResult:
+    """Replay game move by move until the first illegal move."""
+    if 'FEN' not in game.headers:
+        return ReplayResult(index, 0, 'There is no start position (FEN).')
+    try:
+        board = board_class.from_fen(game.headers['FEN'])
+    except FENException as error:
+        return ReplayResult(index, 0, str(error))
+
+    for ply, san in enumerate(game.moves):
+        try:
+            board.push(parse_san(board, san))
+        except BadMoveException as error:
+            return ReplayResult(index, ply, f'Ply {ply + 1}: {error}')
+    return ReplayResult(index, len(game.moves))
+
+
+def _replay_chunk(
+    games: list[Game],
+    start_index: int,
+    board_class: Type[ChessBoard],
+) -> list[ReplayResult]:
+    """Replay chunk of games in worker process."""
+    return [
+        replay(game, start_index + index, board_class)
+        for index, game in enumerate(games)
+    ]
+
+
+def replay_games(
+    games: Iterable[Game],
+    workers: Optional[int] = None,
+    chunk_size: int = 100,
+    max_in_flight: Optional[int] = None,
+    ordered: bool = True,
+    board_class: Type[ChessBoard] = ChessBoard,
+) -> Iterator[ReplayResult]:
+    """Replay games in worker processes.
+
+    Games are sent to workers by chunks, at most `max_in_flight` chunks
+    (twice the number of workers by default) are read from the input and
+    not processed yet.
+
+    Attributes:
+        games an iterable of games, consumed lazily
+        workers a number of processes, number of CPUs by default
+        chunk_size a number of games sent to worker at once
+        max_in_flight a number of chunks sent to workers at once
+        ordered if results are yielded in order of games
+
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    games = iter(games)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight: deque[Future[list[ReplayResult]]] = deque()
+        start_index = 0
+        while True:
+            while len(in_flight) < max_in_flight:
+                chunk = list(islice(games, chunk_size))
+                if not chunk:
+                    break
+                in_flight.append(executor.submit(
+                    _replay_chunk,
+                    chunk,
+                    start_index,
+                    board_class,
+                ))
+                start_index += len(chunk)
+            if not in_flight:
+                return
+            if ordered:
+                yield from in_flight.popleft().result()
+                continue
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                in_flight.remove(future)
+                yield from future.result()
+
+
+class ReplayStats:
+    """Throughput of game replay."""
+    def __init__(self, workers: int = 1):
+        self.workers = workers
+        self.games = 0
+        self.invalid_games = 0
+        self.plies = 0
+        self.started = time.perf_counter()
+        self.finished = self.started
+
+    def add(self, result: ReplayResult):
+        """Count replayed game."""
+        self.games += 1
+        self.plies += result.plies
+        self.invalid_games += not result.is_valid
+        self.finished = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return self.finished - self.started
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def games_per_second_per_core(self) -> float:
+        return self.games_per_second / self.workers
+
+    def __str__(self) -> str:
+        return (
+            f'{self.games} games ({self.invalid_games} invalid), '
+            f'{self.plies} plies in {self.elapsed:.2f}s: '
+            f'{self.games_per_second:.1f} games/s, '
+            f'{self.games_per_second_per_core:.1f} games/s per core'
+        )
+
+
+def main(argv: Optional[list[str]] = None):
+    """Replay PGN file and print invalid games and throughput."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('path')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--chunk-size', type=int, default=100)
+    parser.add_argument('--unordered', action='store_true')
+    args = parser.parse_args(argv)
+
+    stats = ReplayStats(workers=args.workers)
+    for result in replay_games(
+        iter_games(args.path),
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        ordered=not args.unordered,
+    ):
+        stats.add(result)
+        if not result.is_valid:
+            print(f'Game {result.index + 1}: {result.error}')
+    print(stats, file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
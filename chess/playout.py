@@ -0,0 +1,227 @@
+"""Monte-Carlo random playouts.
+
+A playout makes random legal moves from a position until `max_plies` or a
+terminal position, where side to move has no moves, and takes them back.
+Every playout of a batch has its own random generator seeded by the batch
+seed and the playout index, so results don't depend on how playouts are
+split between processes. Moves are ordered by their codes before the
+choice, because order of `legal_moves` depends on history of the board.
+
+Run `python -m chess.playout FEN --playouts 1000 --workers 4` to measure
+throughput.
+
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional, Type
+
+from .board import ChessBoard
+from .encoding import encode
+from .side import White
+
+DEFAULT_MAX_PLIES = 200
+
+
+class PlayoutResult(NamedTuple):
+    """Result of playout.
+
+    Attributes:
+        index an index of playout in batch
+        plies a number of moves made
+        is_terminal if side to move had no moves at the end
+        score a score of the last position for White in centipawns
+        key a Zobrist key of the last position
+
+    """
+    index: int
+    plies: int
+    is_terminal: bool
+    score: int
+    key: int
+
+
+def playout(
+    board: ChessBoard,
+    seed: int = 0,
+    index: int = 0,
+    max_plies: int = DEFAULT_MAX_PLIES,
+) -> PlayoutResult:
+    """Make random moves on board and take them back."""
+    moves_random = random.Random(f'{seed}:{index}')
+    plies = 0
+    is_terminal = False
+    try:
+        while plies < max_plies:
+            moves = {encode(board, move): move for move in board.legal_moves()}
+            if not moves:
+                is_terminal = True
+                break
+            board.push(moves[moves_random.choice(sorted(moves))])
+            plies += 1
+        score = board.evaluate()
+        return PlayoutResult(
+            index=index,
+            plies=plies,
+            is_terminal=is_terminal,
+            score=score if board.turn is White else -score,
+            key=board.zobrist_key,
+        )
+    finally:
+        for _ in range(plies):
+            board.pop()
+
+
+class PlayoutStats:
+    """Aggregate results and throughput of playouts."""
+    def __init__(self, workers: int = 1):
+        self.workers = workers
+        self.playouts = 0
+        self.plies = 0
+        self.terminal = 0
+        self.total_score = 0
+        self.started = time.perf_counter()
+        self.finished = self.started
+
+    def add(self, result: PlayoutResult):
+        """Count finished playout."""
+        self.playouts += 1
+        self.plies += result.plies
+        self.terminal += result.is_terminal
+        self.total_score += result.score
+        self.finished = time.perf_counter()
+
+    def update(self, other: PlayoutStats):
+        """Count playouts of other stats."""
+        self.playouts += other.playouts
+        self.plies += other.plies
+        self.terminal += other.terminal
+        self.total_score += other.total_score
+        self.finished = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return self.finished - self.started
+
+    @property
+    def mean_score(self) -> float:
+        return self.total_score / self.playouts if self.playouts else 0.0
+
+    @property
+    def mean_plies(self) -> float:
+        return self.plies / self.playouts if self.playouts else 0.0
+
+    @property
+    def playouts_per_second(self) -> float:
+        return self.playouts / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def plies_per_second(self) -> float:
+        return self.plies / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f'{self.playouts} playouts ({self.terminal} terminal), '
+            f'{self.plies} plies in {self.elapsed:.2f}s with '
+            f'{self.workers} workers: mean score {self.mean_score:.1f}, '
+            f'{self.playouts_per_second:.1f} playouts/s, '
+            f'{self.plies_per_second:.0f} plies/s'
+        )
+
+
+def _playout_chunk(
+    data: bytes,
+    board_class: Type[ChessBoard],
+    seed: int,
+    start: int,
+    stop: int,
+    max_plies: int,
+) -> PlayoutStats:
+    """Run playouts with indexes from start to stop in worker process."""
+    board = board_class.from_bytes(data)
+    stats = PlayoutStats()
+    for index in range(start, stop):
+        stats.add(playout(board, seed, index, max_plies))
+    return stats
+
+
+def run_playouts(
+    board: ChessBoard,
+    playouts: int,
+    seed: int = 0,
+    max_plies: int = DEFAULT_MAX_PLIES,
+    workers: int = 1,
+    chunk_size: Optional[int] = None,
+    executor: Optional[ProcessPoolExecutor] = None,
+) -> PlayoutStats:
+    """Run playouts from the position of board.
+
+    Playouts are run on the board itself if there is one worker, otherwise
+    they are split by chunks between worker processes.
+
+    Attributes:
+        playouts a number of playouts
+        seed a seed of random moves
+        max_plies a number of moves after which playout stops
+        workers a number of processes
+        chunk_size a number of playouts sent to worker at once, playouts
+            are split evenly between workers by default
+        executor an executor to reuse, a new one is made by default
+
+    """
+    stats = PlayoutStats(workers=workers)
+    if workers == 1 and executor is None:
+        for index in range(playouts):
+            stats.add(playout(board, seed, index, max_plies))
+        return stats
+
+    chunk_size = chunk_size or max(1, -(-playouts // workers))
+    own_executor = executor is None
+    executor = executor or ProcessPoolExecutor(max_workers=workers)
+    try:
+        data = board.to_bytes()
+        futures = [
+            executor.submit(
+                _playout_chunk,
+                data,
+                board.__class__,
+                seed,
+                start,
+                min(start + chunk_size, playouts),
+                max_plies,
+            )
+            for start in range(0, playouts, chunk_size)
+        ]
+        for future in futures:
+            stats.update(future.result())
+    finally:
+        if own_executor:
+            executor.shutdown()
+    return stats
+
+
+def main(argv: Optional[list[str]] = None):
+    """Run random playouts from position and print throughput."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('fen')
+    parser.add_argument('--playouts', type=int, default=1000)
+    parser.add_argument('--max-plies', type=int, default=DEFAULT_MAX_PLIES)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(run_playouts(
+        ChessBoard.from_fen(args.fen),
+        args.playouts,
+        seed=args.seed,
+        max_plies=args.max_plies,
+        workers=args.workers,
+    ))
+
+
+if __name__ == '__main__':
+    main()
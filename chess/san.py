@@ -0,0 +1,102 @@
+"""Standard algebraic notation (SAN) of moves.
+
+Only figures implemented in `chess.type` are supported.
+
+"""
+from __future__ import annotations
+
+import re
+
+from .board import ChessBoard
+from .exceptions import BadMoveException
+from .move import Move
+from .tables import SQUARES_BY_NAME
+from .type import Pawn, Rook
+
+SAN_RE = re.compile(
+    r'^(?P<figure>[A-Z])?'
+    r'(?P<from_col>[a-h])?(?P<from_row>[1-8])?'
+    r'(?P<capture>x)?'
+    r'(?P<to>[a-h][1-8])'
+    r'(?:=(?P<promotion>[A-Z]))?'
+    r'[+#]?[!?]*$'
+)
+FIGURES = {
+    None: Pawn,
+    'R': Rook,
+}
+SYMBOLS = {type: symbol or '' for symbol, type in FIGURES.items()}
+
+
+def parse_san(board: ChessBoard, san: str) -> Move:
+    """Get move of side to move by its SAN.
+
+    Raises:
+        BadMoveException if there is no such move or it's ambiguous.
+
+    """
+    match = SAN_RE.match(san)
+    if not match or match['figure'] not in FIGURES:
+        raise BadMoveException(f'Move {san!r} is not supported.')
+    type = FIGURES[match['figure']]
+    promotion = FIGURES.get(match['promotion'] or '')
+    if match['promotion'] and promotion is None:
+        raise BadMoveException(f'Promotion in {san!r} is not supported.')
+    field = board.get_field(SQUARES_BY_NAME[match['to']])
+    from_col = (match['from_col'] or '').upper()
+    from_row = match['from_row']
+    if board.is_busy(field) is not bool(match['capture']):
+        raise BadMoveException(f'Move {san!r} is not possible.')
+
+    moves = []
+    for chessman in board.get_figures(side=board.turn, type=type):
+        old_field = chessman.get_position()
+        if from_col and old_field.col != from_col:
+            continue
+        if from_row and old_field.row != from_row:
+            continue
+        if board.is_valid_move(chessman, field, promotion):
+            moves.append(Move(chessman, field, promotion))
+
+    if len(moves) != 1:
+        reason = 'ambiguous' if moves else 'not possible'
+        raise BadMoveException(f'Move {san!r} is {reason}.')
+    return moves[0]
+
+
+def get_san(board: ChessBoard, move: Move) -> str:
+    """Get SAN of move of the board.
+
+    Move is not validated, it's expected to be one of `legal_moves`.
+
+    """
+    chessman, field, promotion = move
+    type = chessman.type.__class__
+    old_field = chessman.get_position()
+    is_capture = board.is_busy(field)
+
+    origin = ''
+    if type is Pawn:
+        origin = old_field.col.lower() if is_capture else ''
+    else:
+        # other figures of the same type which can move to the field
+        others = [
+            other.get_position()
+            for other in board.get_figures(side=chessman.side, type=type)
+            if other is not chessman and board.is_valid_move(other, field)
+        ]
+        if not others:
+            origin = ''
+        elif all(other.col != old_field.col for other in others):
+            origin = old_field.col.lower()
+        elif all(other.row != old_field.row for other in others):
+            origin = old_field.row
+        else:
+            origin = repr(old_field).lower()
+    return ''.join([
+        SYMBOLS[type],
+        origin,
+        'x' if is_capture else '',
+        repr(field).lower(),
+        f'={SYMBOLS[promotion]}' if promotion else '',
+    ])
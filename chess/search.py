@@ -0,0 +1,329 @@
+"""Search of the best move.
+
+Negamax with alpha-beta pruning and transposition table, iterative
+deepening under time or nodes budget. Moves are ordered by the move from
+transposition table, captures (most valuable victim first), killer moves
+and history of cutoffs.
+
+Run `python -m chess.search FEN --time 1` to search position and print
+nodes per second and time to depth.
+
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, NamedTuple, Optional
+
+from .board import ChessBoard
+from .encoding import encode, encode_line, to_uci
+from .evaluation import evaluate
+from .move import Move
+from .transposition import TranspositionTable
+
+INFINITY = 10 ** 9
+MAX_DEPTH = 64
+KILLERS_PER_PLY = 2
+# nodes between checks of time budget
+TIME_CHECK_NODES = 1024
+
+EXACT, LOWER_BOUND, UPPER_BOUND = range(3)
+
+# from square, to square, promotion type
+MoveKey = tuple[int, int, Optional[type]]
+
+
+class Iteration(NamedTuple):
+    """Result of iteration of iterative deepening."""
+    depth: int
+    score: int
+    nodes: int
+    elapsed: float
+
+
+class SearchResult(NamedTuple):
+    """Result of search.
+
+    Attributes:
+        best_move a move to make, None if there are no moves
+        score a score of the best move for the side to move
+        pv a principal variation, the best moves of both sides
+        depth a depth of the last finished iteration
+        nodes a number of searched nodes
+        elapsed a time of search in seconds
+        iterations results of finished iterations (time to depth)
+
+    """
+    best_move: Optional[Move]
+    score: int
+    pv: list[Move]
+    depth: int
+    nodes: int
+    elapsed: float
+    iterations: list[Iteration]
+
+    @property
+    def nps(self) -> float:
+        """Get nodes per second."""
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+def get_move_key(board: ChessBoard, move: Move) -> MoveKey:
+    """Get key of move which doesn't depend on chessman object."""
+    return (
+        board.get_figure_position(move.chessman).square,
+        move.field.square,
+        move.promotion,
+    )
+
+
+class Searcher:
+    """Alpha-beta search keeping its tables between searches."""
+    def __init__(
+        self,
+        table: Optional[TranspositionTable] = None,
+        evaluate: Callable[[ChessBoard], int] = evaluate,
+    ):
+        self.table = table or TranspositionTable()
+        self.evaluate = evaluate
+        self.history: dict[MoveKey, int] = {}
+        self.killers: list[list[MoveKey]] = [[] for _ in range(MAX_DEPTH)]
+        self.nodes = 0
+        self._node_limit: Optional[int] = None
+        self._deadline: Optional[float] = None
+
+    def search(
+        self,
+        board: ChessBoard,
+        max_depth: int = MAX_DEPTH,
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None,
+        first_depth: int = 1,
+    ) -> SearchResult:
+        """Search the best move of the side to move.
+
+        Depth is increased from `first_depth` until `max_depth`,
+        `time_limit` seconds or `node_limit` nodes. Result of unfinished
+        iteration is dropped.
+
+        """
+        started = time.perf_counter()
+        self.nodes = 0
+        self._node_limit = node_limit
+        self._deadline = started + time_limit if time_limit else None
+        self.killers = [[] for _ in range(MAX_DEPTH)]
+
+        moves = list(board.legal_moves())
+        result = SearchResult(
+            best_move=moves[0] if moves else None,
+            score=self.evaluate(board),
+            pv=moves[:1],
+            depth=0,
+            nodes=0,
+            elapsed=0.0,
+            iterations=[],
+        )
+        for depth in range(first_depth, min(max_depth, MAX_DEPTH - 1) + 1):
+            try:
+                score = self._negamax(board, depth, -INFINITY, INFINITY, 0)
+            except _BudgetExceeded:
+                break
+            pv = self.get_pv(board, depth)
+            elapsed = time.perf_counter() - started
+            result = result._replace(
+                best_move=pv[0] if pv else result.best_move,
+                score=score,
+                pv=pv,
+                depth=depth,
+                iterations=[
+                    *result.iterations,
+                    Iteration(depth, score, self.nodes, elapsed),
+                ],
+            )
+            if not moves:
+                break
+        return result._replace(
+            nodes=self.nodes,
+            elapsed=time.perf_counter() - started,
+        )
+
+    def get_pv(self, board: ChessBoard, depth: int) -> list[Move]:
+        """Get principal variation from transposition table."""
+        pv = []
+        for _ in range(depth):
+            entry = self.table.lookup(board.zobrist_key)
+            move = entry and self._find_move(board, entry[2])
+            if move is None:
+                break
+            pv.append(move)
+            board.push(move)
+        for _ in pv:
+            board.pop()
+        return pv
+
+    def _find_move(
+        self,
+        board: ChessBoard,
+        key: Optional[MoveKey],
+    ) -> Optional[Move]:
+        for move in board.legal_moves():
+            if get_move_key(board, move) == key:
+                return move
+        return None
+
+    def _count_node(self):
+        self.nodes += 1
+        if self._node_limit is not None and self.nodes > self._node_limit:
+            raise _BudgetExceeded
+        if (
+            self._deadline is not None
+            and not self.nodes % TIME_CHECK_NODES
+            and time.perf_counter() > self._deadline
+        ):
+            raise _BudgetExceeded
+
+    def _order_moves(
+        self,
+        board: ChessBoard,
+        moves: list[Move],
+        tt_key: Optional[MoveKey],
+        ply: int,
+    ) -> list[tuple[Move, MoveKey, bool]]:
+        """Get moves with their keys and capture flags, the best first."""
+        killers = self.killers[ply]
+        ordered = []
+        for move in moves:
+            key = get_move_key(board, move)
+            victim = move.field.chessman
+            if key == tt_key:
+                priority = 3 * INFINITY
+            elif victim is not None:
+                priority = 2 * INFINITY + 10 * victim.type.VALUE - (
+                    move.chessman.type.VALUE
+                )
+            elif key in killers:
+                priority = INFINITY + KILLERS_PER_PLY - killers.index(key)
+            else:
+                priority = self.history.get(key, 0)
+            ordered.append((priority, move, key, victim is not None))
+        ordered.sort(key=lambda item: item[0], reverse=True)
+        return [item[1:] for item in ordered]
+
+    def _negamax(
+        self,
+        board: ChessBoard,
+        depth: int,
+        alpha: int,
+        beta: int,
+        ply: int,
+    ) -> int:
+        self._count_node()
+        entry = self.table.lookup(board.zobrist_key)
+        tt_key = None
+        if entry is not None:
+            score, flag, tt_key, entry_depth = entry
+            if entry_depth >= depth and ply:
+                if flag == EXACT:
+                    return score
+                if flag == LOWER_BOUND and score >= beta:
+                    return score
+                if flag == UPPER_BOUND and score <= alpha:
+                    return score
+
+        if depth == 0:
+            return self.evaluate(board)
+        moves = list(board.legal_moves())
+        if not moves:
+            return self.evaluate(board)
+
+        original_alpha = alpha
+        best_score, best_key = -INFINITY, None
+        for move, key, is_capture in self._order_moves(
+            board,
+            moves,
+            tt_key,
+            ply,
+        ):
+            board.push(move)
+            try:
+                score = -self._negamax(
+                    board,
+                    depth - 1,
+                    -beta,
+                    -alpha,
+                    ply + 1,
+                )
+            finally:
+                board.pop()
+            if score > best_score:
+                best_score, best_key = score, key
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                if not is_capture:
+                    self._update_quiet_cutoff(key, depth, ply)
+                break
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.table.store(
+            board.zobrist_key,
+            depth,
+            (best_score, flag, best_key, depth),
+        )
+        return best_score
+
+    def _update_quiet_cutoff(self, key: MoveKey, depth: int, ply: int):
+        """Remember quiet move which caused cutoff."""
+        self.history[key] = self.history.get(key, 0) + depth * depth
+        killers = self.killers[ply]
+        if key not in killers:
+            killers.insert(0, key)
+            del killers[KILLERS_PER_PLY:]
+
+
+def search(board: ChessBoard, **kwargs) -> SearchResult:
+    """Search the best move with a new searcher, see `Searcher.search`."""
+    return Searcher().search(board, **kwargs)
+
+
+def main(argv: Optional[list[str]] = None):
+    """Search the best move of position and print throughput."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('fen')
+    parser.add_argument('--depth', type=int, default=MAX_DEPTH)
+    parser.add_argument('--time', type=float, default=1.0)
+    parser.add_argument('--nodes', type=int)
+    args = parser.parse_args(argv)
+
+    board = ChessBoard.from_fen(args.fen)
+    result = search(
+        board,
+        max_depth=args.depth,
+        time_limit=args.time,
+        node_limit=args.nodes,
+    )
+    for iteration in result.iterations:
+        print(
+            f'depth {iteration.depth} score {iteration.score} '
+            f'nodes {iteration.nodes} time {iteration.elapsed:.3f}s'
+        )
+    # moves are printed from codes, because chessmen of moves in principal
+    # variation are in the root position
+    best_move = result.best_move and to_uci(encode(board, result.best_move))
+    pv = encode_line(board, result.pv)
+    print(
+        f'best move {best_move} pv '
+        f'{" ".join(map(to_uci, pv))} nps {result.nps:.0f}'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,456 @@
+"""Asyncio server of many game sessions.
+
+Clients talk to the server over TCP or Unix socket by JSON lines. Every
+request is an object with `op` and optional `id` which is copied to the
+response:
+    {"op": "new", "fen": ...} - start session, returns its `session` id
+    {"op": "move", "session": 1, "from": "A2", "to": "A3",
+     "promotion": "R"} - make move of side to move, returns its `ply`
+    {"op": "get", "session": 1} - get `fen` and `ply` of session
+    {"op": "subscribe", "session": 1} - receive events of session
+    {"op": "unsubscribe", "session": 1}
+    {"op": "close", "session": 1} - finish session
+    {"op": "stats"} - get a number of sessions and latency percentiles
+
+Responses have `ok` flag and `error` message if request failed. Moves
+are validated by `ChessBoard.move_figure` and applied one by one under the
+session lock, so subscribers get `move` events in order of plies. Events
+keep only changed squares (`changes`, square -> FEN symbol or null).
+
+Every connection has a bounded queue of outgoing messages. The server
+stops reading requests of a client while its queue is full, and a
+subscriber which can't keep up with events is disconnected, so slow
+clients don't slow down sessions.
+
+Run `python -m chess.server --port 8765` to serve.
+
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import time
+from collections import defaultdict, deque
+from typing import Any, Optional, Type
+
+from .board import ChessBoard
+from .exceptions import BadMoveException
+from .fen import SYMBOLS, TURN_SYMBOLS
+from .san import FIGURES
+
+START_FEN = 'r6r/pppppppp/8/8/8/8/PPPPPPPP/R6R w - - 0 1'
+DEFAULT_MAX_SESSIONS = 10000
+DEFAULT_QUEUE_SIZE = 256
+# a number of last latencies kept for every operation
+LATENCY_WINDOW = 10000
+PERCENTILES = (50, 90, 99)
+
+
+class SessionException(ValueError):
+    pass
+
+
+class LatencyStats:
+    """Latencies of last requests by operation.
+
+    Attributes:
+        window: a number of last latencies kept for every operation.
+
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.window = window
+        self._latencies: dict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=self.window),
+        )
+
+    def add(self, op: str, latency: float):
+        """Add latency of request in seconds."""
+        self._latencies[op].append(latency)
+
+    def get_percentiles(self) -> dict[str, dict[str, float]]:
+        """Get a number of requests and latency percentiles in ms."""
+        stats = {}
+        for op, latencies in self._latencies.items():
+            ordered = sorted(latencies)
+            stats[op] = {'count': len(ordered)}
+            for percentile in PERCENTILES:
+                index = min(
+                    len(ordered) - 1,
+                    len(ordered) * percentile // 100,
+                )
+                stats[op][f'p{percentile}'] = ordered[index] * 1000
+        return stats
+
+
+class Connection:
+    """Client connection with bounded queue of outgoing messages."""
+
+    def __init__(
+        self,
+        writer: asyncio.StreamWriter,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
+        self.writer = writer
+        self.queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(
+            queue_size,
+        )
+        self.subscriptions: set[int] = set()
+        self.is_closed = False
+
+    async def send(self, message: dict[str, Any]):
+        """Queue message, waiting while the queue is full."""
+        if not self.is_closed:
+            await self.queue.put(_dump(message))
+
+    def notify(self, message: dict[str, Any]) -> bool:
+        """Queue message without waiting.
+
+        Returns:
+            False if the queue is full, the connection is closed then.
+
+        """
+        if self.is_closed:
+            return False
+        try:
+            self.queue.put_nowait(_dump(message))
+        except asyncio.QueueFull:
+            self.close()
+            return False
+        return True
+
+    def close(self):
+        """Stop writing and close the connection."""
+        if self.is_closed:
+            return
+        self.is_closed = True
+        self.writer.close()
+        # let senders waiting for the full queue go
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+    async def write_messages(self):
+        """Write queued messages until the connection is closed."""
+        while True:
+            data = await self.queue.get()
+            if data is None or self.is_closed:
+                break
+            self.writer.write(data)
+            await self.writer.drain()
+
+
+class Session:
+    """Game session.
+
+    Attributes:
+        board: a position of the game.
+        ply: a number of moves made in the session.
+        lock: lock held while a move is applied and announced.
+        subscribers: connections which get events of the session.
+
+    """
+
+    def __init__(self, id: int, board: ChessBoard):
+        self.id = id
+        self.board = board
+        self.ply = 0
+        self.lock = asyncio.Lock()
+        self.subscribers: set[Connection] = set()
+
+    async def move(
+        self,
+        old_name: str,
+        new_name: str,
+        promotion: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Make move of side to move and notify subscribers.
+
+        Raises:
+            BadCoordinatesException if there is no such field.
+            BadMoveException if the move is wrong.
+
+        """
+        async with self.lock:
+            old_field = self.board[old_name]
+            new_field = self.board[new_name]
+            chessman = old_field.chessman
+            if chessman is None or chessman.side is not self.board.turn:
+                raise BadMoveException(
+                    f'There is no figure to move on {old_field}.',
+                )
+            type = None if promotion is None else FIGURES.get(promotion)
+            if promotion is not None and type is None:
+                raise BadMoveException(
+                    f'Promotion {promotion!r} is not supported.',
+                )
+            # promotion is checked against the row by the board
+            self.board.move_figure(chessman, new_field, type)
+            self.board.pass_turn()
+            self.ply += 1
+
+            event = {
+                'event': 'move',
+                'session': self.id,
+                'ply': self.ply,
+                'turn': TURN_SYMBOLS[self.board.turn],
+                'changes': {
+                    repr(old_field): None,
+                    repr(new_field): SYMBOLS[
+                        (chessman.type.__class__, chessman.side)
+                    ],
+                },
+            }
+            for connection in list(self.subscribers):
+                if not connection.notify(event):
+                    self.subscribers.discard(connection)
+            return {'ply': self.ply}
+
+
+class SessionServer:
+    """Server of game sessions.
+
+    Attributes:
+        max_sessions: a number of sessions after which new ones are
+            refused.
+        queue_size: a number of outgoing messages queued for a client.
+        latency: latencies of requests.
+
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        board_class: Type[ChessBoard] = ChessBoard,
+    ):
+        self.max_sessions = max_sessions
+        self.queue_size = queue_size
+        self.board_class = board_class
+        self.latency = LatencyStats()
+        self.sessions: dict[int, Session] = {}
+        self._ids = itertools.count(1)
+        self._server: Optional[asyncio.Server] = None
+        self._clients: dict[Connection, asyncio.Task] = {}
+
+    async def start(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        path: Optional[str] = None,
+    ) -> asyncio.Server:
+        """Start listening on TCP port or Unix socket if path is set."""
+        if path is not None:
+            self._server = await asyncio.start_unix_server(
+                self.handle_client,
+                path,
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self.handle_client,
+                host,
+                port,
+            )
+        return self._server
+
+    async def close(self):
+        """Stop listening and disconnect clients."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        clients = list(self._clients.values())
+        for connection in list(self._clients):
+            connection.close()
+        await asyncio.gather(*clients, return_exceptions=True)
+
+    async def handle_client(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        """Serve requests of client until it disconnects."""
+        connection = Connection(writer, self.queue_size)
+        self._clients[connection] = asyncio.current_task()
+        writing = asyncio.create_task(connection.write_messages())
+        try:
+            while not connection.is_closed:
+                line = await reader.readline()
+                if not line:
+                    break
+                await connection.send(await self.handle_request(
+                    line,
+                    connection,
+                ))
+        except (ConnectionError, ValueError):
+            # a line exceeds the limit of reader or client is gone
+            pass
+        finally:
+            del self._clients[connection]
+            for id in connection.subscriptions:
+                if id in self.sessions:
+                    self.sessions[id].subscribers.discard(connection)
+            if connection.is_closed or connection.queue.full():
+                writing.cancel()
+            else:
+                # write responses queued before disconnection
+                connection.queue.put_nowait(None)
+            await asyncio.gather(writing, return_exceptions=True)
+            connection.close()
+
+    async def handle_request(
+        self,
+        line: bytes,
+        connection: Optional[Connection] = None,
+    ) -> dict[str, Any]:
+        """Get response to request line."""
+        start = time.perf_counter()
+        op = 'unknown'
+        response: dict[str, Any] = {}
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise SessionException('Request must be an object.')
+            response['id'] = request.get('id')
+            handler = getattr(self, f'_handle_{request.get("op")}', None)
+            if handler is None:
+                raise SessionException(
+                    f'Operation {request.get("op")!r} is not supported.',
+                )
+            op = request['op']
+            response.update(await handler(request, connection))
+            response['ok'] = True
+        except ValueError as error:
+            response.update(ok=False, error=str(error))
+        self.latency.add(op, time.perf_counter() - start)
+        return response
+
+    def get_session(self, request: dict[str, Any]) -> Session:
+        """Get session of request.
+
+        Raises:
+            SessionException if there is no such session.
+
+        """
+        try:
+            return self.sessions[request['session']]
+        except (KeyError, TypeError):
+            raise SessionException(
+                f'There is no session {request.get("session")!r}.',
+            )
+
+    async def _handle_new(self, request, connection) -> dict[str, Any]:
+        if len(self.sessions) >= self.max_sessions:
+            raise SessionException('Too many sessions.')
+        fen = _get_string(request, 'fen', optional=True)
+        board = self.board_class.from_fen(fen or START_FEN)
+        session = Session(next(self._ids), board)
+        self.sessions[session.id] = session
+        return {'session': session.id, 'fen': board.to_fen()}
+
+    async def _handle_move(self, request, connection) -> dict[str, Any]:
+        session = self.get_session(request)
+        return await session.move(
+            _get_string(request, 'from'),
+            _get_string(request, 'to'),
+            _get_string(request, 'promotion', optional=True),
+        )
+
+    async def _handle_get(self, request, connection) -> dict[str, Any]:
+        session = self.get_session(request)
+        return {'fen': session.board.to_fen(), 'ply': session.ply}
+
+    async def _handle_subscribe(self, request, connection) -> dict[str, Any]:
+        session = self.get_session(request)
+        if connection is not None:
+            session.subscribers.add(connection)
+            connection.subscriptions.add(session.id)
+        return {'session': session.id}
+
+    async def _handle_unsubscribe(
+        self,
+        request,
+        connection,
+    ) -> dict[str, Any]:
+        session = self.get_session(request)
+        if connection is not None:
+            session.subscribers.discard(connection)
+            connection.subscriptions.discard(session.id)
+        return {'session': session.id}
+
+    async def _handle_close(self, request, connection) -> dict[str, Any]:
+        session = self.get_session(request)
+        async with session.lock:
+            del self.sessions[session.id]
+            for subscriber in session.subscribers:
+                subscriber.notify({'event': 'close', 'session': session.id})
+        return {'session': session.id}
+
+    async def _handle_stats(self, request, connection) -> dict[str, Any]:
+        return {
+            'sessions': len(self.sessions),
+            'latency': self.latency.get_percentiles(),
+        }
+
+
+def _get_string(
+    request: dict[str, Any],
+    name: str,
+    optional: bool = False,
+) -> Optional[str]:
+    """Get string field of request.
+
+    Raises:
+        SessionException if the field is not a string.
+
+    """
+    value = request.get(name)
+    if value is None and optional or isinstance(value, str):
+        return value
+    raise SessionException(f'Field {name!r} must be a string.')
+
+
+def _dump(message: dict[str, Any]) -> bytes:
+    return json.dumps(message, separators=(',', ':')).encode() + b'\n'
+
+
+async def serve(
+    host: str = '127.0.0.1',
+    port: int = 0,
+    path: Optional[str] = None,
+    **kwargs,
+):
+    """Run server forever."""
+    server = SessionServer(**kwargs)
+    listener = await server.start(host, port, path)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv: Optional[list[str]] = None):
+    """Serve game sessions."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='path of Unix socket')
+    parser.add_argument(
+        '--max-sessions',
+        type=int,
+        default=DEFAULT_MAX_SESSIONS,
+    )
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(
+            args.host,
+            args.port,
+            args.unix,
+            max_sessions=args.max_sessions,
+            queue_size=args.queue_size,
+        ))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
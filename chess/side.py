@@ -1,5 +1,10 @@
-from typing import NewType
+from typing import NewType, Type
 
 Side = NewType('Side', object)
 White = NewType('White', Side)
 Black = NewType('Black', Side)
+
+
+def get_opposite_side(side: Type[Side]) -> Type[Side]:
+    """Get side of the opponent."""
+    return Black if side is White else White
@@ -0,0 +1,86 @@
+"""Precomputed tables of squares.
+
+Squares are indexes of fields from 0 (A8) to 63 (H1), see
+`ChessField.square`. Tables are built once on import.
+
+"""
+SQUARES = range(64)
+
+# SQUARE_NAMES[square] - name of square, like `E4`
+SQUARE_NAMES: tuple[str, ...] = tuple(
+    f'{col}{row}' for row in '87654321' for col in 'ABCDEFGH'
+)
+# SQUARES_BY_NAME[name] - square by its name in upper or lower case
+SQUARES_BY_NAME: dict[str, int] = {
+    **{name: square for square, name in enumerate(SQUARE_NAMES)},
+    **{name.lower(): square for square, name in enumerate(SQUARE_NAMES)},
+}
+
+NORTH = (-1, 0)
+SOUTH = (1, 0)
+EAST = (0, 1)
+WEST = (0, -1)
+NORTH_EAST = (-1, 1)
+NORTH_WEST = (-1, -1)
+SOUTH_EAST = (1, 1)
+SOUTH_WEST = (1, -1)
+
+STRAIGHT_DIRECTIONS = (NORTH, SOUTH, EAST, WEST)
+DIAGONAL_DIRECTIONS = (NORTH_EAST, NORTH_WEST, SOUTH_EAST, SOUTH_WEST)
+DIRECTIONS = STRAIGHT_DIRECTIONS + DIAGONAL_DIRECTIONS
+
+
+def _build_ray(square: int, direction: tuple[int, int]) -> tuple[int, ...]:
+    """Get squares from square (exclusive) to the edge of the board."""
+    row, col = divmod(square, 8)
+    row_step, col_step = direction
+    ray = []
+    row, col = row + row_step, col + col_step
+    while 0 <= row < 8 and 0 <= col < 8:
+        ray.append(row * 8 + col)
+        row, col = row + row_step, col + col_step
+    return tuple(ray)
+
+
+def _to_mask(squares: tuple[int, ...]) -> int:
+    """Get bitboard of squares."""
+    mask = 0
+    for square in squares:
+        mask |= 1 << square
+    return mask
+
+
+# RAYS[direction][square] - squares ordered from square to the edge
+RAYS: dict[tuple[int, int], tuple[tuple[int, ...], ...]] = {
+    direction: tuple(_build_ray(square, direction) for square in SQUARES)
+    for direction in DIRECTIONS
+}
+
+# RAY_MASKS[direction][square] - bitboard of the ray
+RAY_MASKS: dict[tuple[int, int], tuple[int, ...]] = {
+    direction: tuple(_to_mask(ray) for ray in rays)
+    for direction, rays in RAYS.items()
+}
+
+# ROOK_MASKS[square] - bitboard of fields reachable by rook on empty board
+ROOK_MASKS: tuple[int, ...] = tuple(
+    _to_mask(sum((RAYS[d][square] for d in STRAIGHT_DIRECTIONS), ()))
+    for square in SQUARES
+)
+
+
+def _build_between() -> tuple[list[tuple[int, ...]], list[int]]:
+    """Get squares strictly between every pair of squares on one line."""
+    squares: list[tuple[int, ...]] = [()] * 64 * 64
+    masks = [0] * 64 * 64
+    for square in SQUARES:
+        for ray in (RAYS[direction][square] for direction in DIRECTIONS):
+            for index, target in enumerate(ray):
+                squares[square * 64 + target] = ray[:index]
+                masks[square * 64 + target] = _to_mask(ray[:index])
+    return squares, masks
+
+
+# BETWEEN*[old_square * 64 + new_square] - squares strictly between squares,
+# empty if the squares are not on the same row, col or diagonal
+BETWEEN_SQUARES, BETWEEN_MASKS = _build_between()
@@ -0,0 +1,87 @@
+from array import array
+from enum import Enum
+from typing import Any, Optional
+
+
+class ReplacementPolicy(Enum):
+    """Policy of replacing an entry of another position in a busy slot."""
+    ALWAYS = 'always'
+    DEPTH = 'depth'
+
+
+class TranspositionTable:
+    """Table of results for positions keyed by zobrist key.
+
+    Table has a fixed number of slots calculated from memory budget. Each
+    key has exactly one slot, so an entry of another position in the slot
+    is replaced according to the replacement policy:
+        ALWAYS - new entry always replaces the old one
+        DEPTH - new entry replaces the old one if its depth is not less
+
+    Memory budget doesn't include stored values themselves.
+
+    """
+    # key, depth and reference to the value
+    ENTRY_SIZE = 8 + 2 + 8
+    EMPTY = -1
+
+    def __init__(
+        self,
+        memory: int = 16 * 2 ** 20,
+        policy: ReplacementPolicy = ReplacementPolicy.DEPTH,
+    ):
+        """Allocate slots for the memory budget in bytes.
+
+        Raises:
+            ValueError if memory is not enough for one entry.
+
+        """
+        if memory < self.ENTRY_SIZE:
+            raise ValueError(f'Memory {memory} is not enough for table.')
+        self.size = 1 << (memory // self.ENTRY_SIZE).bit_length() - 1
+        self.policy = policy
+        self._mask = self.size - 1
+        self._keys = array('Q', bytes(8 * self.size))
+        self._depths = array('h', [self.EMPTY]) * self.size
+        self._values: list[Any] = [None] * self.size
+
+    def store(self, key: int, depth: int, value: Any) -> bool:
+        """Save value of position searched to the depth.
+
+        Returns:
+            True if value was saved
+            False if the slot is kept for another position
+
+        """
+        index = key & self._mask
+        stored_depth = self._depths[index]
+        if all([
+            stored_depth != self.EMPTY,
+            self._keys[index] != key,
+            self.policy is ReplacementPolicy.DEPTH,
+            depth < stored_depth,
+        ]):
+            return False
+        self._keys[index] = key
+        self._depths[index] = depth
+        self._values[index] = value
+        return True
+
+    def lookup(self, key: int, depth: int = 0) -> Optional[Any]:
+        """Get value of position searched at least to the depth."""
+        index = key & self._mask
+        if (
+            self._depths[index] == self.EMPTY
+            or self._keys[index] != key
+            or self._depths[index] < depth
+        ):
+            return None
+        return self._values[index]
+
+    def clear(self):
+        """Remove all entries."""
+        self._depths = array('h', [self.EMPTY]) * self.size
+        self._values = [None] * self.size
+
+    def __len__(self) -> int:
+        return self.size - self._depths.count(self.EMPTY)
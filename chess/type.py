@@ -1,104 +1,212 @@
-from typing import Iterable
+from typing import Iterator, Type
 
 from .board import ChessBoard
+from .chessman import Chessman
 from .field import ChessField
 from .interfaces import AbstractChessmanType
-from .side import White
+from .move import Move
+from .side import Side, White
+from .tables import RAYS, ROOK_MASKS, STRAIGHT_DIRECTIONS
 
 
 class Rook(AbstractChessmanType):
     """Representation of rook figure."""
-    def is_valid_move(
-        self,
-        old_field: ChessField,
-        new_field: ChessField,
+    __slots__ = ()
+    VALUE = 500
+    SQUARE_VALUES = (
+        0, 0, 0, 0, 0, 0, 0, 0,
+        5, 10, 10, 10, 10, 10, 10, 5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        0, 0, 0, 5, 5, 0, 0, 0,
+    )
+
+    @classmethod
+    def check_move(
+        cls,
+        side: Type[Side],
+        old_square: int,
+        new_square: int,
         is_capture: bool,
-        *args,
-        **kwargs,
+        first_move: bool,
+        blockers: int,
     ) -> bool:
-        """Validate move."""
-        board: ChessBoard = kwargs.get('board', None)
-        assert board, 'Provide board for this type of figure.'
-        old_field_row, old_field_col = old_field.coordinates
-        new_field_row, new_field_col = new_field.coordinates
-
-        row_field_length = old_field_row - new_field_row
-        col_field_length = old_field_col - new_field_col
-
-        # validate by cols
-        if row_field_length == 0 and col_field_length != 0:
-            row_index = old_field_row
-            slice = (
-                board.state[row_index][new_field_col: old_field_col]
-                if col_field_length > 0 else
-                board.state[row_index][old_field_col + 1: new_field_col + 1]
-            )
-
-        # validate by rows
-        if row_field_length != 0 and col_field_length == 0:
-            col_index = old_field_col
-            row_list = [row[col_index] for row in board.state]
-            slice = (
-                row_list[new_field_row: old_field_row]
-                if row_field_length > 0 else
-                row_list[old_field_row + 1: new_field_row + 1]
-            )
-
-        # there is no need to check last field if it's `capture` move
-        slice = slice[:-1] if is_capture else slice
-        return self._check_is_busy(slice)
-
-    def _check_is_busy(self, slice: Iterable[ChessField]) -> bool:
-        for item in slice:
-            if item.is_busy:
-                return False
-        return True
+        """Validate move.
+
+        Rook moves only by one row or one col and can't jump over figures.
+
+        """
+        if not ROOK_MASKS[old_square] >> new_square & 1:
+            return False
+        return not blockers
+
+    @classmethod
+    def get_attacks(
+        cls,
+        side: Type[Side],
+        square: int,
+        occupied: int,
+    ) -> int:
+        """Get squares by rows and cols until the first figure."""
+        attacks = 0
+        for direction in STRAIGHT_DIRECTIONS:
+            for target in RAYS[direction][square]:
+                attacks |= 1 << target
+                if occupied >> target & 1:
+                    break
+        return attacks
+
+    def iter_moves(
+        self,
+        chessman: Chessman,
+        old_field: ChessField,
+        board: ChessBoard,
+    ) -> Iterator[Move]:
+        """Iterate over moves by rows and cols until the first figure."""
+        for direction in STRAIGHT_DIRECTIONS:
+            for square in RAYS[direction][old_field.square]:
+                field = board.get_field(square)
+                if not board.is_busy(field):
+                    yield Move(chessman, field)
+                    continue
+                if not board.is_same_side(chessman, field):
+                    yield Move(chessman, field)
+                break
 
 
 class Pawn(AbstractChessmanType):
     """Representation of pawn figure."""
+    __slots__ = ()
     EXCHANGE_TYPES = (
         Rook,
     )
-    first_move = True
+    TRACKS_FIRST_MOVE = True
+    VALUE = 100
+    SQUARE_VALUES = (
+        0, 0, 0, 0, 0, 0, 0, 0,
+        50, 50, 50, 50, 50, 50, 50, 50,
+        10, 10, 20, 30, 30, 20, 10, 10,
+        5, 5, 10, 25, 25, 10, 5, 5,
+        0, 0, 0, 20, 20, 0, 0, 0,
+        5, -5, -10, 0, 0, -10, -5, 5,
+        5, 10, 10, -20, -20, 10, 10, 5,
+        0, 0, 0, 0, 0, 0, 0, 0,
+    )
 
-    def is_valid_move(
-        self,
-        old_field: ChessField,
-        new_field: ChessField,
+    @classmethod
+    def check_move(
+        cls,
+        side: Type[Side],
+        old_square: int,
+        new_square: int,
         is_capture: bool,
-        *args,
-        **kwargs,
+        first_move: bool,
+        blockers: int,
     ) -> bool:
         if is_capture:
-            return self._validate_capture(old_field, new_field)
-        return self._validate_move(old_field, new_field)
+            return cls._validate_capture(side, old_square, new_square)
+        return not blockers and cls._validate_move(
+            side,
+            old_square,
+            new_square,
+            first_move,
+        )
 
-    def _validate_capture(
+    def iter_moves(
         self,
+        chessman: Chessman,
         old_field: ChessField,
-        new_field: ChessField,
+        board: ChessBoard,
+    ) -> Iterator[Move]:
+        """Iterate over pawn moves and captures.
+
+        Pawn which reaches the last row is exchanged into each of
+        `EXCHANGE_TYPES`.
+
+        """
+        row, col = old_field.coordinates
+        row_step = -1 if self.side is White else 1
+
+        new_row = row + row_step
+        if not 0 <= new_row < 8:
+            return
+        promotions = self.EXCHANGE_TYPES if new_row in (0, 7) else (None,)
+
+        for new_col in (col - 1, col + 1):
+            if not 0 <= new_col < 8:
+                continue
+            field = board.squares[new_row * 8 + new_col]
+            if board.is_busy(field) and not board.is_same_side(
+                chessman,
+                field,
+            ):
+                for promotion in promotions:
+                    yield Move(chessman, field, promotion)
+
+        field = board.squares[new_row * 8 + col]
+        if board.is_busy(field):
+            return
+        for promotion in promotions:
+            yield Move(chessman, field, promotion)
+
+        new_row += row_step
+        if chessman.first_move and 0 <= new_row < 8:
+            field = board.squares[new_row * 8 + col]
+            if not board.is_busy(field):
+                promotions = (
+                    self.EXCHANGE_TYPES if new_row in (0, 7) else (None,)
+                )
+                for promotion in promotions:
+                    yield Move(chessman, field, promotion)
+
+    @classmethod
+    def get_attacks(
+        cls,
+        side: Type[Side],
+        square: int,
+        occupied: int,
+    ) -> int:
+        """Get squares which pawn can capture on."""
+        row, col = divmod(square, 8)
+        row += -1 if side is White else 1
+        if not 0 <= row < 8:
+            return 0
+        attacks = 0
+        for new_col in (col - 1, col + 1):
+            if 0 <= new_col < 8:
+                attacks |= 1 << row * 8 + new_col
+        return attacks
+
+    @classmethod
+    def _validate_capture(
+        cls,
+        side: Type[Side],
+        old_square: int,
+        new_square: int,
     ) -> bool:
         """Validate pawn capture."""
-        old_field_row, old_field_col = old_field.coordinates
-        new_field_row, new_field_col = new_field.coordinates
+        old_field_row, old_field_col = divmod(old_square, 8)
+        new_field_row, new_field_col = divmod(new_square, 8)
 
         length_of_move = old_field_row - new_field_row
         abs_length_of_move = abs(length_of_move)
 
-        if all([
+        return all([
             abs(old_field_col - new_field_col) == 1,
             abs_length_of_move == 1,
-            self._check_direction(old_field, new_field),
-        ]):
-            self.first_move = False
-            return True
-        return False
+            cls._check_direction(side, old_square, new_square),
+        ])
 
+    @classmethod
     def _validate_move(
-        self,
-        old_field: ChessField,
-        new_field: ChessField,
+        cls,
+        side: Type[Side],
+        old_square: int,
+        new_square: int,
+        first_move: bool,
     ) -> bool:
         """Validate pawn move.
 
@@ -109,31 +217,30 @@ class Pawn(AbstractChessmanType):
         Also pawn can move only one direction (up or down the board)
 
         """
-        old_field_row, old_field_col = old_field.coordinates
-        new_field_row, new_field_col = new_field.coordinates
+        old_field_row, old_field_col = divmod(old_square, 8)
+        new_field_row, new_field_col = divmod(new_square, 8)
 
         length_of_move = old_field_row - new_field_row
         abs_length_of_move = abs(length_of_move)
-        if all([
+        return all([
             # check if pawn has the same row
             old_field_col == new_field_col,
 
             # check abs length of move
             abs_length_of_move == 2 or abs_length_of_move == 1
-            if self.first_move else
+            if first_move else
             abs_length_of_move == 1,
 
             # check direction
-            self._check_direction(old_field, new_field),
-        ]):
-            self.first_move = False
-            return True
-        return False
+            cls._check_direction(side, old_square, new_square),
+        ])
 
+    @classmethod
     def _check_direction(
-        self,
-        old_field: ChessField,
-        new_field: ChessField,
+        cls,
+        side: Type[Side],
+        old_square: int,
+        new_square: int,
     ) -> bool:
         """Check direction of move.
 
@@ -147,10 +254,8 @@ class Pawn(AbstractChessmanType):
             False otherwise
 
         """
-        old_field_row, _ = old_field.coordinates
-        new_field_row, _ = new_field.coordinates
-        length_of_move = old_field_row - new_field_row
+        length_of_move = old_square // 8 - new_square // 8
 
-        if self.side is White:
+        if side is White:
             return length_of_move > 0
         return length_of_move < 0
@@ -0,0 +1,66 @@
+"""Memoised pure validation of moves.
+
+Result of move validation depends only on its arguments, so it's cached
+with LRU cache of `MEMO_SIZE` entries shared by all boards.
+
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Type
+
+from .side import Side
+
+if TYPE_CHECKING:
+    from .interfaces import AbstractChessmanType
+
+MEMO_SIZE = 2 ** 16
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def is_valid_move(
+    type: Type[AbstractChessmanType],
+    side: Type[Side],
+    old_square: int,
+    new_square: int,
+    is_capture: bool,
+    first_move: bool,
+    blockers: int,
+) -> bool:
+    """Get if the figure can move from old square to new square.
+
+    Attributes:
+        type a type of the figure
+        side a side of the figure
+        old_square a square to move from
+        new_square a square to move in
+        is_capture if there is a figure on the new square
+        first_move if the figure didn't move yet
+        blockers a mask of busy squares between old and new squares
+
+    """
+    return type.check_move(
+        side,
+        old_square,
+        new_square,
+        is_capture,
+        first_move,
+        blockers,
+    )
+
+
+def is_valid_promotion(
+    type: Type[AbstractChessmanType],
+    new_square: int,
+    promotion: Optional[Type[AbstractChessmanType]],
+) -> bool:
+    """Get if promotion fits the figure moving in the new square.
+
+    A figure with `EXCHANGE_TYPES` is exchanged into one of them when it
+    reaches the first or the last row, other moves have no promotion.
+
+    """
+    exchange_types = getattr(type, 'EXCHANGE_TYPES', ())
+    if exchange_types and new_square // 8 in (0, 7):
+        return promotion in exchange_types
+    return promotion is None
@@ -0,0 +1,42 @@
+"""Zobrist keys of chess positions.
+
+Key of position is XOR of keys of every chessman on its square, keys of
+pawns which didn't move yet and key of side to move. Keys are generated
+by seeded random, so they are the same in every process.
+
+"""
+from __future__ import annotations
+
+import random
+from functools import cache
+from typing import TYPE_CHECKING, Type
+
+from .side import Side
+
+if TYPE_CHECKING:
+    from .chessman import Chessman
+    from .interfaces import AbstractChessmanType
+
+SEED = 'chess.zobrist'
+
+_random = random.Random(f'{SEED}:common')
+TURN_KEY = _random.getrandbits(64)
+FIRST_MOVE_KEYS = tuple(_random.getrandbits(64) for _ in range(64))
+
+
+@cache
+def get_piece_keys(
+    side: Type[Side],
+    type: Type[AbstractChessmanType],
+) -> tuple[int, ...]:
+    """Get keys of figure with the side and type for all squares."""
+    piece_random = random.Random(f'{SEED}:{side.__name__}:{type.__name__}')
+    return tuple(piece_random.getrandbits(64) for _ in range(64))
+
+
+def get_chessman_key(chessman: Chessman, square: int) -> int:
+    """Get key of chessman on the square."""
+    key = get_piece_keys(chessman.side, chessman.type.__class__)[square]
+    if chessman.first_move and chessman.type.TRACKS_FIRST_MOVE:
+        key ^= FIRST_MOVE_KEYS[square]
+    return key
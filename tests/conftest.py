@@ -1,14 +1,15 @@
 import pytest
 
+from chess.bitboard import BitboardChessBoard
 from chess.board import ChessBoard
 from chess.chessman import Chessman
 from chess.side import Black, White
 from chess.type import Pawn, Rook
 
 
-@pytest.fixture
-def chess_board() -> ChessBoard:
-    return ChessBoard()
+@pytest.fixture(params=[ChessBoard, BitboardChessBoard])
+def chess_board(request: pytest.FixtureRequest) -> ChessBoard:
+    return request.param()
 
 
 @pytest.fixture
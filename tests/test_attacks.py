@@ -0,0 +1,83 @@
+import random
+
+from chess.attacks import AttackMap
+from chess.batch import evaluate_batch, to_codes
+from chess.board import ChessBoard
+from chess.side import Black, White
+
+FEN = 'r6r/pppppppp/8/8/8/8/PPPPPPPP/R6R w - - 0 1'
+
+
+def _assert_attack_map(chess_board: ChessBoard):
+    """Check attack maps are the same as built from scratch."""
+    attack_map = chess_board._get_attack_map()
+    expected = AttackMap(chess_board._positions)
+
+    assert attack_map.attacks == expected.attacks
+    assert attack_map.counts == expected.counts
+    assert attack_map.occupied == expected.occupied
+    attacked = tuple(
+        sum(chess_board.is_attacked(square, side) for square in range(64))
+        for side in (White, Black)
+    )
+    codes = to_codes([chess_board])
+    assert attacked == tuple(
+        evaluate_batch(codes, use_numpy=False)['attacks'][0]
+    )
+
+
+def test_attack_queries(chess_board: ChessBoard):
+    """Test attacked squares and attackers of square."""
+    board = chess_board.from_fen('r7/8/8/8/8/1p6/P7/R7 w - - 0 1')
+    white_pawn = board['A2'].chessman
+    white_rook = board['A1'].chessman
+    black_pawn = board['B3'].chessman
+
+    assert board.is_attacked(board['B3'].square, White)
+    assert board.is_attacked(board['A2'].square, Black)
+    assert not board.is_attacked(board['A3'].square, White)
+    assert set(board.attackers_of(board['A2'].square)) == {
+        white_rook,
+        black_pawn,
+        board['A8'].chessman,
+    }
+    assert board.attackers_of(board['B3'].square, White) == [white_pawn]
+
+    board.move_figure(white_pawn, board['B3'])
+
+    assert board.is_attacked(board['A7'].square, White)
+    assert board.attackers_of(board['A2'].square, White) == [white_rook]
+    assert set(board.attackers_of(board['A5'].square)) == {
+        board['A1'].chessman,
+        board['A8'].chessman,
+    }
+    _assert_attack_map(board)
+
+
+def test_attack_map_follows_moves(chess_board: ChessBoard):
+    """Test attack maps are updated by moves, captures and promotions."""
+    board = chess_board.from_fen(FEN)
+    moves_random = random.Random(24)
+    board.is_attacked(0, White)
+
+    for _ in range(40):
+        moves = list(board.legal_moves())
+        if not moves:
+            break
+        promotions = [move for move in moves if move.promotion]
+        board.push(moves_random.choice(promotions or moves))
+        _assert_attack_map(board)
+    while board._stack:
+        board.pop()
+        _assert_attack_map(board)
+    assert board.to_fen() == FEN
+
+
+def test_attack_map_is_lazy():
+    """Test attack maps are not kept until the first query."""
+    board = ChessBoard.from_fen(FEN)
+    board.push(next(board.legal_moves()))
+
+    assert board._attack_map is None
+    assert board.is_attacked(board['A3'].square, White)
+    _assert_attack_map(board)
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from chess import batch
+from chess.board import ChessBoard
+from chess.side import Black, White
+
+FENS = (
+    'r6r/pp6/8/8/4P3/8/P7/R6R b - - 0 1',
+    '8/8/8/8/8/8/8/8 w - - 0 1',
+    '1r6/P7/8/3p4/8/8/6PP/7R w - - 0 1',
+    'rr6/pppppppp/8/8/8/8/PPPPPPPP/RR6 w - - 0 1',
+    '8/p7/P7/8/2r5/2pR4/8/7r b - - 0 1',
+)
+
+
+def _random_codes(count: int) -> list[bytearray]:
+    """Get random positions as rows of figure codes."""
+    generator = random.Random(19)
+    rows = []
+    for _ in range(count):
+        row = bytearray(64)
+        for square in generator.sample(range(64), generator.randint(0, 20)):
+            row[square] = generator.choice((1, 2, 9, 10))
+        rows.append(row)
+    return rows
+
+
+def test_evaluate_batch_python():
+    """Test features are the same as ones of boards."""
+    boards = [ChessBoard.from_fen(fen) for fen in FENS]
+
+    features = batch.evaluate_batch(batch.to_codes(boards), use_numpy=False)
+
+    for index, board in enumerate(boards):
+        assert features['material'][index] == (
+            board.material[White], board.material[Black],
+        )
+        assert features['mobility'][index] == (
+            len(list(board.legal_moves(White))),
+            len(list(board.legal_moves(Black))),
+        )
+    assert features['attacks'][1] == (0, 0)
+    assert features['attacks'][2] == (12, 16)
+
+
+@pytest.mark.skipif(batch.np is None, reason='NumPy is not installed')
+@pytest.mark.parametrize('batch_size', (1, 7, batch.DEFAULT_BATCH_SIZE))
+def test_evaluate_batch_numpy(batch_size: int):
+    """Test vectorized features are the same as pure Python ones."""
+    boards = [ChessBoard.from_fen(fen) for fen in FENS]
+    codes = [bytearray(row) for row in batch.to_codes(boards)]
+    codes += _random_codes(50)
+
+    expected = batch.evaluate_batch(codes, use_numpy=False)
+    features = batch.evaluate_batch(codes, batch_size, use_numpy=True)
+
+    for name in batch.FEATURES:
+        assert features[name].shape == (len(codes), 2)
+        assert list(map(tuple, features[name].tolist())) == expected[name]
+
+
+@pytest.mark.skipif(batch.np is None, reason='NumPy is not installed')
+def test_evaluate_batch_empty():
+    """Test no positions are evaluated to empty arrays."""
+    features = batch.evaluate_batch(batch.to_codes([]))
+
+    assert all(features[name].shape == (0, 2) for name in batch.FEATURES)
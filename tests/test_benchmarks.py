@@ -0,0 +1,29 @@
+from benchmarks.cases import CASES, generate_game
+from benchmarks.run import compare
+
+
+def test_cases_run():
+    """Test every benchmark case can be run."""
+    for case in CASES.values():
+        case()()
+
+
+def test_generated_game_is_reproducible():
+    """Test random game is the same for the same seed."""
+    assert generate_game() == generate_game()
+    assert generate_game(seed=1) != generate_game(seed=2)
+
+
+def test_compare():
+    """Test benchmarks slower than baseline by threshold are reported."""
+    baseline = {'benchmarks': {'fast': {'ns': 100}, 'slow': {'ns': 100}}}
+    results = {'benchmarks': {
+        'fast': {'ns': 105},
+        'slow': {'ns': 120},
+        'new': {'ns': 1000},
+    }}
+
+    regressions = compare(results, baseline, threshold=0.1)
+
+    assert [regression.name for regression in regressions] == ['slow']
+    assert regressions[0].ratio == 1.2
@@ -0,0 +1,33 @@
+from chess.bitboard import BitboardChessBoard
+from chess.chessman import Chessman
+from chess.side import Black, White
+from chess.type import Pawn, Rook
+
+
+def test_bitboards_follow_moves():
+    """Test bitboards are updated on move and capture."""
+    chess_board = BitboardChessBoard()
+    rook = Chessman(chessman_type=Rook, side=Black, chess_board=chess_board)
+    pawn = Chessman(chessman_type=Pawn, side=White, chess_board=chess_board)
+    chess_board.state[0][0].chessman = rook
+    chess_board.state[4][0].chessman = pawn
+
+    assert chess_board.bitboards.occupied == 1 << 0 | 1 << 32
+
+    chess_board.move_figure(rook, chess_board.state[4][0])
+
+    assert chess_board.bitboards.occupied == 1 << 32
+    assert chess_board.bitboards.get_figures(Black, Rook) == 1 << 32
+    assert chess_board.bitboards.get_figures(White, Pawn) == 0
+
+
+def test_bitboards_follow_exchange():
+    """Test bitboards are updated on pawn exchange."""
+    chess_board = BitboardChessBoard()
+    pawn = Chessman(chessman_type=Pawn, side=White, chess_board=chess_board)
+    chess_board.state[1][0].chessman = pawn
+
+    chess_board.exchange_pawn(pawn, chess_board.state[0][0], Rook)
+
+    assert chess_board.bitboards.get_figures(White, Rook) == 1
+    assert chess_board.bitboards.get_figures(White, Pawn) == 0
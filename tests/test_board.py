@@ -0,0 +1,135 @@
+import pytest
+
+from chess.board import ChessBoard
+from chess.chessman import Chessman
+from chess.exceptions import (
+    BadCoordinatesException,
+    FigureIsCapturedException,
+)
+from chess.side import Black, White
+from chess.type import Pawn, Rook
+
+
+def test_figure_position_follows_moves(
+    chess_board: ChessBoard,
+    chessman_black_rook: Chessman,
+):
+    """Test board index is updated on move."""
+    chess_board.state[0][0].chessman = chessman_black_rook
+    assert chessman_black_rook.get_position() is chess_board.state[0][0]
+
+    chess_board.move_figure(chessman_black_rook, chess_board.state[0][5])
+
+    assert chessman_black_rook.get_position() is chess_board.state[0][5]
+    assert chess_board.state[0][0].chessman is None
+
+
+def test_captured_figure_has_no_position(
+    chess_board: ChessBoard,
+    chessman_black_rook: Chessman,
+    chessman_white_pawn: Chessman,
+):
+    """Test captured figure is removed from board index."""
+    chess_board.state[0][0].chessman = chessman_black_rook
+    chess_board.state[4][0].chessman = chessman_white_pawn
+
+    chess_board.move_figure(chessman_black_rook, chess_board.state[4][0])
+
+    with pytest.raises(FigureIsCapturedException):
+        chessman_white_pawn.get_position()
+    assert list(chess_board.get_figures(side=White)) == []
+
+
+def test_go_to_position_releases_previous_field(
+    chess_board: ChessBoard,
+    chessman_black_pawn: Chessman,
+):
+    """Test chessman occupies only one field."""
+    chessman_black_pawn.go_to_position(chess_board.state[1][1])
+    chessman_black_pawn.go_to_position(chess_board.state[2][2])
+
+    assert chess_board.state[1][1].chessman is None
+    assert chessman_black_pawn.get_position() is chess_board.state[2][2]
+
+
+def test_get_figures_by_side_and_type(
+    chess_board: ChessBoard,
+    chessman_black_rook: Chessman,
+    chessman_black_pawn: Chessman,
+    chessman_white_pawn: Chessman,
+):
+    """Test iteration over figures filtered by side and type."""
+    chess_board.state[0][0].chessman = chessman_black_rook
+    chess_board.state[1][1].chessman = chessman_black_pawn
+    chess_board.state[6][1].chessman = chessman_white_pawn
+
+    assert list(chess_board.get_figures(side=Black, type=Rook)) == [
+        chessman_black_rook,
+    ]
+    assert list(chess_board.get_figures(type=Pawn)) == [
+        chessman_black_pawn,
+        chessman_white_pawn,
+    ]
+
+
+def test_exchanged_pawn_is_indexed_by_new_type(
+    chess_board: ChessBoard,
+    chessman_white_pawn: Chessman,
+):
+    """Test exchange of pawn updates type index."""
+    chess_board.state[1][0].chessman = chessman_white_pawn
+    chess_board.exchange_pawn(
+        chessman_white_pawn,
+        chess_board.state[0][0],
+        Rook,
+    )
+
+    assert list(chess_board.get_figures(side=White, type=Pawn)) == []
+    assert list(chess_board.get_figures(side=White, type=Rook)) == [
+        chessman_white_pawn,
+    ]
+
+
+def test_get_field_by_square_and_name(chess_board: ChessBoard):
+    """Test fields are found by square index and name."""
+    field = chess_board['E4']
+
+    assert repr(field) == 'E4'
+    assert chess_board['e4'] is chess_board[field.square] is field
+    assert chess_board.state[4][4] is field
+    assert chess_board.get_field(field.square) is field
+
+
+@pytest.mark.parametrize('key', ('E9', 'e', '', 64, -1))
+def test_get_wrong_field(chess_board: ChessBoard, key):
+    """Test there are no fields out of the board."""
+    with pytest.raises(BadCoordinatesException):
+        chess_board[key]
+
+
+def test_rows_and_cols(chess_board: ChessBoard):
+    """Test rows and cols are made of the same fields."""
+    row = chess_board.get_row(4)
+    col = chess_board.get_col(4)
+
+    assert row == chess_board.state[4]
+    assert [repr(field) for field in row] == [
+        f'{name}4' for name in 'ABCDEFGH'
+    ]
+    assert [repr(field) for field in col] == [
+        f'E{name}' for name in '87654321'
+    ]
+    assert row[4] is col[4] is chess_board['E4']
+
+
+def test_move_figure_not_on_board(
+    chess_board: ChessBoard,
+    chessman_black_rook: Chessman,
+):
+    """Test chessman which is not on the board can't move."""
+    assert not chess_board.is_valid_move(
+        chessman_black_rook,
+        chess_board['A1'],
+    )
+    with pytest.raises(FigureIsCapturedException):
+        chess_board.move_figure(chessman_black_rook, chess_board['A1'])
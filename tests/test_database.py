@@ -0,0 +1,89 @@
+import pytest
+
+from chess.board import ChessBoard
+from chess.database import PositionDatabase, PositionDatabaseWriter
+from chess.exceptions import PositionDatabaseException
+
+FEN = 'r6r/pp6/8/8/8/8/PP6/R6R w - - 0 1'
+
+
+def _get_positions() -> list[ChessBoard]:
+    board = ChessBoard.from_fen(FEN)
+    positions = [ChessBoard.from_fen(FEN)]
+    for move in list(board.legal_moves()):
+        board.push(move)
+        positions.append(ChessBoard.from_bytes(board.to_bytes()))
+        board.pop()
+    return positions
+
+
+def test_database_lookup(tmp_path):
+    """Test payloads of written positions are found."""
+    path = tmp_path / 'positions.db'
+    positions = _get_positions()
+    with PositionDatabaseWriter(path, capacity=64) as writer:
+        for index, board in enumerate(positions):
+            writer.add(board, f'payload {index}'.encode())
+
+    with PositionDatabase(path) as database:
+        assert len(database) == len(positions)
+        for index, board in enumerate(positions):
+            assert database.get(board) == f'payload {index}'.encode()
+        assert ChessBoard() not in database
+        assert len(list(database)) == len(positions)
+
+
+def test_database_append(tmp_path):
+    """Test positions are appended to existing database."""
+    path = tmp_path / 'positions.db'
+    first, second, *_ = _get_positions()
+    with PositionDatabaseWriter(path, capacity=8) as writer:
+        writer.add(first, b'first')
+    with PositionDatabaseWriter(path) as writer:
+        writer.add(second, b'second')
+        writer.add(first, b'replaced')
+
+    with PositionDatabase(path) as database:
+        assert len(database) == 2
+        assert database.get(first) == b'replaced'
+        assert database.get(second) == b'second'
+
+
+def test_database_collisions(tmp_path):
+    """Test positions with the same slot are found by probing."""
+    path = tmp_path / 'positions.db'
+    positions = _get_positions()[:6]
+    with PositionDatabaseWriter(path, capacity=8) as writer:
+        for board in positions:
+            writer.add(board, board.to_fen().encode())
+        with pytest.raises(PositionDatabaseException):
+            writer.add(ChessBoard(), b'')
+
+    with PositionDatabase(path) as database:
+        for board in positions:
+            assert database.get(board) == board.to_fen().encode()
+
+
+def test_database_wrong_file(tmp_path):
+    """Test file which is not a database."""
+    path = tmp_path / 'positions.db'
+    path.write_bytes(b'not a database' * 10)
+
+    with pytest.raises(PositionDatabaseException):
+        PositionDatabase(path)
+    with pytest.raises(PositionDatabaseException):
+        PositionDatabaseWriter(tmp_path / 'other.db', capacity=10)
+
+
+@pytest.mark.parametrize('size', [0, 10, 24, 100])
+def test_database_truncated_file(tmp_path, size):
+    """Test empty file and file with truncated header or index."""
+    path = tmp_path / 'positions.db'
+    with PositionDatabaseWriter(path, capacity=64) as writer:
+        writer.add(ChessBoard.from_fen(FEN))
+    path.write_bytes(path.read_bytes()[:size])
+
+    with pytest.raises(PositionDatabaseException):
+        PositionDatabase(path)
+    with pytest.raises(PositionDatabaseException):
+        PositionDatabaseWriter(path)
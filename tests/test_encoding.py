@@ -0,0 +1,83 @@
+import pytest
+
+from chess.board import ChessBoard
+from chess.encoding import (
+    decode,
+    decode_move,
+    encode,
+    encode_line,
+    encode_move,
+    parse_uci,
+    to_uci,
+)
+from chess.exceptions import BadMoveException
+from chess.san import get_san, parse_san
+from chess.type import Rook
+
+FENS = (
+    'r6r/pppppppp/8/8/8/8/PPPPPPPP/R6R w - - 0 1',
+    '1r6/P7/8/3p4/8/8/6PP/7R w - - 0 1',
+    'r6r/pp6/8/8/4P3/8/P7/R6R b - - 0 1',
+    'R6R/8/8/8/8/8/8/R6R w - - 0 1',
+)
+
+
+def test_encode_move():
+    """Test move is packed into 16 bits."""
+    code = encode_move(8, 0, Rook)
+
+    assert code < 2 ** 16
+    assert decode_move(code) == (8, 0, Rook)
+    assert to_uci(code) == 'a7a8r'
+    assert parse_uci('a7a8r') == code
+    assert decode_move(parse_uci('e2e4')) == (52, 36, None)
+
+
+@pytest.mark.parametrize('uci', ('e2', 'e2e9', 'e2e4q', 'E2E4'))
+def test_parse_wrong_uci(uci: str):
+    """Test wrong UCI notation raises."""
+    with pytest.raises(BadMoveException):
+        parse_uci(uci)
+
+
+@pytest.mark.parametrize('fen', FENS)
+def test_moves_round_trip(fen: str):
+    """Test codes and SAN of all moves are converted back to moves."""
+    chess_board = ChessBoard.from_fen(fen)
+
+    for move in chess_board.legal_moves():
+        assert decode(chess_board, encode(chess_board, move)) == move
+        assert parse_san(chess_board, get_san(chess_board, move)) == move
+
+
+def test_get_san():
+    """Test SAN of captures, promotions and ambiguous moves."""
+    chess_board = ChessBoard.from_fen('1r6/P7/8/3p4/4P3/8/8/R6R w - - 0 1')
+    moves = {
+        get_san(chess_board, move): move
+        for move in chess_board.legal_moves()
+    }
+
+    assert {'axb8=R', 'a8=R', 'exd5', 'e5', 'Rab1', 'Rhb1', 'Ra2'} <= set(
+        moves,
+    )
+
+
+def test_encode_line():
+    """Test codes of moves of the same chessman in principal variation."""
+    chess_board = ChessBoard.from_fen(FENS[0])
+    rook = chess_board.get_field(56).chessman
+    moves = [(56, 48), (0, 8), (48, 40)]
+
+    line = []
+    for old_square, new_square in moves:
+        line.append(decode(chess_board, encode_move(old_square, new_square)))
+        chess_board.push(line[-1])
+    for _ in moves:
+        chess_board.pop()
+
+    assert line[0].chessman is line[2].chessman is rook
+    assert ' '.join(map(to_uci, encode_line(chess_board, line))) == (
+        'a1a2 a8a7 a2a3'
+    )
+    assert chess_board.to_fen() == FENS[0]
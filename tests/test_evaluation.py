@@ -0,0 +1,34 @@
+from chess.board import ChessBoard
+from chess.evaluation import evaluate_from_scratch
+from chess.side import White
+
+
+def test_incremental_evaluation():
+    """Test scores kept by board equal scores calculated from scratch."""
+    board = ChessBoard.from_fen('r6r/1ppppppp/8/8/8/8/P1PPPPPP/R6R b - - 0 1')
+    score = board.evaluate()
+    assert score == evaluate_from_scratch(board)
+
+    def walk(depth: int):
+        for move in list(board.legal_moves()):
+            board.push(move)
+            assert board.evaluate() == evaluate_from_scratch(board)
+            if depth > 1:
+                walk(depth - 1)
+            board.pop()
+
+    walk(2)
+    assert board.evaluate() == score
+
+
+def test_evaluation_of_exchange():
+    """Test pawn exchange changes material."""
+    board = ChessBoard.from_fen('8/P7/8/8/8/8/8/8 w - - 0 1')
+    assert board.material[White] == 100
+
+    board.push(next(board.legal_moves()))
+
+    assert board.material[White] == 500
+    assert board.evaluate() == evaluate_from_scratch(board)
+    board.pop()
+    assert board.material[White] == 100
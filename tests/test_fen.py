@@ -0,0 +1,93 @@
+import io
+
+import pytest
+
+from chess.bitboard import BitboardChessBoard
+from chess.board import ChessBoard
+from chess.exceptions import FENException
+from chess.fen import iter_epd
+from chess.side import Black, White
+from chess.type import Pawn, Rook
+
+FEN = 'r6r/pp6/8/8/4P3/8/P7/R6R b - - 0 12'
+
+
+def test_from_fen():
+    """Test figures are placed from FEN."""
+    chess_board = ChessBoard.from_fen(FEN)
+
+    assert chess_board.turn is Black
+    assert len(list(chess_board.get_figures(side=White, type=Rook))) == 2
+    assert len(list(chess_board.get_figures(side=Black, type=Pawn))) == 2
+    assert chess_board.state[4][4].chessman.side is White
+    # pawn out of its start row already moved
+    assert not chess_board.state[4][4].chessman.first_move
+    assert chess_board.state[6][0].chessman.first_move
+
+
+def test_to_fen():
+    """Test FEN export keeps placement and side to move."""
+    chess_board = BitboardChessBoard.from_fen(FEN)
+
+    assert isinstance(chess_board, BitboardChessBoard)
+    assert chess_board.to_fen() == 'r6r/pp6/8/8/4P3/8/P7/R6R b - - 0 1'
+    assert ChessBoard().to_fen() == '8/8/8/8/8/8/8/8 w - - 0 1'
+
+
+@pytest.mark.parametrize('board_class', [ChessBoard, BitboardChessBoard])
+def test_zobrist_key_of_fen_position(board_class: type[ChessBoard]):
+    """Test position from FEN has the same key as position made by moves."""
+    chess_board = board_class.from_fen(FEN)
+    for _ in range(3):
+        chess_board.push(next(chess_board.legal_moves()))
+
+    assert ChessBoard.from_fen(chess_board.to_fen()).zobrist_key == (
+        chess_board.zobrist_key
+    )
+
+
+@pytest.mark.parametrize('fen', [
+    '8/8/8/8/8/8/8 w - - 0 1',
+    '9/8/8/8/8/8/8/8 w - - 0 1',
+    'n7/8/8/8/8/8/8/8 w - - 0 1',
+    '8/8/8/8/8/8/8/8 x - - 0 1',
+    '8/8/8/8/8/8/8/8 w KQkq - 0 1',
+    '8/8/8/8/8/8/8/8 w - - zero 1',
+    '8/8/8/8/8/8/8/8 w - - 0 1 2',
+    '8/8/8/8/8/8/8/8 w - - 0',
+    '8/8/8/8/8/8/8/8 w - - \u00b2 1',
+    '\u00b2/8/8/8/8/8/8/8 w - - 0 1',
+    '08/8/8/8/8/8/8/8 w - - 0 1',
+])
+def test_wrong_fen(fen: str):
+    """Test wrong or unsupported FEN."""
+    with pytest.raises(FENException):
+        ChessBoard.from_fen(fen)
+
+
+def test_iter_epd():
+    """Test positions and operations are read line by line."""
+    file = io.StringIO(
+        '8/8/8/8/8/8/P7/8 w - - bm a3; id "test; one";\n'
+        '\n'
+        '8/p7/8/8/8/8/8/8 b - - 3 7\n'
+    )
+
+    (first_board, first_operations), (second_board, second_operations) = (
+        iter_epd(file)
+    )
+
+    assert first_operations == {'bm': 'a3', 'id': 'test; one'}
+    assert first_board.turn is White
+    assert second_operations == {'hmvc': '3', 'fmvn': '7'}
+    assert second_board.to_fen() == '8/p7/8/8/8/8/8/8 b - - 0 1'
+
+
+def test_iter_epd_from_path(tmp_path):
+    """Test positions are read from file by path."""
+    path = tmp_path / 'positions.epd'
+    path.write_text(f'{FEN}\n' * 3)
+
+    assert [board.to_fen() for board, _ in iter_epd(path)] == [
+        'r6r/pp6/8/8/4P3/8/P7/R6R b - - 0 1',
+    ] * 3
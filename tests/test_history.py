@@ -0,0 +1,80 @@
+import pytest
+
+from chess.board import ChessBoard
+from chess.encoding import decode, encode_move, parse_uci
+from chess.exceptions import BadMoveException
+from chess.history import GameHistory
+
+FEN = 'r6r/pppppppp/8/8/8/8/PPPPPPPP/R6R w - - 0 1'
+# rooks go back and forth, so the start position is repeated
+SHUFFLE = ('a1b1', 'a8b8', 'b1a1', 'b8a8') * 2
+
+
+def _play(chess_board: ChessBoard, moves: tuple[str, ...]) -> GameHistory:
+    history = GameHistory.from_board(chess_board)
+    for uci in moves:
+        history.push(chess_board, decode(chess_board, parse_uci(uci)))
+    return history
+
+
+def test_repetition():
+    """Test repetitions are found by keys of positions."""
+    chess_board = ChessBoard.from_fen(FEN)
+
+    history = _play(chess_board, ('a2a3',) + SHUFFLE)
+
+    assert history.count_repetitions() == 3
+    assert history.is_repetition()
+    assert history.count_repetitions(5) == 2
+    assert history.count_repetitions(2) == 1
+    assert history.count_repetitions(0) == 1
+
+    history.pop(chess_board)
+    assert not history.is_repetition()
+    assert history.count_repetitions() == 2
+
+
+def test_serialization():
+    """Test history takes two bytes per move and is replayed."""
+    chess_board = ChessBoard.from_fen(FEN)
+    history = _play(chess_board, ('a2a4', 'h7h5') + SHUFFLE)
+
+    data = history.to_bytes()
+    replayed_board = ChessBoard.from_fen(FEN)
+    replayed = GameHistory.from_bytes(replayed_board, data)
+
+    assert len(data) == 2 * len(history) == 20
+    assert list(replayed) == list(history)
+    assert replayed.keys == history.keys
+    assert replayed_board.to_fen() == chess_board.to_fen()
+    assert data[:2] == encode_move(48, 32).to_bytes(2, 'little')
+
+
+@pytest.mark.parametrize('data', [
+    encode_move(48, 24).to_bytes(2, 'little'),  # a2a5
+    encode_move(8, 56).to_bytes(2, 'little'),  # a7a1
+    encode_move(8, 16).to_bytes(2, 'little'),  # a7a6 on White's turn
+    encode_move(48, 40).to_bytes(2, 'little')
+    + encode_move(48, 40).to_bytes(2, 'little'),  # a2a3 a2a3
+    encode_move(40, 32).to_bytes(2, 'little'),  # no figure on a3
+    b'\xff\xff',  # unknown promotion
+    b'\x30',
+])
+def test_wrong_serialized_moves(data):
+    """Test wrong moves are not replayed and the board is unchanged."""
+    chess_board = ChessBoard.from_fen(FEN)
+
+    with pytest.raises(BadMoveException):
+        GameHistory.from_bytes(chess_board, data)
+    assert chess_board.to_fen() == FEN
+
+
+def test_notation():
+    """Test moves are converted to UCI and SAN."""
+    chess_board = ChessBoard.from_fen(FEN)
+    history = _play(chess_board, ('a2a4', 'h7h5', 'a1a3'))
+    start_board = ChessBoard.from_fen(FEN)
+
+    assert history.to_uci() == 'a2a4 h7h5 a1a3'
+    assert history.to_san(start_board) == ['a4', 'h5', 'Ra3']
+    assert start_board.to_fen() == FEN
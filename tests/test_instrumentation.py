@@ -0,0 +1,69 @@
+import pytest
+
+from chess import instrumentation
+from chess.board import ChessBoard
+from chess.chessman import Chessman
+from chess.type import Pawn, Rook
+
+
+@pytest.fixture(autouse=True)
+def disable_instrumentation():
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_instrumentation_is_disabled_by_default():
+    """Test there are no wrappers when instrumentation is disabled."""
+    original = ChessBoard.try_move
+
+    instrumentation.enable()
+    assert ChessBoard.try_move is not original
+    assert 'is_valid_move' in vars(Rook)
+
+    instrumentation.disable()
+    assert ChessBoard.try_move is original
+    assert 'is_valid_move' not in vars(Rook)
+
+
+def test_capture(
+    chess_board: ChessBoard,
+    chessman_black_rook: Chessman,
+    chessman_black_pawn: Chessman,
+):
+    """Test stats of methods called in the block."""
+    board_name = chess_board.__class__.__name__
+    chess_board.state[0][0].chessman = chessman_black_rook
+    chess_board.state[1][1].chessman = chessman_black_pawn
+
+    with instrumentation.capture() as stats:
+        chess_board.move_figure(chessman_black_rook, chess_board.state[0][5])
+        chess_board.move_figure(chessman_black_rook, chess_board.state[5][5])
+        chess_board.move_figure(chessman_black_pawn, chess_board.state[2][1])
+
+    assert not instrumentation.is_enabled()
+    assert stats['ChessBoard.try_move'].calls == 3
+    assert stats['Rook.is_valid_move'].calls == 2
+    assert stats['Pawn.is_valid_move'].calls == 1
+    assert stats[f'{board_name}.get_blockers'].calls == 3
+    assert stats['ChessBoard.try_move'].total_ns >= (
+        stats['Rook.is_valid_move'].total_ns
+    )
+    assert stats['Pawn.is_valid_move'].mean_ns > 0
+
+
+def test_get_stats_and_reset(
+    chess_board: ChessBoard,
+    chessman_white_pawn: Chessman,
+):
+    """Test stats are kept until reset."""
+    chess_board.state[6][0].chessman = chessman_white_pawn
+    instrumentation.enable()
+    chess_board.move_figure(chessman_white_pawn, chess_board.state[5][0])
+    instrumentation.disable()
+    chess_board.move_figure(chessman_white_pawn, chess_board.state[4][0])
+
+    assert instrumentation.get_stats()['ChessBoard.try_move'].calls == 1
+    instrumentation.reset()
+    assert instrumentation.get_stats() == {}
+    assert isinstance(chessman_white_pawn.type, Pawn)
@@ -0,0 +1,51 @@
+import tracemalloc
+
+from chess.board import ChessBoard
+from chess.chessman import Chessman
+from chess.side import Black, White
+from chess.type import Pawn, Rook
+
+BOARDS_COUNT = 100
+# memory allocated for empty board
+BOARD_MEMORY_LIMIT = 7 * 1024
+
+
+def test_board_memory(chess_board: ChessBoard):
+    """Test memory allocated for one board."""
+    board_class = chess_board.__class__
+    tracemalloc.start()
+    try:
+        boards = [board_class() for _ in range(BOARDS_COUNT)]
+        memory, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(boards) == BOARDS_COUNT
+    assert memory / BOARDS_COUNT < BOARD_MEMORY_LIMIT
+
+
+def test_objects_have_no_dict(
+    chess_board: ChessBoard,
+    chessman_black_pawn: Chessman,
+):
+    """Test boards, fields, chessmans and types use slots."""
+    for item in (
+        chess_board,
+        chess_board.state[0][0],
+        chessman_black_pawn,
+        chessman_black_pawn.type,
+    ):
+        assert not hasattr(item, '__dict__')
+
+
+def test_types_are_shared(
+    chess_board: ChessBoard,
+    chessman_black_pawn: Chessman,
+    chessman_another_black_pawn: Chessman,
+    chessman_white_pawn: Chessman,
+):
+    """Test chessmans with the same type and side share type instance."""
+    assert chessman_black_pawn.type is chessman_another_black_pawn.type
+    assert chessman_black_pawn.type is not chessman_white_pawn.type
+    assert Rook.get_instance(White) is Rook.get_instance(White)
+    assert Pawn.get_instance(Black) is chessman_black_pawn.type
@@ -0,0 +1,177 @@
+from chess.board import ChessBoard
+from chess.chessman import Chessman
+from chess.side import Black, White
+from chess.type import Pawn, Rook
+
+
+def test_rook_legal_moves_on_empty_board(
+    chess_board: ChessBoard,
+    chessman_black_rook: Chessman,
+):
+    """Test rook reaches whole row and col."""
+    chess_board.state[3][3].chessman = chessman_black_rook
+
+    fields = {move.field for move in chessman_black_rook.legal_moves()}
+
+    assert len(fields) == 14
+    assert all(
+        chess_board.state[3][3].coordinates[0] == field.coordinates[0]
+        or chess_board.state[3][3].coordinates[1] == field.coordinates[1]
+        for field in fields
+    )
+
+
+def test_rook_legal_moves_stop_at_figures(
+    chess_board: ChessBoard,
+    chessman_black_rook: Chessman,
+    chessman_another_black_rook: Chessman,
+    chessman_white_pawn: Chessman,
+):
+    """Test rook captures enemy figure and doesn't capture own figure."""
+    chess_board.state[0][0].chessman = chessman_black_rook
+    chess_board.state[0][2].chessman = chessman_another_black_rook
+    chess_board.state[3][0].chessman = chessman_white_pawn
+
+    fields = {move.field for move in chessman_black_rook.legal_moves()}
+
+    assert fields == {
+        chess_board.state[0][1],
+        chess_board.state[1][0],
+        chess_board.state[2][0],
+        chess_board.state[3][0],
+    }
+
+
+def test_pawn_legal_moves(
+    chess_board: ChessBoard,
+    chessman_white_pawn: Chessman,
+    chessman_black_pawn: Chessman,
+):
+    """Test pawn moves on one or two fields and captures by diagonal."""
+    chess_board.state[6][4].chessman = chessman_white_pawn
+    chess_board.state[5][5].chessman = chessman_black_pawn
+
+    fields = {move.field for move in chessman_white_pawn.legal_moves()}
+
+    assert fields == {
+        chess_board.state[5][4],
+        chess_board.state[4][4],
+        chess_board.state[5][5],
+    }
+
+
+def test_pawn_legal_moves_with_exchange(
+    chess_board: ChessBoard,
+    chessman_white_pawn: Chessman,
+):
+    """Test pawn on the last row is exchanged."""
+    chess_board.state[1][0].chessman = chessman_white_pawn
+
+    moves = list(chessman_white_pawn.legal_moves())
+
+    assert [(move.field, move.promotion) for move in moves] == [
+        (chess_board.state[0][0], Rook),
+    ]
+
+
+def _set_up_position(chess_board: ChessBoard):
+    for row, col, side, type in (
+        (7, 0, White, Rook),
+        (6, 1, White, Pawn),
+        (1, 1, Black, Pawn),
+        (0, 7, Black, Rook),
+    ):
+        chess_board.state[row][col].chessman = Chessman(
+            chessman_type=type,
+            side=side,
+            chess_board=chess_board,
+        )
+
+
+def test_legal_moves_are_valid(chess_board: ChessBoard):
+    """Test every generated move can be made by `move_figure`."""
+    _set_up_position(chess_board)
+
+    for side in (White, Black):
+        moves_count = len(list(chess_board.legal_moves(side)))
+        for index in range(moves_count):
+            board = chess_board.__class__()
+            _set_up_position(board)
+            move = list(board.legal_moves(side))[index]
+            board.move_figure(move.chessman, move.field)
+
+
+def test_push_and_pop(chess_board: ChessBoard):
+    """Test move taken back restores the board."""
+    _set_up_position(chess_board)
+    fields = [
+        (field, field.chessman) for row in chess_board.state for field in row
+    ]
+    statuses = [chessman.status for _, chessman in fields if chessman]
+
+    for move in list(chess_board.legal_moves()):
+        chess_board.push(move)
+        assert chess_board.turn is Black
+        for reply in list(chess_board.legal_moves()):
+            chess_board.push(reply)
+            chess_board.pop()
+        assert chess_board.pop() is move
+        assert chess_board.turn is White
+
+    assert [(field, field.chessman) for field, _ in fields] == fields
+    assert [chessman.status for _, chessman in fields if chessman] == (
+        statuses
+    )
+
+
+def test_pop_restores_capture_and_exchange(
+    chess_board: ChessBoard,
+    chessman_white_pawn: Chessman,
+    chessman_black_rook: Chessman,
+):
+    """Test pop restores captured figure and type of exchanged pawn."""
+    chess_board.state[1][0].chessman = chessman_white_pawn
+    chess_board.state[0][1].chessman = chessman_black_rook
+    move = next(
+        move for move in chess_board.legal_moves()
+        if move.field is chess_board.state[0][1]
+    )
+
+    chess_board.push(move)
+    assert not chessman_black_rook.status
+    assert isinstance(chessman_white_pawn.type, Rook)
+
+    chess_board.pop()
+    assert chessman_black_rook.status
+    assert chessman_black_rook.get_position() is chess_board.state[0][1]
+    assert isinstance(chessman_white_pawn.type, Pawn)
+    assert chessman_white_pawn.first_move
+    assert list(chess_board.get_figures(side=White, type=Pawn)) == [
+        chessman_white_pawn,
+    ]
+
+
+def test_perft(chess_board: ChessBoard):
+    """Test number of leaf nodes for small position."""
+    chess_board.state[7][0].chessman = Chessman(
+        chessman_type=Rook,
+        side=White,
+        chess_board=chess_board,
+    )
+    chess_board.state[1][0].chessman = Chessman(
+        chessman_type=Pawn,
+        side=Black,
+        chess_board=chess_board,
+    )
+
+    assert chess_board.perft(0) == 1
+    assert chess_board.perft(1) == 13
+    # pawn is blocked by rook on A6 and A7, can't move on two fields
+    # with rook on A5 and makes two moves otherwise
+    assert chess_board.perft(2) == 10 * 2 + 1
+    # perft restores the board
+    assert chess_board.perft(2) == 21
+    assert [str(move) for move in chess_board.legal_moves(Black)] == [
+        'A7-A6',
+        'A7-A5',
+    ]
@@ -0,0 +1,73 @@
+import pytest
+
+from chess.bitboard import BitboardChessBoard
+from chess.board import ChessBoard
+from chess.exceptions import PackedPositionException
+from chess.packed import POSITION, PositionReader, encode_into
+
+FENS = (
+    'r6r/pp6/8/8/4P3/8/P7/R6R b - - 0 1',
+    '8/8/8/8/8/8/8/8 w - - 0 1',
+    '1r6/P7/8/3p4/8/8/6PP/7R w - - 0 1',
+)
+
+
+@pytest.mark.parametrize('fen', FENS)
+def test_to_bytes_and_from_bytes(fen: str):
+    """Test position is the same after packing."""
+    chess_board = ChessBoard.from_fen(fen)
+
+    data = chess_board.to_bytes()
+    unpacked_board = ChessBoard.from_bytes(data)
+
+    assert len(data) == POSITION.size == 41
+    assert unpacked_board.to_fen() == fen
+    assert unpacked_board.zobrist_key == chess_board.zobrist_key
+
+
+def test_packed_pawn_state():
+    """Test pawn which moved is packed with its state."""
+    chess_board = ChessBoard.from_fen('8/8/8/8/8/8/P7/8 w - - 0 1')
+    chess_board.push(next(chess_board.legal_moves()))
+    chess_board.pop()
+    chess_board.state[6][0].chessman.first_move = False
+
+    unpacked_board = ChessBoard.from_bytes(chess_board.to_bytes())
+
+    assert not unpacked_board.state[6][0].chessman.first_move
+    assert unpacked_board.perft(1) == 1
+
+
+def test_position_reader():
+    """Test positions are decoded from shared buffer."""
+    buffer = bytearray(POSITION.size * len(FENS))
+    for index, fen in enumerate(FENS):
+        encode_into(ChessBoard.from_fen(fen), buffer, index * POSITION.size)
+
+    reader = PositionReader(buffer, board_class=BitboardChessBoard)
+
+    assert len(reader) == len(FENS)
+    assert [board.to_fen() for board in reader] == list(FENS)
+    assert reader[-1].to_fen() == FENS[-1]
+    assert isinstance(reader[0], BitboardChessBoard)
+    with pytest.raises(IndexError):
+        reader[len(FENS)]
+
+
+def test_unknown_figure_code():
+    """Test unknown figure code is a format error."""
+    data = bytearray(ChessBoard.from_fen(FENS[0]).to_bytes())
+    data[0] = 0x0f
+
+    with pytest.raises(
+        PackedPositionException,
+        match='Unknown figure code 15',
+    ):
+        ChessBoard.from_bytes(bytes(data))
+
+
+@pytest.mark.parametrize('data', [b'', b'abc', bytes(POSITION.size - 1)])
+def test_short_buffer(data: bytes):
+    """Test buffer shorter than a position is a format error."""
+    with pytest.raises(PackedPositionException):
+        ChessBoard.from_bytes(data)
@@ -0,0 +1,76 @@
+import pytest
+
+from chess.board import ChessBoard
+from chess.parallel import (
+    SLOT,
+    SharedTranspositionTable,
+    benchmark_scaling,
+    parallel_search,
+)
+from chess.type import Rook
+
+
+@pytest.fixture
+def table():
+    table = SharedTranspositionTable(size=64)
+    yield table
+    table.close()
+    table.unlink()
+
+
+def test_shared_table_store_and_lookup(table: SharedTranspositionTable):
+    """Test entries of search are packed into shared memory."""
+    value = (-250, 2, (8, 0, Rook), 5)
+
+    assert table.store(12345, 5, value)
+    assert table.lookup(12345) == value
+    assert table.lookup(12345, depth=6) is None
+    assert table.lookup(12345 + 64) is None
+
+    attached_table = SharedTranspositionTable(name=table.name)
+    assert attached_table.lookup(12345) == value
+    attached_table.close()
+
+
+def test_shared_table_replacement(table: SharedTranspositionTable):
+    """Test deeper entry of another position is kept."""
+    table.store(1, 5, (0, 0, None, 5))
+
+    assert not table.store(1 + 64, 2, (10, 0, None, 2))
+    assert table.store(1, 2, (10, 0, None, 2))
+    assert table.lookup(1) == (10, 0, None, 2)
+
+
+def test_shared_table_detects_torn_entry(table: SharedTranspositionTable):
+    """Test entry with data of another write is not returned."""
+    table.store(7, 3, (100, 0, None, 3))
+    stored_key, _ = SLOT.unpack_from(table.memory.buf, 7 * SLOT.size)
+    SLOT.pack_into(
+        table.memory.buf,
+        7 * SLOT.size,
+        stored_key,
+        SharedTranspositionTable._pack((200, 0, None, 4)),
+    )
+
+    assert table.lookup(7) is None
+
+
+def test_parallel_search():
+    """Test workers find capture of undefended rook."""
+    board = ChessBoard.from_fen('r7/8/8/8/8/8/8/R7 w - - 0 1')
+
+    result = parallel_search(board, workers=2, max_depth=3)
+
+    assert str(result.best_move) == 'A1-A8'
+    assert result.score == 500
+    assert result.depth == 3
+    assert board.to_fen() == 'r7/8/8/8/8/8/8/R7 w - - 0 1'
+
+
+def test_benchmark_scaling():
+    """Test scaling is measured for every number of workers."""
+    results = benchmark_scaling(workers=(1, 2), depth=2)
+
+    assert [result.workers for result in results] == [1, 2]
+    assert results[0].speedup == 1.0
+    assert all(result.nodes for result in results)
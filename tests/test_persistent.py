@@ -0,0 +1,115 @@
+import threading
+import tracemalloc
+
+import pytest
+
+from chess.board import ChessBoard
+from chess.exceptions import BadMoveException, CaptureException
+from chess.persistent import PersistentBoard
+from chess.type import Rook
+
+FENS = (
+    'r6r/pppppppp/8/8/8/8/PPPPPPPP/R6R w - - 0 1',
+    '1r6/P7/8/3p4/8/8/6PP/7R w - - 0 1',
+    'r6r/pp6/8/8/4P3/8/P7/R6R b - - 0 1',
+)
+
+
+@pytest.mark.parametrize('fen', FENS)
+def test_perft(fen: str):
+    """Test moves are the same as moves of ChessBoard."""
+    board = PersistentBoard.from_fen(fen)
+
+    assert board.to_fen() == fen
+    assert board.zobrist_key == ChessBoard.from_fen(fen).zobrist_key
+    assert board.perft(3) == ChessBoard.from_fen(fen).perft(3)
+
+
+def test_move_shares_rows():
+    """Test move keeps parent and shares its unchanged rows."""
+    board = PersistentBoard.from_fen(FENS[1])
+
+    child = board.move(8, 0, Rook)
+
+    assert board.to_fen() == FENS[1]
+    assert child.to_fen() == 'Rr6/8/8/3p4/8/8/6PP/7R b - - 0 1'
+    assert child.zobrist_key == ChessBoard.from_fen(child.to_fen()).zobrist_key
+    assert child.rows[0] is not board.rows[0]
+    assert child.rows[1] is not board.rows[1]
+    assert all(
+        child_row is row
+        for child_row, row in zip(child.rows[2:], board.rows[2:])
+    )
+    assert child[0] is PersistentBoard.from_fen(child.to_fen())[0]
+
+
+def test_wrong_moves():
+    """Test wrong moves raise and board is immutable."""
+    board = PersistentBoard.from_fen(FENS[1])
+
+    with pytest.raises(BadMoveException):
+        board.move(1, 2)
+    with pytest.raises(BadMoveException):
+        board.move(63, 7)
+    # promotion is required on the last row and refused elsewhere
+    with pytest.raises(BadMoveException):
+        board.move(54, 46, Rook)
+    with pytest.raises(BadMoveException):
+        board.move(8, 0)
+    with pytest.raises(CaptureException):
+        board.move(63, 55)
+    with pytest.raises(AttributeError):
+        board.turn = None
+
+
+def test_transpositions_are_equal():
+    """Test boards reached by different move orders are equal."""
+    board = PersistentBoard.from_fen(FENS[0])
+
+    first = board.move(48, 40).move(8, 16).move(49, 41)
+    second = board.move(49, 41).move(8, 16).move(48, 40)
+
+    assert first == second
+    assert len({first, second, board}) == 2
+
+
+def test_board_round_trip():
+    """Test board is the same after conversion from and to ChessBoard."""
+    chess_board = ChessBoard.from_fen(FENS[2])
+    chess_board.push(next(chess_board.legal_moves()))
+
+    board = PersistentBoard.from_board(chess_board).to_board()
+
+    assert board.to_fen() == chess_board.to_fen()
+    assert board.zobrist_key == chess_board.zobrist_key
+
+
+def test_memory_of_siblings():
+    """Test memory of child boards is proportional to differences."""
+    board = PersistentBoard.from_fen(FENS[0])
+    moves = list(board.legal_moves())
+
+    tracemalloc.start()
+    children = [board.move(*move) for move in moves for _ in range(10)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert size / len(children) < 1024
+    assert len(set(children)) == len(moves)
+
+
+def test_threads_share_board():
+    """Test threads search the same board without locking."""
+    board = PersistentBoard.from_fen(FENS[0])
+    results = []
+
+    def run():
+        results.append(board.perft(2))
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [ChessBoard.from_fen(FENS[0]).perft(2)] * 4
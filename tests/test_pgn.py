@@ -0,0 +1,107 @@
+import io
+
+import pytest
+
+from chess.board import ChessBoard
+from chess.exceptions import BadMoveException
+from chess.pgn import Game, ReplayStats, iter_games, replay, replay_games
+from chess.san import parse_san
+from chess.type import Rook
+
+FEN = 'r6r/pp6/8/8/8/8/PP6/R6R w - - 0 1'
+PGN = f'''[Event "First"]
+[FEN "{FEN}"]
+
+1. a4 {{comment}} b5 2. axb5 (2. a5 a6) Rab8 3. Rhd1 $1 Rxb5 1-0
+
+[Event "Second"]
+[FEN "{FEN}"]
+
+1. a4 a5 2. b4 axb4 3. Ra8 0-1
+[Event "Without FEN"]
+
+1. e4 *
+'''
+
+
+def test_parse_san():
+    """Test SAN is resolved into move of side to move."""
+    chess_board = ChessBoard.from_fen(FEN)
+
+    move = parse_san(chess_board, 'Rhe1')
+    assert (repr(move.chessman.get_position()), repr(move.field)) == (
+        'H1',
+        'E1',
+    )
+    assert repr(parse_san(chess_board, 'a4').field) == 'A4'
+
+    with pytest.raises(BadMoveException, match='ambiguous'):
+        parse_san(chess_board, 'Re1')
+    with pytest.raises(BadMoveException, match='not possible'):
+        parse_san(chess_board, 'a5')
+    with pytest.raises(BadMoveException, match='not supported'):
+        parse_san(chess_board, 'Nf3')
+
+
+def test_parse_san_with_promotion():
+    """Test SAN with pawn exchange."""
+    chess_board = ChessBoard.from_fen('1r6/P7/8/8/8/8/8/8 w - - 0 1')
+
+    move = parse_san(chess_board, 'axb8=R+')
+
+    assert move.promotion is Rook
+    for san in ('a8', 'axb8', 'Rb7=R', 'bxa8'):
+        with pytest.raises(BadMoveException, match='not possible'):
+            parse_san(chess_board, san)
+
+
+def test_iter_games():
+    """Test games are read from PGN with comments and variations."""
+    first, second, third = iter_games(io.StringIO(PGN))
+
+    assert first.headers == {'Event': 'First', 'FEN': FEN}
+    assert first.moves == ['a4', 'b5', 'axb5', 'Rab8', 'Rhd1', 'Rxb5']
+    assert first.result == '1-0'
+    assert second.moves[-1] == 'Ra8'
+    assert third == Game({'Event': 'Without FEN'}, ['e4'], '*')
+
+
+def test_replay():
+    """Test replay reports the first illegal move."""
+    first, second, third = iter_games(io.StringIO(PGN))
+
+    assert replay(first).is_valid
+    assert replay(first).plies == 6
+    assert replay(second, index=1).error == (
+        "Ply 5: Move 'Ra8' is not possible."
+    )
+    assert replay(second).plies == 4
+    assert not replay(third).is_valid
+    wrong_fen = Game({'FEN': FEN.replace('6', '\u00b2')}, ['a4'], '*')
+    assert replay(wrong_fen).error.startswith('Wrong row')
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_replay_games(ordered: bool):
+    """Test games are replayed by worker processes."""
+    games = list(iter_games(io.StringIO(PGN))) * 5
+    stats = ReplayStats(workers=2)
+
+    results = list(replay_games(
+        games,
+        workers=2,
+        chunk_size=2,
+        max_in_flight=2,
+        ordered=ordered,
+    ))
+    for result in results:
+        stats.add(result)
+
+    assert sorted(result.index for result in results) == list(range(15))
+    if ordered:
+        assert [result.index for result in results] == list(range(15))
+    assert [result.is_valid for result in sorted(results)] == [
+        True, False, False,
+    ] * 5
+    assert stats.games == 15
+    assert stats.invalid_games == 10
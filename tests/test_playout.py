@@ -0,0 +1,51 @@
+from chess.board import ChessBoard
+from chess.playout import PlayoutStats, playout, run_playouts
+
+FEN = 'r6r/pppppppp/8/8/8/8/PPPPPPPP/R6R w - - 0 1'
+
+
+def test_playout_is_reproducible(chess_board: ChessBoard):
+    """Test playout with the same seed makes the same moves."""
+    board = chess_board.from_fen(FEN)
+
+    result = playout(board, seed=1, index=3, max_plies=50)
+
+    assert board.to_fen() == FEN
+    assert result == playout(board, seed=1, index=3, max_plies=50)
+    assert result != playout(board, seed=1, index=4, max_plies=50)
+    assert result.plies == 50 and not result.is_terminal
+
+
+def test_terminal_playout():
+    """Test playout stops when side to move has no moves."""
+    board = ChessBoard.from_fen('8/8/8/8/8/p7/P7/8 w - - 0 1')
+
+    result = playout(board)
+
+    assert result.plies == 0
+    assert result.is_terminal
+    assert result.score == board.evaluate()
+
+
+def test_run_playouts_in_processes():
+    """Test playouts split between processes give the same statistics."""
+    board = ChessBoard.from_fen(FEN)
+
+    stats = run_playouts(board, 10, seed=7, max_plies=30)
+    parallel_stats = run_playouts(
+        board, 10, seed=7, max_plies=30, workers=2, chunk_size=3,
+    )
+
+    for name in ('playouts', 'plies', 'terminal', 'total_score'):
+        assert getattr(parallel_stats, name) == getattr(stats, name)
+    assert stats.playouts == 10
+    assert stats.plies_per_second > 0
+    assert 'playouts/s' in str(parallel_stats)
+    assert board.to_fen() == FEN
+
+
+def test_empty_stats():
+    """Test stats without playouts."""
+    stats = PlayoutStats()
+
+    assert stats.mean_score == stats.mean_plies == 0.0
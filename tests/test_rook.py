@@ -2,7 +2,7 @@ import pytest
 
 from chess.board import ChessBoard
 from chess.chessman import Chessman
-from chess.exceptions import CaptureException
+from chess.exceptions import BadMoveException, CaptureException
 
 
 def test_rook_move_by_rows_down(
@@ -90,3 +90,38 @@ def test_black_rook_capture_another_black_rook(
             chessman=chessman_black_rook,
             field=chessman_another_black_rook_field,
         )
+
+
+def test_rook_move_by_diagonal(
+    chess_board: ChessBoard,
+    chessman_black_rook: Chessman,
+):
+    """Test rook can't move by diagonal."""
+    chess_board.state[0][0].chessman = chessman_black_rook
+
+    with pytest.raises(BadMoveException):
+        chess_board.move_figure(chessman_black_rook, chess_board.state[3][3])
+
+
+def test_rook_move_to_the_same_field(
+    chess_board: ChessBoard,
+    chessman_black_rook: Chessman,
+):
+    """Test rook can't stay on the same field."""
+    chess_board.state[0][0].chessman = chessman_black_rook
+
+    with pytest.raises(BadMoveException):
+        chess_board.move_figure(chessman_black_rook, chess_board.state[0][0])
+
+
+def test_rook_move_through_figure(
+    chess_board: ChessBoard,
+    chessman_black_rook: Chessman,
+    chessman_another_black_rook: Chessman,
+):
+    """Test rook can't jump over a figure."""
+    chess_board.state[0][0].chessman = chessman_black_rook
+    chess_board.state[2][0].chessman = chessman_another_black_rook
+
+    with pytest.raises(BadMoveException):
+        chess_board.move_figure(chessman_black_rook, chess_board.state[5][0])
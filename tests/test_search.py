@@ -0,0 +1,73 @@
+import pytest
+
+from chess.bitboard import BitboardChessBoard
+from chess.board import ChessBoard
+from chess.search import Searcher, search
+
+FEN = 'r6r/pppppppp/8/8/8/8/PPPPPPPP/R6R w - - 0 1'
+
+
+@pytest.mark.parametrize('board_class', [ChessBoard, BitboardChessBoard])
+def test_search_captures_rook(board_class: type[ChessBoard]):
+    """Test search finds capture of undefended rook."""
+    board = board_class.from_fen('r7/8/8/8/8/8/8/R7 w - - 0 1')
+
+    result = search(board, max_depth=3)
+
+    assert str(result.best_move) == 'A1-A8'
+    assert result.score == 500
+    assert result.depth == 3
+
+
+def test_search_keeps_board():
+    """Test board is the same after search."""
+    board = ChessBoard.from_fen(FEN)
+    key = board.zobrist_key
+
+    result = search(board, max_depth=3)
+
+    assert board.to_fen() == FEN
+    assert board.zobrist_key == key
+    assert len(result.pv) == 3
+    assert result.best_move is result.pv[0]
+    assert [iteration.depth for iteration in result.iterations] == [1, 2, 3]
+    assert result.nps > 0
+
+
+def test_search_node_limit():
+    """Test search stops by nodes budget and keeps finished iteration."""
+    board = ChessBoard.from_fen(FEN)
+
+    result = search(board, node_limit=500)
+
+    assert result.nodes <= 501
+    assert 1 <= result.depth < 64
+    assert board.to_fen() == FEN
+
+
+def test_search_time_limit():
+    """Test search stops by time budget."""
+    result = search(ChessBoard.from_fen(FEN), time_limit=0.2)
+
+    assert result.elapsed < 1
+    assert result.best_move is not None
+
+
+def test_search_without_moves():
+    """Test search of position without moves."""
+    result = search(ChessBoard.from_fen('8/8/8/8/8/8/8/7r w - - 0 1'))
+
+    assert result.best_move is None
+    assert result.score == -500
+
+
+def test_searcher_reuses_tables():
+    """Test the second search uses transposition table."""
+    board = ChessBoard.from_fen(FEN)
+    searcher = Searcher()
+    first = searcher.search(board, max_depth=3)
+
+    second = searcher.search(board, max_depth=3)
+
+    assert second.nodes < first.nodes
+    assert second.score == first.score
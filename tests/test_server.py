@@ -0,0 +1,169 @@
+import asyncio
+import json
+
+from chess.server import Connection, SessionServer
+
+FEN = '8/P7/8/8/8/8/P7/r7 w - - 0 1'
+
+
+class Client:
+    """Client of server for tests."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, server: SessionServer) -> 'Client':
+        port = server._server.sockets[0].getsockname()[1]
+        return cls(*await asyncio.open_connection('127.0.0.1', port))
+
+    async def request(self, **request) -> dict:
+        self.writer.write(json.dumps(request).encode() + b'\n')
+        await self.writer.drain()
+        return await self.receive()
+
+    async def receive(self) -> dict:
+        return json.loads(await asyncio.wait_for(self.reader.readline(), 5))
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def _run(test):
+    async def run():
+        server = SessionServer(queue_size=4)
+        await server.start()
+        try:
+            await test(server)
+        finally:
+            await server.close()
+    asyncio.run(run())
+
+
+def test_session_moves():
+    """Test moves are validated and announced to subscribers."""
+    async def test(server):
+        player = await Client.connect(server)
+        subscriber = await Client.connect(server)
+
+        created = await player.request(id=1, op='new', fen=FEN)
+        session = created['session']
+        assert created == {'id': 1, 'ok': True, 'session': session, 'fen': FEN}
+        assert (await subscriber.request(op='subscribe', session=session))[
+            'ok'
+        ]
+
+        # promotion is required on the last row and refused elsewhere
+        for move in (
+            {'from': 'A2', 'to': 'A3', 'promotion': 'R'},
+            {'from': 'A7', 'to': 'A8'},
+        ):
+            response = await player.request(op='move', session=session, **move)
+            assert not response['ok'] and response['error']
+        assert (await player.request(op='get', session=session))['fen'] == FEN
+
+        assert await player.request(
+            op='move', session=session, **{'from': 'A7', 'to': 'A8'},
+            promotion='R',
+        ) == {'id': None, 'ok': True, 'ply': 1}
+        assert await subscriber.receive() == {
+            'event': 'move',
+            'session': session,
+            'ply': 1,
+            'turn': 'b',
+            'changes': {'A7': None, 'A8': 'R'},
+        }
+
+        wrong_moves = (
+            {'from': 'A8', 'to': 'A7'},
+            {'from': 'A1', 'to': 'B2'},
+            {'from': 'A1', 'to': 'Z9'},
+            {'from': 1, 'to': 'A2'},
+            {'from': 'A1', 'to': 'A2', 'promotion': ['R']},
+            {'from': 'A1', 'to': 'A2', 'promotion': 'X'},
+        )
+        for move in wrong_moves:
+            response = await player.request(op='move', session=session, **move)
+            assert not response['ok'] and response['error']
+
+        response = await player.request(op='get', session=session)
+        assert response['fen'] == 'R7/8/8/8/8/8/P7/r7 b - - 0 1'
+        assert response['ply'] == 1
+        await player.close()
+        await subscriber.close()
+    _run(test)
+
+
+def test_session_moves_are_serialized():
+    """Test concurrent moves of one session are applied one by one."""
+    async def test(server):
+        session = (await server.handle_request(json.dumps(
+            {'op': 'new', 'fen': FEN},
+        ).encode()))['session']
+        requests = [
+            {'op': 'move', 'session': session, 'from': 'A2', 'to': 'A3'},
+            {'op': 'move', 'session': session, 'from': 'A1', 'to': 'B1'},
+            {'op': 'move', 'session': session, 'from': 'A2', 'to': 'A3'},
+        ]
+
+        responses = await asyncio.gather(*(
+            server.handle_request(json.dumps(request).encode())
+            for request in requests
+        ))
+
+        assert [response['ok'] for response in responses] == [
+            True, True, False,
+        ]
+        assert [response.get('ply') for response in responses] == [
+            1, 2, None,
+        ]
+    _run(test)
+
+
+def test_slow_subscriber_is_disconnected():
+    """Test subscriber is dropped when its queue is full."""
+    async def test(server):
+        player = await Client.connect(server)
+        session = (await player.request(op='new'))['session']
+        subscriber = Connection(_StalledWriter(), queue_size=2)
+        server.sessions[session].subscribers.add(subscriber)
+
+        for ply, move in enumerate(('A2A3', 'A7A6', 'B2B3', 'B7B6'), 1):
+            response = await player.request(
+                op='move', session=session, **{'from': move[:2]},
+                to=move[2:],
+            )
+            assert response['ply'] == ply
+
+        assert subscriber.is_closed and subscriber.writer.is_closed
+        assert subscriber not in server.sessions[session].subscribers
+        await player.close()
+    _run(test)
+
+
+class _StalledWriter:
+    """Writer of client which doesn't read anything."""
+    is_closed = False
+
+    def close(self):
+        self.is_closed = True
+
+
+def test_stats():
+    """Test latency percentiles and errors of requests."""
+    async def test(server):
+        for line in (b'{"op": "new"}', b'[]', b'{"op": "nope"}', b'{'):
+            await server.handle_request(line)
+        response = await server.handle_request(b'{"op": "new", "fen": 123}')
+        assert response['ok'] is False
+        assert 'fen' in response['error']
+
+        stats = (await server.handle_request(b'{"op": "stats"}'))
+
+        assert stats['sessions'] == 1
+        assert stats['latency']['new']['count'] == 2
+        assert stats['latency']['unknown']['count'] == 3
+        assert set(stats['latency']['new']) == {'count', 'p50', 'p90', 'p99'}
+    _run(test)
@@ -0,0 +1,22 @@
+from chess.tables import BETWEEN_MASKS, BETWEEN_SQUARES, ROOK_MASKS
+
+
+def test_between_squares():
+    """Test squares between two squares on one line."""
+    assert BETWEEN_SQUARES[0 * 64 + 3] == (1, 2)
+    assert BETWEEN_SQUARES[24 * 64 + 0] == (16, 8)
+    assert BETWEEN_SQUARES[0 * 64 + 27] == (9, 18)
+    assert BETWEEN_SQUARES[0 * 64 + 1] == ()
+    assert BETWEEN_MASKS[0 * 64 + 24] == 1 << 8 | 1 << 16
+
+
+def test_between_squares_not_on_one_line():
+    """Test there are no squares between squares out of line."""
+    assert BETWEEN_SQUARES[0 * 64 + 17] == ()
+    assert BETWEEN_MASKS[0 * 64 + 17] == 0
+
+
+def test_rook_masks():
+    """Test rook reaches 14 fields from any field of empty board."""
+    assert all(bin(mask).count('1') == 14 for mask in ROOK_MASKS)
+    assert not ROOK_MASKS[0] & 1
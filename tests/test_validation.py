@@ -0,0 +1,201 @@
+import pytest
+
+from chess import validation
+from chess.board import ChessBoard
+from chess.chessman import Chessman
+from chess.exceptions import CaptureException
+from chess.move import Move, MoveResult
+from chess.type import Pawn, Rook
+
+
+def test_validation_has_no_side_effects(
+    chess_board: ChessBoard,
+    chessman_white_pawn: Chessman,
+):
+    """Test pawn keeps its first move after validation."""
+    chess_board.state[6][0].chessman = chessman_white_pawn
+    key = chess_board.zobrist_key
+
+    assert chess_board.is_valid_move(
+        chessman_white_pawn,
+        chess_board.state[5][0],
+    )
+    assert chess_board.is_valid_move(
+        chessman_white_pawn,
+        chess_board.state[4][0],
+    )
+    assert chessman_white_pawn.first_move
+    assert chess_board.zobrist_key == key
+
+
+def test_failed_capture_keeps_pawn_state(
+    chess_board: ChessBoard,
+    chessman_black_pawn: Chessman,
+    chessman_another_black_pawn: Chessman,
+):
+    """Test pawn can still make first move after failed capture."""
+    chess_board.state[0][0].chessman = chessman_black_pawn
+    chess_board.state[1][1].chessman = chessman_another_black_pawn
+
+    with pytest.raises(CaptureException):
+        chess_board.move_figure(chessman_black_pawn, chess_board.state[1][1])
+
+    assert chessman_black_pawn.get_position() is chess_board.state[0][0]
+    chess_board.move_figure(chessman_black_pawn, chess_board.state[2][0])
+
+
+def test_validate_moves(
+    chess_board: ChessBoard,
+    chessman_black_rook: Chessman,
+    chessman_another_black_rook: Chessman,
+):
+    """Test bulk validation of candidate moves."""
+    chess_board.state[0][0].chessman = chessman_black_rook
+    chess_board.state[0][3].chessman = chessman_another_black_rook
+
+    assert chess_board.validate_moves([
+        Move(chessman_black_rook, chess_board.state[0][2]),
+        Move(chessman_black_rook, chess_board.state[0][3]),
+        Move(chessman_black_rook, chess_board.state[0][4]),
+        Move(chessman_black_rook, chess_board.state[7][0]),
+        Move(chessman_black_rook, chess_board.state[1][1]),
+    ]) == [True, False, False, True, False]
+
+
+def test_validation_is_memoised(
+    chess_board: ChessBoard,
+    chessman_black_rook: Chessman,
+):
+    """Test the same local configuration is validated once."""
+    chess_board.state[0][0].chessman = chessman_black_rook
+    validation.is_valid_move.cache_clear()
+
+    for _ in range(3):
+        chess_board.is_valid_move(chessman_black_rook, chess_board.state[5][0])
+
+    cache_info = validation.is_valid_move.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (2, 1)
+
+
+def test_try_move_result_codes(
+    chess_board: ChessBoard,
+    chessman_black_pawn: Chessman,
+    chessman_another_black_pawn: Chessman,
+    chessman_white_pawn: Chessman,
+):
+    """Test rejected moves return result code and don't change board."""
+    chess_board.state[0][0].chessman = chessman_black_pawn
+    chess_board.state[1][1].chessman = chessman_another_black_pawn
+    chess_board.state[5][5].chessman = chessman_white_pawn
+    chessman_white_pawn.capture()
+
+    assert chess_board.try_move(
+        chessman_black_pawn,
+        chess_board.state[0][1],
+    ) is MoveResult.BAD_MOVE
+    assert chess_board.try_move(
+        chessman_black_pawn,
+        chess_board.state[1][1],
+    ) is MoveResult.SAME_SIDE_CAPTURE
+    assert chess_board.try_move(
+        chessman_white_pawn,
+        chess_board.state[4][5],
+    ) is MoveResult.CAPTURED_PIECE
+    assert chessman_black_pawn.get_position() is chess_board.state[0][0]
+
+    assert chess_board.try_move(
+        chessman_black_pawn,
+        chess_board.state[1][0],
+    ) is MoveResult.OK
+    assert chessman_black_pawn.get_position() is chess_board.state[1][0]
+
+
+def test_apply_moves(
+    chess_board: ChessBoard,
+    chessman_black_rook: Chessman,
+):
+    """Test batch of moves with and without stop on error."""
+    chess_board.state[0][0].chessman = chessman_black_rook
+    moves = [
+        Move(chessman_black_rook, chess_board.state[0][5]),
+        Move(chessman_black_rook, chess_board.state[3][3]),
+        Move(chessman_black_rook, chess_board.state[7][5]),
+    ]
+
+    assert chess_board.apply_moves(moves, stop_on_error=True) == [
+        MoveResult.OK,
+        MoveResult.BAD_MOVE,
+    ]
+    assert chessman_black_rook.get_position() is chess_board.state[0][5]
+
+    assert chess_board.apply_moves(moves[1:]) == [
+        MoveResult.BAD_MOVE,
+        MoveResult.OK,
+    ]
+    assert chessman_black_rook.get_position() is chess_board.state[7][5]
+
+
+def test_apply_moves_with_exchange(
+    chess_board: ChessBoard,
+    chessman_white_pawn: Chessman,
+):
+    """Test pawn is exchanged by move with promotion."""
+    chess_board.state[1][0].chessman = chessman_white_pawn
+
+    assert chess_board.apply_moves([
+        Move(chessman_white_pawn, chess_board.state[0][0], Pawn),
+        Move(chessman_white_pawn, chess_board.state[0][0], Rook),
+    ]) == [MoveResult.BAD_MOVE, MoveResult.OK]
+    assert isinstance(chessman_white_pawn.type, Rook)
+
+
+def test_promotion_only_on_the_last_row(
+    chess_board: ChessBoard,
+    chessman_white_pawn: Chessman,
+):
+    """Test pawn is exchanged only and always on the last row."""
+    chess_board.state[6][0].chessman = chessman_white_pawn
+
+    assert not chess_board.is_valid_move(
+        chessman_white_pawn,
+        chess_board.state[5][0],
+        Rook,
+    )
+    assert chess_board.try_move(
+        chessman_white_pawn,
+        chess_board.state[5][0],
+        Rook,
+    ) is MoveResult.BAD_MOVE
+    assert isinstance(chessman_white_pawn.type, Pawn)
+
+    chess_board.state[1][0].chessman = chessman_white_pawn
+    assert not chess_board.is_valid_move(
+        chessman_white_pawn,
+        chess_board.state[0][0],
+    )
+    assert chess_board.try_move(
+        chessman_white_pawn,
+        chess_board.state[0][0],
+    ) is MoveResult.BAD_MOVE
+    assert chessman_white_pawn.get_position() is chess_board.state[1][0]
+
+
+def test_apply_moves_pairs(
+    chess_board: ChessBoard,
+    chessman_black_rook: Chessman,
+):
+    """Test moves without promotion and malformed moves are accepted."""
+    chess_board.state[0][0].chessman = chessman_black_rook
+
+    assert chess_board.apply_moves([
+        (chessman_black_rook, chess_board.state[0][5]),
+        (chessman_black_rook,),
+        None,
+        (chessman_black_rook, chess_board.state[7][5], None, None),
+    ]) == [
+        MoveResult.OK,
+        MoveResult.BAD_MOVE,
+        MoveResult.BAD_MOVE,
+        MoveResult.BAD_MOVE,
+    ]
+    assert chessman_black_rook.get_position() is chess_board.state[0][5]
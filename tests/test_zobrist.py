@@ -0,0 +1,115 @@
+from chess.board import ChessBoard
+from chess.chessman import Chessman
+from chess.side import Black, White
+from chess.transposition import ReplacementPolicy, TranspositionTable
+from chess.type import Pawn, Rook
+from chess.zobrist import TURN_KEY
+
+
+def _set_up_rooks(chess_board: ChessBoard) -> tuple[Chessman, Chessman]:
+    white_rook = Chessman(
+        chessman_type=Rook,
+        side=White,
+        chess_board=chess_board,
+    )
+    black_rook = Chessman(
+        chessman_type=Rook,
+        side=Black,
+        chess_board=chess_board,
+    )
+    chess_board.state[7][0].chessman = white_rook
+    chess_board.state[0][7].chessman = black_rook
+    return white_rook, black_rook
+
+
+def test_zobrist_key_is_restored_by_pop(chess_board: ChessBoard):
+    """Test key after push and pop is the same."""
+    _set_up_rooks(chess_board)
+    chess_board.state[6][3].chessman = Chessman(
+        chessman_type=Pawn,
+        side=White,
+        chess_board=chess_board,
+    )
+    key = chess_board.zobrist_key
+
+    for move in list(chess_board.legal_moves()):
+        chess_board.push(move)
+        assert chess_board.zobrist_key != key
+        chess_board.pop()
+        assert chess_board.zobrist_key == key
+
+
+def test_zobrist_key_of_transposition(chess_board: ChessBoard):
+    """Test the same position gets the same key by different moves."""
+    white_rook, black_rook = _set_up_rooks(chess_board)
+    key = chess_board.zobrist_key
+
+    chess_board.move_figure(white_rook, chess_board.state[7][3])
+    chess_board.move_figure(white_rook, chess_board.state[4][3])
+    first_key = chess_board.zobrist_key
+    chess_board.move_figure(white_rook, chess_board.state[7][3])
+    chess_board.move_figure(white_rook, chess_board.state[7][0])
+    assert chess_board.zobrist_key == key
+
+    chess_board.move_figure(white_rook, chess_board.state[4][0])
+    chess_board.move_figure(white_rook, chess_board.state[4][3])
+    assert chess_board.zobrist_key == first_key
+
+
+def test_zobrist_key_depends_on_turn_and_pawn_state(chess_board: ChessBoard):
+    """Test key changes with side to move and first move of pawn."""
+    pawn = Chessman(chessman_type=Pawn, side=White, chess_board=chess_board)
+    chess_board.state[5][0].chessman = pawn
+    key = chess_board.zobrist_key
+
+    chess_board.move_figure(pawn, chess_board.state[4][0])
+    chess_board.state[5][0].chessman = pawn
+    moved_pawn_key = chess_board.zobrist_key
+    assert moved_pawn_key not in (key, 0)
+
+    chess_board.pass_turn()
+    assert chess_board.zobrist_key == moved_pawn_key ^ TURN_KEY
+    chess_board.set_turn(Black)
+    assert chess_board.zobrist_key == moved_pawn_key ^ TURN_KEY
+    chess_board.set_turn(White)
+    assert chess_board.zobrist_key == moved_pawn_key
+
+
+def test_transposition_table_store_and_lookup():
+    """Test saved value is found for searched depth."""
+    table = TranspositionTable(memory=1024)
+
+    assert table.store(key=42, depth=3, value='value')
+    assert table.lookup(42) == 'value'
+    assert table.lookup(42, depth=3) == 'value'
+    assert table.lookup(42, depth=4) is None
+    assert table.lookup(42 + table.size) is None
+    assert len(table) == 1
+
+
+def test_transposition_table_size():
+    """Test number of slots depends on memory budget."""
+    table = TranspositionTable(memory=TranspositionTable.ENTRY_SIZE * 100)
+
+    assert table.size == 64
+
+
+def test_transposition_table_depth_policy():
+    """Test deeper entry isn't replaced by entry of another position."""
+    table = TranspositionTable(memory=1024, policy=ReplacementPolicy.DEPTH)
+    table.store(key=1, depth=5, value='deep')
+
+    assert not table.store(key=1 + table.size, depth=2, value='shallow')
+    assert table.lookup(1) == 'deep'
+    assert table.store(key=1, depth=2, value='same position')
+    assert table.lookup(1) == 'same position'
+
+
+def test_transposition_table_always_policy():
+    """Test new entry always replaces the old one."""
+    table = TranspositionTable(memory=1024, policy=ReplacementPolicy.ALWAYS)
+    table.store(key=1, depth=5, value='deep')
+
+    assert table.store(key=1 + table.size, depth=2, value='shallow')
+    assert table.lookup(1) is None
+    assert table.lookup(1 + table.size) == 'shallow'